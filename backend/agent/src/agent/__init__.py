@@ -2,10 +2,18 @@
 
 __version__ = "0.1.0"
 
-from .booking_agent import create_booking_agent, get_agent, reset_agent
+from .booking_agent import (
+    create_booking_agent,
+    get_agent,
+    get_session_agent,
+    release_session_agent,
+    reset_agent,
+)
 
 __all__ = [
     "create_booking_agent",
     "get_agent",
+    "get_session_agent",
+    "release_session_agent",
     "reset_agent",
 ]
@@ -1,6 +1,9 @@
 """Quesada Apartment Booking Agent using Strands framework."""
 
 import os
+import time
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,9 +16,15 @@ from shared.tools import ALL_TOOLS
 # Default to Opus for production, can be overridden via env var for testing
 DEFAULT_MODEL_ID = "eu.anthropic.claude-opus-4-5-20251101-v1:0"
 
+# Session-bound agents are reused across turns of the same conversation and
+# dropped after sitting idle
+SESSION_AGENT_IDLE_SECONDS = 15 * 60
+SESSION_AGENT_MAX_ENTRIES = 512
 
+
+@lru_cache(maxsize=1)
 def _load_system_prompt() -> str:
-    """Load system prompt from markdown file."""
+    """Load system prompt from markdown file (read once per process)."""
     prompt_path = Path(__file__).parent / "prompts" / "system_prompt.md"
     return prompt_path.read_text()
 
@@ -90,7 +99,52 @@ def get_agent(tools: list[Any] | None = None) -> Agent:
     return _agent_instance
 
 
+# session_id -> (idle expiry on the monotonic clock, agent), least recently used first.
+# Holds only idle agents: an agent is taken out while it serves a turn.
+_session_agents: dict[str, tuple[float, Agent]] = {}
+
+
+def get_session_agent(session_id: str, factory: Callable[[], Agent]) -> Agent:
+    """Take the cached agent for a session, creating it with factory on a miss.
+
+    The agent is removed from the cache until release_session_agent() hands
+    it back, so overlapping requests for one session never share an agent.
+    An agent whose turn is cancelled or fails is simply never released.
+
+    Args:
+        session_id: Conversation session identifier
+        factory: Builds a new session-bound agent when none is cached
+
+    Returns:
+        The booking agent bound to this session
+    """
+    now = time.monotonic()
+    # Entries are kept in last-use order, so expired ones sit at the front
+    while _session_agents:
+        oldest = next(iter(_session_agents))
+        if _session_agents[oldest][0] > now:
+            break
+        del _session_agents[oldest]
+
+    entry = _session_agents.pop(session_id, None)
+    return entry[1] if entry is not None else factory()
+
+
+def release_session_agent(session_id: str, agent: Agent) -> None:
+    """Return an agent to the cache after it completed a turn.
+
+    Args:
+        session_id: Conversation session identifier
+        agent: Agent previously taken with get_session_agent()
+    """
+    _session_agents.pop(session_id, None)
+    if len(_session_agents) >= SESSION_AGENT_MAX_ENTRIES:
+        del _session_agents[next(iter(_session_agents))]
+    _session_agents[session_id] = (time.monotonic() + SESSION_AGENT_IDLE_SECONDS, agent)
+
+
 def reset_agent() -> None:
-    """Reset the agent instance (useful for testing)."""
+    """Reset the agent instance and cached session agents (useful for testing)."""
     global _agent_instance
     _agent_instance = None
+    _session_agents.clear()
@@ -13,19 +13,20 @@ Session Management:
 
 Authentication (Spec 005 - AgentCore Identity OAuth2):
 - Reservation tools use @requires_access_token decorator
-- When user consent is needed, decorator puts auth URL in shared queue
+- When user consent is needed, decorator passes the auth URL to the event queue
 - Entrypoint yields auth URL events to frontend for OAuth2 redirect
 - After login, frontend callback completes token binding
 - Decorator polling succeeds and tool executes with injected access_token
 """
 
 import asyncio
-import contextlib
 import logging
 import os
+import secrets
 import sys
 import uuid
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
 
 # Configure logging FIRST - before any application imports
@@ -42,11 +43,17 @@ logger.info("[AGENT_APP] Logging configured successfully")
 
 # Application imports - after logging is configured
 # These imports trigger module-level logging in reservations.py
+import boto3  # noqa: E402
 from bedrock_agentcore.runtime import BedrockAgentCoreApp  # noqa: E402
+from botocore.config import Config  # noqa: E402
 from strands.session.s3_session_manager import S3SessionManager  # noqa: E402
 
-from agent import create_booking_agent  # noqa: E402
-from shared.tools import set_auth_url_queue  # noqa: E402
+from agent import (  # noqa: E402
+    create_booking_agent,
+    get_session_agent,
+    release_session_agent,
+)
+from shared.tools import set_auth_url_handler  # noqa: E402
 
 # Initialize AgentCore app
 app = BedrockAgentCoreApp()
@@ -55,10 +62,26 @@ app = BedrockAgentCoreApp()
 SESSION_BUCKET = os.environ.get("SESSION_BUCKET", "")
 SESSION_PREFIX = os.environ.get("SESSION_PREFIX", "agent-sessions/")
 
+# Shared by every session manager's S3 client
+_S3_CLIENT_CONFIG = Config(max_pool_connections=50)
+
+# Put on the event queue (compared by identity) once the agent stream ends
+_STREAM_DONE: dict[str, Any] = {"type": "_stream_done"}
+
+
+@lru_cache(maxsize=1)
+def _get_boto_session() -> boto3.Session:
+    """Get the boto3 session shared by S3 session managers."""
+    return boto3.Session()
+
 
 def _create_session_agent(session_id: str) -> Any:
     """Create an agent with session management for conversation persistence.
 
+    Agents are cached per session_id (see get_session_agent), so follow-up
+    turns reuse the agent and its restored history instead of rebuilding
+    them from S3. The caller releases the agent once its turn completes.
+
     Args:
         session_id: Unique identifier for the conversation session.
                    Conversations with the same session_id share history.
@@ -69,13 +92,20 @@ def _create_session_agent(session_id: str) -> Any:
     """
     if SESSION_BUCKET:
         # Production: Use S3 for session persistence
-        logger.info(f"Creating agent with S3 session: bucket={SESSION_BUCKET}, session={session_id}")
-        session_manager = S3SessionManager(
-            session_id=session_id,
-            bucket=SESSION_BUCKET,
-            prefix=SESSION_PREFIX,
-        )
-        return create_booking_agent(session_manager=session_manager)
+        def factory() -> Any:
+            logger.info(
+                f"Creating agent with S3 session: bucket={SESSION_BUCKET}, session={session_id}"
+            )
+            session_manager = S3SessionManager(
+                session_id=session_id,
+                bucket=SESSION_BUCKET,
+                prefix=SESSION_PREFIX,
+                boto_session=_get_boto_session(),
+                boto_client_config=_S3_CLIENT_CONFIG,
+            )
+            return create_booking_agent(session_manager=session_manager)
+
+        return get_session_agent(session_id, factory)
     else:
         # Development/fallback: No session persistence
         logger.warning("SESSION_BUCKET not set - agent will not persist conversation history")
@@ -104,8 +134,8 @@ async def invoke(payload: dict[str, Any]) -> AsyncGenerator[dict[str, Any]]:
     """
     prompt = payload.get("prompt", "")
     session_id = payload.get("session_id", str(uuid.uuid4()))
-    message_id = f"msg_{uuid.uuid4().hex[:16]}"
-    text_part_id = f"text_{uuid.uuid4().hex[:16]}"
+    message_id = f"msg_{secrets.token_hex(8)}"
+    text_part_id = f"text_{secrets.token_hex(8)}"
 
     logger.info(f"Agent invocation: session_id={session_id}, prompt_length={len(prompt)}")
 
@@ -126,17 +156,15 @@ async def invoke(payload: dict[str, Any]) -> AsyncGenerator[dict[str, Any]]:
     yield {"type": "start", "messageId": message_id}
     yield {"type": "text-start", "id": text_part_id}
 
-    # Create auth URL queue for OAuth2 login flow
-    # The @requires_access_token decorator puts auth URLs here when consent is needed
-    auth_url_queue: asyncio.Queue[str] = asyncio.Queue()
-
-    # Event queue to merge stream events and auth URLs
+    # Event queue merging stream events and auth_required events
     # This allows us to yield auth URLs while the decorator is polling for tokens
     event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
 
     try:
-        # Register the queue so @requires_access_token callbacks can use it
-        set_auth_url_queue(auth_url_queue)
+        # Let @requires_access_token callbacks put auth_required events on the queue
+        set_auth_url_handler(
+            lambda url: event_queue.put_nowait({"type": "auth_required", "authorization_url": url})
+        )
 
         # Create a session-bound agent
         agent = _create_session_agent(session_id)
@@ -151,6 +179,10 @@ async def invoke(payload: dict[str, Any]) -> AsyncGenerator[dict[str, Any]]:
                             "id": text_part_id,
                             "delta": event["data"],
                         })
+                if SESSION_BUCKET:
+                    # Only an agent that finished its turn cleanly is reused;
+                    # a failed or cancelled one is left to be garbage collected
+                    release_session_agent(session_id, agent)
             except Exception as e:
                 logger.error(f"Stream error: {e}")
                 await event_queue.put({
@@ -160,51 +192,15 @@ async def invoke(payload: dict[str, Any]) -> AsyncGenerator[dict[str, Any]]:
                 })
             finally:
                 # Signal stream completion
-                await event_queue.put({"type": "_stream_done"})
-
-        async def monitor_auth_urls() -> None:
-            """Monitor auth URL queue and forward to event queue.
-
-            This runs concurrently with stream_events, so auth URLs are
-            yielded immediately when the decorator puts them in the queue,
-            even if the decorator is blocking while polling for tokens.
-            """
-            while True:
-                try:
-                    # Wait for auth URL with timeout to allow checking for completion
-                    auth_url = await asyncio.wait_for(auth_url_queue.get(), timeout=0.1)
-                    logger.info("Auth URL monitor: forwarding auth_required event")
-                    await event_queue.put({"type": "auth_required", "authorization_url": auth_url})
-                except TimeoutError:
-                    # Check if we should stop (stream task done check happens in main loop)
-                    pass
-                except asyncio.CancelledError:
-                    break
-
-        # Start both tasks concurrently
-        stream_task = asyncio.create_task(stream_events())
-        auth_monitor_task = asyncio.create_task(monitor_auth_urls())
-
-        try:
+                await event_queue.put(_STREAM_DONE)
+
+        # The task group cancels the stream if the client disconnects mid-response
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(stream_events())
+
             # Yield events from merged queue until stream completes
-            while True:
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-
-                    if event.get("type") == "_stream_done":
-                        # Stream finished, exit loop
-                        break
-
-                    yield event
-                except TimeoutError:
-                    # Check if stream task is done (shouldn't happen without _stream_done)
-                    if stream_task.done():
-                        break
-        finally:
-            # Clean up tasks
-            auth_monitor_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await auth_monitor_task
+            while (event := await event_queue.get()) is not _STREAM_DONE:
+                yield event
 
     except Exception as e:
         logger.error(f"Invoke error: {e}")
@@ -214,8 +210,8 @@ async def invoke(payload: dict[str, Any]) -> AsyncGenerator[dict[str, Any]]:
             "delta": f"\n\nError: {str(e)}",
         }
     finally:
-        # Clean up queue reference to prevent stale references
-        set_auth_url_queue(None)
+        # Clean up handler reference to prevent stale references
+        set_auth_url_handler(None)
 
     # Emit end events
     yield {"type": "text-end", "id": text_part_id}
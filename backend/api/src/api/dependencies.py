@@ -14,25 +14,38 @@ Usage in routes:
         ...
 
 Service Dependency Graph:
-    DynamoDBService (singleton via get_dynamodb_service)
+    DynamoDBService (singleton via get_dynamodb_service, exposed as get_db)
         ├── PricingService
         │       └── AvailabilityService
         │               └── BookingService
         └── PaymentService
 
 Testing:
-    Use reset_services() to clear cached instances between tests.
+    Use reset_services() to clear cached instances between tests, or
+    app.dependency_overrides to swap a provider for a mock.
 """
 
 from functools import lru_cache
 
 from shared.services.availability import AvailabilityService
 from shared.services.booking import BookingService
-from shared.services.dynamodb import get_dynamodb_service
+from shared.services.dynamodb import DynamoDBService, get_dynamodb_service
 from shared.services.payment_service import PaymentService
 from shared.services.pricing import PricingService
 
 
+def get_db() -> DynamoDBService:
+    """Get the DynamoDB singleton for routes that query tables directly.
+
+    Not cached here: get_dynamodb_service() already holds the instance, and
+    its environment argument must not become a request parameter.
+
+    Returns:
+        Shared DynamoDBService instance.
+    """
+    return get_dynamodb_service()
+
+
 @lru_cache
 def get_pricing_service() -> PricingService:
     """Get cached PricingService instance.
@@ -7,6 +7,8 @@ Provides REST endpoints for:
 Area data is loaded from static JSON at startup.
 """
 
+import heapq
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
@@ -20,8 +22,11 @@ from shared.models.area_info import (
     RecommendationResponse,
 )
 from shared.services.area_data import (
+    VALID_CATEGORIES,
     ensure_area_data_loaded,
-    get_area_data_store,
+    get_places_by_distance,
+    iter_scored_places,
+    parse_category,
 )
 
 router = APIRouter(tags=["area"])
@@ -117,29 +122,19 @@ async def get_area_info(
     Supports category filtering.
     """
     ensure_area_data_loaded()
-    data = get_area_data_store()
 
     # Validate and convert category
     category_enum: AreaCategory | None = None
     if category:
-        category_lower = category.lower().strip()
-        try:
-            category_enum = AreaCategory(category_lower)
-        except ValueError:
-            valid_categories = [c.value for c in AreaCategory]
+        category_enum = parse_category(category)
+        if category_enum is None:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
-                detail=f"Unknown category '{category}'. Valid categories are: {', '.join(valid_categories)}",
+                detail=f"Unknown category '{category}'. Valid categories are: {VALID_CATEGORIES}",
             )
 
-    # Filter by category if specified
-    if category_enum:
-        filtered = [place for place in data if place.category == category_enum]
-    else:
-        filtered = list(data)
-
-    # Sort by distance (closest first)
-    filtered.sort(key=lambda p: p.distance_km)
+    # Places in the category (or all places), already sorted closest first
+    filtered = get_places_by_distance(category_enum)
 
     return AreaInfoResponse(
         places=filtered,
@@ -256,49 +251,18 @@ async def get_recommendations(
     Supports interest matching and various filters.
     """
     ensure_area_data_loaded()
-    data = get_area_data_store()
 
     # Parse comma-separated interests
     interest_list: list[str] = []
     if interests:
         interest_list = [i.strip().lower() for i in interests.split(",") if i.strip()]
 
-    # Score and filter places
-    scored_places: list[tuple[AreaInfo, int]] = []
-
-    for place in data:
-        # Apply family-friendly filter
-        if family_friendly_only and not place.family_friendly:
-            continue
-
-        # Apply distance filter
-        if max_distance_km is not None and place.distance_km > max_distance_km:
-            continue
-
-        # Calculate relevance score based on interest matching
-        score = 0
-        if interest_list:
-            # Check tags (case-insensitive)
-            place_tags = [t.lower() for t in place.tags]
-            for interest in interest_list:
-                if interest in place_tags:
-                    score += 2  # Direct tag match
-                # Also check if interest matches category
-                if interest == place.category.value:
-                    score += 2  # Category match
-                # Check partial matches in description or name
-                if interest in place.description.lower():
-                    score += 1
-                if interest in place.name.lower():
-                    score += 1
-
-        scored_places.append((place, score))
-
-    # Filter based on interests
-    if interest_list:
-        # Only include places with at least one match
-        scored_places = [(p, s) for p, s in scored_places if s > 0]
-    else:
+    # Score and filter places in one pass; with interests, only matches are kept
+    scored_places: Iterable[tuple[AreaInfo, int]] = iter_scored_places(
+        interest_list, max_distance_km, family_friendly_only
+    )
+
+    if not interest_list:
         # No interests specified - provide diverse recommendations
         # Group by category and pick from each
         category_places: dict[AreaCategory, list[AreaInfo]] = {}
@@ -315,11 +279,9 @@ async def get_recommendations(
                 diverse_places.append((p, 1))
         scored_places = diverse_places
 
-    # Sort by relevance score (descending), then by distance (ascending)
-    scored_places.sort(key=lambda x: (-x[1], x[0].distance_km))
-
-    # Apply limit
-    recommendations = [place for place, _ in scored_places[:limit]]
+    # Top `limit` by relevance score (descending), then by distance (ascending)
+    top_places = heapq.nsmallest(limit, scored_places, key=lambda x: (-x[1], x[0].distance_km))
+    recommendations = [place for place, _ in top_places]
 
     # Build filters applied info
     filters_applied: dict[str, Any] = {}
@@ -24,8 +24,9 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from api.dependencies import get_db
 from api.security import AuthScope, require_auth, SecurityRequirement
-from shared.services.dynamodb import get_dynamodb_service
+from shared.services.dynamodb import DynamoDBService
 
 # Structured logger for auth events (T035)
 logger = logging.getLogger(__name__)
@@ -226,6 +227,7 @@ router = APIRouter(prefix="/customers", tags=["customers"])
 def get_customer_me(
     cognito_sub: str = Depends(_get_cognito_sub),
     auth: SecurityRequirement = Depends(require_auth([AuthScope.OPENID])),
+    db: DynamoDBService = Depends(get_db),
 ) -> dict[str, Any]:
     """Get current customer profile.
 
@@ -237,7 +239,6 @@ def get_customer_me(
     Raises:
         HTTPException: 401 if not authenticated, 404 if profile not found
     """
-    db = get_dynamodb_service()
     customer = db.get_customer_by_cognito_sub(cognito_sub)
 
     if customer is None:
@@ -266,6 +267,7 @@ def create_customer_me(
     data: CustomerCreate,
     cognito_sub: str = Depends(_get_cognito_sub),
     auth: SecurityRequirement = Depends(require_auth([AuthScope.OPENID])),
+    db: DynamoDBService = Depends(get_db),
 ) -> dict[str, Any]:
     """Create customer profile for authenticated user.
 
@@ -280,8 +282,6 @@ def create_customer_me(
     # Get email from header (injected by API Gateway from JWT)
     email = _get_user_email(request)
 
-    db = get_dynamodb_service()
-
     # Check if profile already exists
     existing = db.get_customer_by_cognito_sub(cognito_sub)
     if existing is not None:
@@ -333,6 +333,7 @@ def update_customer_me(
     data: CustomerUpdate,
     cognito_sub: str = Depends(_get_cognito_sub),
     auth: SecurityRequirement = Depends(require_auth([AuthScope.OPENID])),
+    db: DynamoDBService = Depends(get_db),
 ) -> dict[str, Any]:
     """Update current customer profile.
 
@@ -344,8 +345,6 @@ def update_customer_me(
     Raises:
         HTTPException: 401 if not authenticated, 404 if profile not found
     """
-    db = get_dynamodb_service()
-
     # Check if profile exists
     existing = db.get_customer_by_cognito_sub(cognito_sub)
     if existing is None:
@@ -6,8 +6,11 @@ This module is separate from tools to avoid strands dependency in API layer.
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+from pydantic import TypeAdapter
 
 from shared.models import (
     AreaCategory,
@@ -17,11 +20,62 @@ from shared.models import (
 logger = logging.getLogger(__name__)
 
 
+class PlaceSearchEntry(NamedTuple):
+    """A place with the lowercased fields that recommendations match against."""
+
+    place: AreaInfo
+    tags: frozenset[str]
+    name: str
+    description: str
+    category: str
+
+
 # In-memory data store for area information
 # This can be loaded from JSON or DynamoDB in production
 _AREA_DATA: list[AreaInfo] = []
 _DATA_LOADED: bool = False
 
+# Rebuilt whenever the store is replaced so lookups skip the per-request
+# filter and sort. Keyed by category, with None holding every place; each
+# list is sorted by distance, alongside the places' model_dump() dicts.
+_AREA_BY_CATEGORY: dict[AreaCategory | None, list[AreaInfo]] = {}
+_AREA_DICTS_BY_CATEGORY: dict[AreaCategory | None, list[dict[str, Any]]] = {}
+_SEARCH_INDEX: list[PlaceSearchEntry] = []
+# id(place) -> (place, model_dump()); the place is kept to check identity
+_PLACE_DICTS: dict[int, tuple[AreaInfo, dict[str, Any]]] = {}
+
+_AREA_LIST_ADAPTER = TypeAdapter(list[AreaInfo])
+
+# Category lookup and the list quoted back for unknown categories, built once
+_CATEGORIES_BY_VALUE = {c.value: c for c in AreaCategory}
+VALID_CATEGORIES = ", ".join(_CATEGORIES_BY_VALUE)
+
+
+def _index_area_data() -> None:
+    """Rebuild the per-category, distance-sorted and search views of the data store."""
+    global _AREA_BY_CATEGORY, _AREA_DICTS_BY_CATEGORY, _SEARCH_INDEX, _PLACE_DICTS
+    by_distance = sorted(_AREA_DATA, key=lambda p: p.distance_km)
+    by_category: dict[AreaCategory | None, list[AreaInfo]] = {None: by_distance}
+    for place in by_distance:
+        by_category.setdefault(place.category, []).append(place)
+    place_dicts = {id(place): (place, place.model_dump()) for place in by_distance}
+    _AREA_BY_CATEGORY = by_category
+    _AREA_DICTS_BY_CATEGORY = {
+        category: [place_dicts[id(place)][1] for place in places]
+        for category, places in by_category.items()
+    }
+    _PLACE_DICTS = place_dicts
+    _SEARCH_INDEX = [
+        PlaceSearchEntry(
+            place=place,
+            tags=frozenset(t.lower() for t in place.tags),
+            name=place.name.lower(),
+            description=place.description.lower(),
+            category=place.category.value,
+        )
+        for place in _AREA_DATA
+    ]
+
 
 def get_area_data_store() -> list[AreaInfo]:
     """Get the current area data store."""
@@ -32,6 +86,82 @@ def set_area_data_store(data: list[AreaInfo]) -> None:
     """Set the area data store (for testing or initialization)."""
     global _AREA_DATA
     _AREA_DATA = data
+    _index_area_data()
+
+
+def parse_category(category: str) -> AreaCategory | None:
+    """Look up a category by value, ignoring case and surrounding whitespace.
+
+    Returns None for unknown categories; VALID_CATEGORIES lists the valid ones.
+    """
+    return _CATEGORIES_BY_VALUE.get(category.lower().strip())
+
+
+def get_places_by_distance(category: AreaCategory | None = None) -> list[AreaInfo]:
+    """Get places in a category (or all places), closest first.
+
+    The returned list is shared; callers must not modify it.
+    """
+    return _AREA_BY_CATEGORY.get(category, [])
+
+
+def get_place_dicts_by_distance(category: AreaCategory | None = None) -> list[dict[str, Any]]:
+    """Get model_dump() dicts of places in a category (or all), closest first.
+
+    The returned list and dicts are shared; callers must not modify them.
+    """
+    return _AREA_DICTS_BY_CATEGORY.get(category, [])
+
+
+def get_place_dict(place: AreaInfo) -> dict[str, Any]:
+    """Get a place's model_dump() dict, cached for places in the store.
+
+    The returned dict may be shared; callers must not modify it.
+    """
+    entry = _PLACE_DICTS.get(id(place))
+    if entry is not None and entry[0] is place:
+        return entry[1]
+    return place.model_dump()
+
+
+def iter_scored_places(
+    interests: list[str],
+    max_distance_km: float | None = None,
+    family_friendly_only: bool = False,
+) -> Iterator[tuple[AreaInfo, int]]:
+    """Yield places passing the filters, with their interest-match score.
+
+    Each interest scores 2 for a tag match, 2 for a category match, and 1
+    each for a substring of the description or name. Places that fail a
+    filter, or match none of the given interests, are skipped in the same
+    pass rather than collected and filtered afterwards.
+
+    Args:
+        interests: Lowercased interests; empty yields every place with score 0
+        max_distance_km: Optional maximum distance from the property
+        family_friendly_only: Only yield family-friendly places
+    """
+    for entry in _SEARCH_INDEX:
+        place = entry.place
+        if family_friendly_only and not place.family_friendly:
+            continue
+        if max_distance_km is not None and place.distance_km > max_distance_km:
+            continue
+
+        score = 0
+        for interest in interests:
+            if interest in entry.tags:
+                score += 2
+            if interest == entry.category:
+                score += 2
+            if interest in entry.description:
+                score += 1
+            if interest in entry.name:
+                score += 1
+
+        if interests and not score:
+            continue
+        yield place, score
 
 
 def load_area_data_from_dicts(data: list[dict[str, Any]]) -> None:
@@ -40,13 +170,17 @@ def load_area_data_from_dicts(data: list[dict[str, Any]]) -> None:
     Useful for loading from JSON files or test fixtures.
     """
     global _AREA_DATA
-    _AREA_DATA = []
-    for item in data:
-        # Convert category string to enum if needed
-        if isinstance(item.get("category"), str):
-            item = item.copy()
-            item["category"] = AreaCategory(item["category"])
-        _AREA_DATA.append(AreaInfo(**item))
+    # AreaInfo is strict, so category strings still become enums up front;
+    # the list is then validated in a single pydantic-core call
+    _AREA_DATA = _AREA_LIST_ADAPTER.validate_python(
+        [
+            {**item, "category": AreaCategory(item["category"])}
+            if isinstance(item.get("category"), str)
+            else item
+            for item in data
+        ]
+    )
+    _index_area_data()
 
 
 def load_area_data_from_json(json_path: Path | str | None = None) -> int:
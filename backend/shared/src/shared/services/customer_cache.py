@@ -0,0 +1,51 @@
+"""In-process cache of customer records keyed by cognito_sub.
+
+Shared by the reservation tools, which resolve the caller's customer on every
+call, and the customer tools, which invalidate entries after profile updates.
+"""
+
+import threading
+import time
+from typing import Any
+
+from shared.services.dynamodb import DynamoDBService
+
+# The sub -> customer_id binding never changes, so entries are only expired
+# to bound staleness of profile fields.
+_CUSTOMER_CACHE_TTL_SECONDS = 300.0
+_CUSTOMER_CACHE_MAX_ENTRIES = 10_000
+_customer_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_customer_cache_lock = threading.Lock()
+
+
+def get_customer_cached(db: DynamoDBService, cognito_sub: str) -> dict[str, Any] | None:
+    """Get the customer for a cognito_sub, served from cache when fresh.
+
+    Misses are not cached so a newly created profile is visible immediately.
+    """
+    now = time.monotonic()
+    entry = _customer_cache.get(cognito_sub)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    customer = db.get_customer_by_cognito_sub(cognito_sub)
+    if customer:
+        with _customer_cache_lock:
+            full = len(_customer_cache) >= _CUSTOMER_CACHE_MAX_ENTRIES
+            if full and cognito_sub not in _customer_cache:
+                # Evict the oldest insertion
+                del _customer_cache[next(iter(_customer_cache))]
+            _customer_cache[cognito_sub] = (now + _CUSTOMER_CACHE_TTL_SECONDS, customer)
+    return customer
+
+
+def invalidate_customer_cache(cognito_sub: str | None = None) -> None:
+    """Drop a cached customer record, or all of them when no sub is given.
+
+    Call after changing a customer record so reservation tools re-read it.
+    """
+    with _customer_cache_lock:
+        if cognito_sub is None:
+            _customer_cache.clear()
+        else:
+            _customer_cache.pop(cognito_sub, None)
@@ -1,16 +1,56 @@
 """DynamoDB service wrapper for type-safe table operations."""
 
+import logging
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, TypeVar
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
+# Shared by the DynamoDB resource and client: a pool sized for concurrent tool
+# calls, keep-alive on idle sockets, adaptive retries under throttling, and
+# timeouts well below botocore's 60s defaults so a stuck call fails fast
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True,
+)
+
+# Unmarshals items returned by the low-level client
+_deserializer = TypeDeserializer()
+
+# BatchGetItem attempts before giving up on unprocessed keys
+_BATCH_GET_MAX_ATTEMPTS = 4
+
+# TransactWriteItems attempts for transactions cancelled only by contention or
+# throttling (top-level throttling errors are retried by botocore itself)
+_TRANSACT_MAX_ATTEMPTS = 4
+_TRANSACT_RETRYABLE_REASONS = {
+    "None",
+    "TransactionConflict",
+    "ProvisionedThroughputExceeded",
+    "ThrottlingError",
+}
+
+# BatchGetItem accepts at most 100 keys per request; larger batches are split
+# and the chunks fetched concurrently on up to this many threads
+_BATCH_GET_MAX_KEYS = 100
+_BATCH_GET_MAX_WORKERS = 10
+
 # Module-level singleton for connection reuse (performance optimization T114)
 _dynamodb_service_instance: "DynamoDBService | None" = None
 
@@ -57,16 +97,28 @@ class DynamoDBService:
         self.name_prefix = os.getenv(
             "DYNAMODB_TABLE_PREFIX", f"booking-{self.environment}"
         )
-        self._dynamodb = boto3.resource("dynamodb")
-        self._client = boto3.client("dynamodb")
+        self._dynamodb = boto3.resource("dynamodb", config=_CLIENT_CONFIG)
+        self._client = boto3.client("dynamodb", config=_CLIENT_CONFIG)
+        # Table names and Table resources are fixed per instance; memoized
+        # so hot paths skip the string formatting and resource construction
+        self._table_names: dict[str, str] = {}
+        self._tables: dict[str, Any] = {}
 
     def _table_name(self, table: str) -> str:
         """Get full table name with prefix."""
-        return f"{self.name_prefix}-{table}"
+        name = self._table_names.get(table)
+        if name is None:
+            name = self._table_names[table] = f"{self.name_prefix}-{table}"
+        return name
 
     def _get_table(self, table: str) -> Any:
         """Get DynamoDB table resource."""
-        return self._dynamodb.Table(self._table_name(table))
+        # get-then-insert rather than setdefault, which would build the
+        # Table resource on every call just to discard it
+        resource = self._tables.get(table)
+        if resource is None:
+            resource = self._tables[table] = self._dynamodb.Table(self._table_name(table))
+        return resource
 
     # Generic CRUD operations
 
@@ -74,17 +126,22 @@ class DynamoDBService:
         self,
         table: str,
         key: dict[str, Any],
+        consistent_read: bool = False,
     ) -> dict[str, Any] | None:
         """Get a single item by key.
 
         Args:
             table: Table name without prefix
             key: Primary key dict
+            consistent_read: Use a strongly consistent read
 
         Returns:
             Item dict or None if not found
         """
-        response = self._get_table(table).get_item(Key=key)
+        if consistent_read:
+            response = self._get_table(table).get_item(Key=key, ConsistentRead=True)
+        else:
+            response = self._get_table(table).get_item(Key=key)
         item: dict[str, Any] | None = response.get("Item")
         return item
 
@@ -183,6 +240,9 @@ class DynamoDBService:
         filter_expression: Any | None = None,
         limit: int | None = None,
         scan_index_forward: bool = True,
+        projection_expression: str | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+        exclusive_start_key: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query table or GSI.
 
@@ -193,6 +253,9 @@ class DynamoDBService:
             filter_expression: Additional filter (optional)
             limit: Max items to return
             scan_index_forward: Sort order (True=ascending)
+            projection_expression: Attributes to return (optional, default all)
+            expression_attribute_names: Names for projection (for reserved words)
+            exclusive_start_key: Key of the item to resume after (optional)
 
         Returns:
             List of items
@@ -207,6 +270,12 @@ class DynamoDBService:
             kwargs["FilterExpression"] = filter_expression
         if limit:
             kwargs["Limit"] = limit
+        if projection_expression:
+            kwargs["ProjectionExpression"] = projection_expression
+        if expression_attribute_names:
+            kwargs["ExpressionAttributeNames"] = expression_attribute_names
+        if exclusive_start_key:
+            kwargs["ExclusiveStartKey"] = exclusive_start_key
 
         response = self._get_table(table).query(**kwargs)
         items: list[dict[str, Any]] = response.get("Items", [])
@@ -216,46 +285,145 @@ class DynamoDBService:
         self,
         table: str,
         keys: list[dict[str, Any]],
+        projection_expression: str | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         """Batch get items by keys.
 
         Args:
             table: Table name without prefix
             keys: List of primary key dicts
+            projection_expression: Attributes to return (optional, default all)
+            expression_attribute_names: Names for projection (for reserved words)
 
         Returns:
-            List of found items
+            List of found items. Keys DynamoDB leaves unprocessed are retried
+            with backoff; any still unprocessed after that are omitted.
         """
         if not keys:
             return []
 
+        request: dict[str, Any] = {}
+        if projection_expression:
+            request["ProjectionExpression"] = projection_expression
+        if expression_attribute_names:
+            request["ExpressionAttributeNames"] = expression_attribute_names
+
+        chunks = [
+            keys[i : i + _BATCH_GET_MAX_KEYS] for i in range(0, len(keys), _BATCH_GET_MAX_KEYS)
+        ]
+        if len(chunks) == 1:
+            return self._batch_get_chunk(table, keys, request)
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), _BATCH_GET_MAX_WORKERS)) as pool:
+            results = pool.map(lambda chunk: self._batch_get_chunk(table, chunk, request), chunks)
+            return [item for items in results for item in items]
+
+    def _batch_get_chunk(
+        self, table: str, keys: list[dict[str, Any]], request: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Fetch up to 100 keys with one BatchGetItem, retrying unprocessed keys."""
         table_name = self._table_name(table)
-        response = self._dynamodb.batch_get_item(
-            RequestItems={table_name: {"Keys": keys}}
-        )
-        items: list[dict[str, Any]] = response.get("Responses", {}).get(table_name, [])
+        items: list[dict[str, Any]] = []
+        request_items: dict[str, Any] = {table_name: {**request, "Keys": keys}}
+        for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                # Exponential backoff with jitter, so concurrent chunks
+                # throttled together do not retry in lockstep
+                time.sleep(0.05 * 2**attempt + random.random() * 0.05)
+            response = self._dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                break
+        else:
+            logger.warning(
+                "Batch get left keys unprocessed",
+                extra={"table": table, "unprocessed": len(request_items[table_name]["Keys"])},
+            )
         return items
 
+    def batch_write(self, table: str, items: list[dict[str, Any]]) -> bool:
+        """Put items with BatchWriteItem, without transactional guarantees.
+
+        The batch writer sends requests of up to 25 items and resends any
+        unprocessed items, so callers only see hard failures.
+
+        Args:
+            table: Table name without prefix
+            items: Items to store
+
+        Returns:
+            True if successful, False if a write request failed
+        """
+        try:
+            with self._get_table(table).batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+            return True
+        except ClientError as e:
+            logger.error(
+                "Batch write failed",
+                extra={"table": table, "error_code": e.response["Error"]["Code"]},
+            )
+            return False
+
     def transact_write(
         self,
         items: list[dict[str, Any]],
+        cancellation_reasons: list[str] | None = None,
+        cancelled_items: list[dict[str, Any] | None] | None = None,
     ) -> bool:
         """Execute transactional write for multiple items.
 
+        Transactions cancelled only by conflicts with other transactions or
+        by throttling are retried with jittered backoff.
+
         Args:
             items: List of TransactWriteItem dicts
+            cancellation_reasons: Optional list that receives one reason code
+                per item (e.g. "ConditionalCheckFailed", "None") if the
+                transaction is cancelled
+            cancelled_items: Optional list that receives one entry per item
+                if the transaction is cancelled: the item's old attributes
+                when it requested ReturnValuesOnConditionCheckFailure and
+                failed its condition, otherwise None
 
         Returns:
             True if successful, False if transaction failed
         """
-        try:
-            # Cast to satisfy boto3-stubs type checker
-            self._client.transact_write_items(TransactItems=items)  # type: ignore[arg-type]
-            return True
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "TransactionCanceledException":
-                return False
-            raise
+        for attempt in range(_TRANSACT_MAX_ATTEMPTS):
+            try:
+                # Cast to satisfy boto3-stubs type checker
+                self._client.transact_write_items(TransactItems=items)  # type: ignore[arg-type]
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TransactionCanceledException":
+                    raise
+                reasons = e.response.get("CancellationReasons", [])
+
+            codes = [reason.get("Code", "None") for reason in reasons]
+            # A cancellation caused only by contention or throttling left
+            # nothing written and may succeed on retry; a failed condition won't
+            if (
+                attempt + 1 < _TRANSACT_MAX_ATTEMPTS
+                and set(codes) - {"None"}
+                and set(codes) <= _TRANSACT_RETRYABLE_REASONS
+            ):
+                time.sleep(random.uniform(0, min(1.0, 0.05 * 2**attempt)))
+                continue
+
+            if cancellation_reasons is not None:
+                cancellation_reasons.extend(codes)
+            if cancelled_items is not None:
+                cancelled_items.extend(
+                    {k: _deserializer.deserialize(v) for k, v in reason["Item"].items()}
+                    if "Item" in reason
+                    else None
+                    for reason in reasons
+                )
+            return False
+        return False
 
     # Convenience methods for common patterns
 
@@ -324,13 +492,18 @@ class DynamoDBService:
         return results[0] if results else None
 
     def get_reservations_by_customer_id(
-        self, customer_id: str, limit: int | None = None
+        self,
+        customer_id: str,
+        limit: int | None = None,
+        exclusive_start_key: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Get all reservations for a customer using GSI.
 
         Args:
             customer_id: Customer ID to query reservations for
             limit: Optional limit on number of results
+            exclusive_start_key: Index key of the last reservation already seen
+                (for paging back through older stays)
 
         Returns:
             List of reservation dicts, ordered by check_in date (descending)
@@ -341,6 +514,7 @@ class DynamoDBService:
             index_name="customer-checkin-index",
             limit=limit,
             scan_index_forward=False,  # Most recent first
+            exclusive_start_key=exclusive_start_key,
         )
 
     def create_customer(self, customer: dict[str, Any]) -> bool:
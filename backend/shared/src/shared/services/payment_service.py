@@ -6,7 +6,7 @@ In production, integrate with Stripe, PayPal, etc.
 """
 
 import datetime as dt
-import uuid
+import secrets
 from typing import TYPE_CHECKING, Any
 
 from shared.models import (
@@ -47,7 +47,7 @@ class PaymentService:
         Returns:
             Unique ID like TXN-ABC123DEF456 or PAY-ABC123DEF456
         """
-        return f"{prefix}-{uuid.uuid4().hex[:12].upper()}"
+        return f"{prefix}-{secrets.token_hex(6).upper()}"
 
     def create_pending_stripe_payment(
         self,
@@ -132,7 +132,7 @@ class PaymentService:
             status=TransactionStatus.COMPLETED,
             payment_method=data.payment_method,
             provider=PaymentProvider.MOCK,
-            provider_transaction_id=f"MOCK-{uuid.uuid4().hex[:8]}",
+            provider_transaction_id=f"MOCK-{secrets.token_hex(4)}",
             created_at=now,
             completed_at=now,
         )
@@ -237,7 +237,7 @@ class PaymentService:
             status=TransactionStatus.COMPLETED,
             payment_method=original.payment_method,
             provider=PaymentProvider.MOCK,
-            provider_transaction_id=f"MOCK-REFUND-{uuid.uuid4().hex[:8]}",
+            provider_transaction_id=f"MOCK-REFUND-{secrets.token_hex(4)}",
             created_at=now,
             completed_at=now,
         )
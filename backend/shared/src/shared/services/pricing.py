@@ -150,6 +150,9 @@ class PricingService:
     def create_season(self, pricing: Pricing) -> bool:
         """Create a new pricing season.
 
+        Seasons should not overlap. Where they do, the pricing tools apply the
+        earliest-starting season to the shared dates.
+
         Args:
             pricing: Pricing data
 
@@ -164,6 +167,7 @@ class PricingService:
             "nightly_rate": pricing.nightly_rate,
             "minimum_nights": pricing.minimum_nights,
             "cleaning_fee": pricing.cleaning_fee,
-            "is_active": pricing.is_active,
+            # Stored as a string: it is the hash key of the active-index GSI
+            "is_active": "true" if pricing.is_active else "false",
         }
         return self.db.put_item(self.TABLE, item)
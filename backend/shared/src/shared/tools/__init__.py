@@ -45,7 +45,7 @@ from shared.tools.reservations import (
     get_my_reservations,
     get_reservation,
     modify_reservation,
-    set_auth_url_queue,
+    set_auth_url_handler,
 )
 
 # All tools for the booking agent
@@ -112,8 +112,8 @@ __all__ = [
     "get_recommendations",
     "get_property_details",
     "get_photos",
-    # Auth queue setup for @requires_access_token callbacks
-    "set_auth_url_queue",
+    # Auth URL handler setup for @requires_access_token callbacks
+    "set_auth_url_handler",
     # Tool collection
     "ALL_TOOLS",
 ]
@@ -5,7 +5,9 @@ golf courses, beaches, restaurants, attractions, and activities
 in the Quesada/Costa Blanca area.
 """
 
+import heapq
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from strands import tool
@@ -13,16 +15,20 @@ from strands import tool
 from shared.models import (
     AreaCategory,
     AreaInfo,
-    AreaInfoResponse,
     RecommendationResponse,
 )
 
 # Re-export data utilities from service module for backwards compatibility
 from shared.services.area_data import (
+    VALID_CATEGORIES,
     ensure_area_data_loaded,
-    get_area_data_store,
+    get_place_dict,
+    get_place_dicts_by_distance,
+    get_places_by_distance,
+    iter_scored_places,
     load_area_data_from_dicts,
     load_area_data_from_json,
+    parse_category,
     set_area_data_store,
 )
 
@@ -45,36 +51,19 @@ def get_area_info(category: str | None = None) -> dict[str, Any]:
     """
     # Ensure data is loaded
     ensure_area_data_loaded()
-    data = get_area_data_store()
 
     # Validate category if provided
     category_enum: AreaCategory | None = None
     if category:
-        category_lower = category.lower().strip()
-        try:
-            category_enum = AreaCategory(category_lower)
-        except ValueError:
-            valid_categories = [c.value for c in AreaCategory]
+        category_enum = parse_category(category)
+        if category_enum is None:
             return {
                 "status": "error",
-                "message": f"Unknown category '{category}'. Valid categories are: {', '.join(valid_categories)}",
+                "message": f"Unknown category '{category}'. Valid categories are: {VALID_CATEGORIES}",
             }
 
-    # Filter by category if specified
-    if category_enum:
-        filtered = [place for place in data if place.category == category_enum]
-    else:
-        filtered = list(data)
-
-    # Sort by distance (closest first)
-    filtered.sort(key=lambda p: p.distance_km)
-
-    # Build response
-    response = AreaInfoResponse(
-        places=filtered,
-        category=category_enum,
-        total_count=len(filtered),
-    )
+    # Places in the category (or all places), already sorted closest first
+    filtered = get_places_by_distance(category_enum)
 
     # Create helpful message
     if category_enum:
@@ -91,9 +80,9 @@ def get_area_info(category: str | None = None) -> dict[str, Any]:
 
     return {
         "status": "success",
-        "places": [place.model_dump() for place in response.places],
-        "category": response.category.value if response.category else None,
-        "total_count": response.total_count,
+        "places": list(get_place_dicts_by_distance(category_enum)),
+        "category": category_enum.value if category_enum else None,
+        "total_count": len(filtered),
         "message": message,
     }
 
@@ -122,7 +111,6 @@ def get_recommendations(
     """
     # Ensure data is loaded
     ensure_area_data_loaded()
-    data = get_area_data_store()
 
     # Validate limit
     if limit < 1:
@@ -133,42 +121,12 @@ def get_recommendations(
     # Normalize interests to lowercase
     normalized_interests = [i.lower().strip() for i in (interests or [])]
 
-    # Score and filter places
-    scored_places: list[tuple[AreaInfo, int]] = []
-
-    for place in data:
-        # Apply family-friendly filter
-        if family_friendly_only and not place.family_friendly:
-            continue
-
-        # Apply distance filter
-        if max_distance_km is not None and place.distance_km > max_distance_km:
-            continue
-
-        # Calculate relevance score based on interest matching
-        score = 0
-        if normalized_interests:
-            # Check tags (case-insensitive)
-            place_tags = [t.lower() for t in place.tags]
-            for interest in normalized_interests:
-                if interest in place_tags:
-                    score += 2  # Direct tag match
-                # Also check if interest matches category
-                if interest == place.category.value:
-                    score += 2  # Category match
-                # Check partial matches in description or name
-                if interest in place.description.lower():
-                    score += 1
-                if interest in place.name.lower():
-                    score += 1
-
-        scored_places.append((place, score))
-
-    # Filter based on interests
-    if normalized_interests:
-        # Only include places with at least one match
-        scored_places = [(p, s) for p, s in scored_places if s > 0]
-    else:
+    # Score and filter places in one pass; with interests, only matches are kept
+    scored_places: Iterable[tuple[AreaInfo, int]] = iter_scored_places(
+        normalized_interests, max_distance_km, family_friendly_only
+    )
+
+    if not normalized_interests:
         # No interests specified - provide diverse recommendations
         # Group by category and pick from each
         category_places: dict[AreaCategory, list[AreaInfo]] = {}
@@ -185,11 +143,9 @@ def get_recommendations(
                 diverse_places.append((p, 1))
         scored_places = diverse_places
 
-    # Sort by relevance score (descending), then by distance (ascending)
-    scored_places.sort(key=lambda x: (-x[1], x[0].distance_km))
-
-    # Apply limit
-    recommendations = [place for place, _ in scored_places[:limit]]
+    # Top `limit` by relevance score (descending), then by distance (ascending)
+    top_places = heapq.nsmallest(limit, scored_places, key=lambda x: (-x[1], x[0].distance_km))
+    recommendations = [place for place, _ in top_places]
 
     # Build filters applied info
     filters_applied: dict[str, Any] = {}
@@ -222,7 +178,7 @@ def get_recommendations(
 
     return {
         "status": "success",
-        "recommendations": [r.model_dump() for r in response.recommendations],
+        "recommendations": [get_place_dict(r) for r in response.recommendations],
         "total_count": response.total_count,
         "filters_applied": response.filters_applied,
         "message": message,
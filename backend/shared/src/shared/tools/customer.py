@@ -7,22 +7,59 @@ for the booking flow.
 
 import logging
 import random
+import re
 import string
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from strands import tool
 
-logger = logging.getLogger(__name__)
-
 from shared.models.errors import ErrorCode, ToolError
+from shared.services.customer_cache import invalidate_customer_cache
 from shared.services.dynamodb import DynamoDBService, get_dynamodb_service
 
+logger = logging.getLogger(__name__)
+
+# (attribute name, expression value alias) for fields update_customer_details can set
+_UPDATABLE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("name", "name"),
+    ("phone", "phone"),
+    ("preferred_language", "lang"),
+)
+
+# Single-pass sanity check: one "@", no whitespace, and a dot in the domain
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Static input-validation failures shared by the customer tools, keyed by error code
+_INPUT_ERROR_MESSAGES: dict[str, str] = {
+    "INVALID_EMAIL": "Please provide a valid email address.",
+    "INVALID_CODE_FORMAT": "Please enter the code you received by email.",
+    "MISSING_CUSTOMER_ID": "Customer ID is required to update details.",
+    "INVALID_LANGUAGE": "Language must be 'en' (English) or 'es' (Spanish).",
+    "NO_UPDATES": "Please provide at least one field to update (name, phone, or language).",
+}
+
+
+def _input_error(code: str) -> dict[str, Any]:
+    """Build the error response for an input-validation failure."""
+    return {"status": "error", "code": code, "message": _INPUT_ERROR_MESSAGES[code]}
+
+
+@lru_cache(maxsize=512)
+def _normalize_email(email: str) -> str:
+    """Normalize an email for lookups (trimmed, lower-cased).
+
+    Cached because the same address is normalized by several tool calls
+    over one conversation (initiate -> verify -> customer info).
+    """
+    return email.strip().lower()
 
-def _get_db() -> DynamoDBService:
-    """Get shared DynamoDB service instance (singleton for performance)."""
-    return get_dynamodb_service()
+
+# Direct alias of the singleton accessor (no extra call frame per tool call).
+# Not bound to an instance at import so reset_dynamodb_service() still applies.
+_get_db = get_dynamodb_service
 
 
 def _generate_verification_code() -> str:
@@ -76,13 +113,9 @@ def initiate_verification(email: str) -> dict[str, Any]:
     """
     logger.info("initiate_verification called", extra={"email": email})
     # Basic email validation
-    email = email.strip().lower()
-    if not email or "@" not in email or "." not in email:
-        return {
-            "status": "error",
-            "code": "INVALID_EMAIL",
-            "message": "Please provide a valid email address.",
-        }
+    email = _normalize_email(email)
+    if not _EMAIL_RE.match(email):
+        return _input_error("INVALID_EMAIL")
 
     db = _get_db()
 
@@ -91,6 +124,10 @@ def initiate_verification(email: str) -> dict[str, Any]:
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(minutes=10)
 
+    # Check if returning customer (query GSI)
+    existing_customer = _find_customer_by_email(db, email)
+    is_returning = existing_customer is not None
+
     # Store verification code with TTL
     verification_record = {
         "email": email,
@@ -101,16 +138,15 @@ def initiate_verification(email: str) -> dict[str, Any]:
         "attempts": 0,
         "verified": False,
     }
+    if existing_customer:
+        # Lets verify_code update the customer by primary key without a GSI query
+        verification_record["customer_id"] = existing_customer["customer_id"]
 
     db.put_item("verification_codes", verification_record)
 
     # MOCK: In production, send email via SES
-    # For development, we log the code (would be removed in production)
-    print(f"[MOCK EMAIL] Verification code for {email}: {code}")
-
-    # Check if returning customer (query GSI)
-    existing_customer = _find_customer_by_email(db, email)
-    is_returning = existing_customer is not None
+    # For development, we log the code at DEBUG (skipped at production log levels)
+    logger.debug("[MOCK EMAIL] Verification code for %s: %s", email, code)
 
     return {
         "status": "success",
@@ -140,15 +176,11 @@ def verify_code(email: str, code: str) -> dict[str, Any]:
         Dictionary with verification result and customer_id if successful
     """
     logger.info("verify_code called", extra={"email": email})
-    email = email.strip().lower()
+    email = _normalize_email(email)
     code = code.strip()
 
     if not code or len(code) != 6 or not code.isdigit():
-        return {
-            "status": "error",
-            "code": "INVALID_CODE_FORMAT",
-            "message": "Please enter the code you received by email.",
-        }
+        return _input_error("INVALID_CODE_FORMAT")
 
     db = _get_db()
 
@@ -214,19 +246,34 @@ def verify_code(email: str, code: str) -> dict[str, Any]:
 
     now = datetime.now(timezone.utc)
 
-    # Get or create customer record (query GSI)
-    existing_customer = _find_customer_by_email(db, email)
-
-    if existing_customer:
-        # Update existing customer (PK is customer_id)
-        customer_id = existing_customer["customer_id"]
-        db.update_item(
+    # Get or create customer record. If initiate_verification already resolved the
+    # customer, update by primary key and read the profile from the returned
+    # attributes; otherwise fall back to the email-index GSI.
+    existing_customer = None
+    known_customer_id = verification.get("customer_id")
+    if known_customer_id:
+        existing_customer = db.update_item(
             "customers",
-            {"customer_id": customer_id},
+            {"customer_id": known_customer_id},
             "SET email_verified = :verified, updated_at = :now",
             {":verified": True, ":now": now.isoformat()},
+            condition_expression="attribute_exists(customer_id)",
         )
 
+    if existing_customer is None:
+        existing_customer = _find_customer_by_email(db, email)
+        if existing_customer:
+            # Update existing customer (PK is customer_id)
+            db.update_item(
+                "customers",
+                {"customer_id": existing_customer["customer_id"]},
+                "SET email_verified = :verified, updated_at = :now",
+                {":verified": True, ":now": now.isoformat()},
+            )
+
+    if existing_customer:
+        customer_id = existing_customer["customer_id"]
+
         return {
             "status": "success",
             "customer_id": customer_id,
@@ -277,14 +324,10 @@ def get_customer_info(email: str) -> dict[str, Any]:
         Dictionary with customer info or indication that customer is new
     """
     logger.info("get_customer_info called", extra={"email": email})
-    email = email.strip().lower()
+    email = _normalize_email(email)
 
-    if not email or "@" not in email:
-        return {
-            "status": "error",
-            "code": "INVALID_EMAIL",
-            "message": "Please provide a valid email address.",
-        }
+    if not _EMAIL_RE.match(email):
+        return _input_error("INVALID_EMAIL")
 
     db = _get_db()
 
@@ -339,19 +382,11 @@ def update_customer_details(
     """
     logger.info("update_customer_details called", extra={"customer_id": customer_id})
     if not customer_id:
-        return {
-            "status": "error",
-            "code": "MISSING_CUSTOMER_ID",
-            "message": "Customer ID is required to update details.",
-        }
+        return _input_error("MISSING_CUSTOMER_ID")
 
     # Validate language if provided
     if preferred_language and preferred_language not in ("en", "es"):
-        return {
-            "status": "error",
-            "code": "INVALID_LANGUAGE",
-            "message": "Language must be 'en' (English) or 'es' (Spanish).",
-        }
+        return _input_error("INVALID_LANGUAGE")
 
     db = _get_db()
 
@@ -368,24 +403,15 @@ def update_customer_details(
     update_parts = []
     expression_values: dict[str, Any] = {}
 
-    if name:
-        update_parts.append("name = :name")
-        expression_values[":name"] = name.strip()
-
-    if phone:
-        update_parts.append("phone = :phone")
-        expression_values[":phone"] = phone.strip()
-
-    if preferred_language:
-        update_parts.append("preferred_language = :lang")
-        expression_values[":lang"] = preferred_language
+    for (column, alias), value in zip(
+        _UPDATABLE_FIELDS, (name, phone, preferred_language), strict=True
+    ):
+        if value:
+            update_parts.append(f"{column} = :{alias}")
+            expression_values[f":{alias}"] = value.strip()
 
     if not update_parts:
-        return {
-            "status": "error",
-            "code": "NO_UPDATES",
-            "message": "Please provide at least one field to update (name, phone, or language).",
-        }
+        return _input_error("NO_UPDATES")
 
     # Add updated_at
     update_parts.append("updated_at = :now")
@@ -400,6 +426,9 @@ def update_customer_details(
         update_expression,
         expression_values,
     )
+    # Reservation tools cache customers by cognito_sub; drop the stale profile
+    if customer.get("cognito_sub"):
+        invalidate_customer_cache(customer["cognito_sub"])
 
     return {
         "status": "success",
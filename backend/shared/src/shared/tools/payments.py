@@ -5,11 +5,17 @@ Currently implements a mock payment provider that always succeeds.
 In production, integrate with Stripe, PayPal, etc.
 """
 
+import hashlib
+import json
 import logging
-import uuid
+import secrets
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeSerializer
 from strands import tool
 
 logger = logging.getLogger(__name__)
@@ -30,20 +36,116 @@ def _get_db():
     return get_dynamodb_service()
 
 
+# Accepted process_payment methods, and how they are listed in the error
+_VALID_PAYMENT_METHODS = frozenset(m.value for m in PaymentMethod)
+_VALID_PAYMENT_METHODS_STR = ", ".join(m.value for m in PaymentMethod)
+
+# Marshals payment records for the low-level TransactWriteItems API
+_serializer = TypeSerializer()
+
+# Payment status results by reservation_id. Short-lived: only meant to absorb
+# a client polling for status, not to serve stale answers
+_PAYMENT_STATUS_CACHE_TTL_SECONDS = 2.0
+_PAYMENT_STATUS_CACHE_MAX_ENTRIES = 1024
+_payment_status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_payment_status_cache_lock = threading.Lock()
+
+
+def invalidate_payment_status_cache(reservation_id: str | None = None) -> None:
+    """Drop a cached payment status, or all of them when no ID is given.
+
+    Call after changing a reservation's payment or status fields.
+    """
+    with _payment_status_cache_lock:
+        if reservation_id is None:
+            _payment_status_cache.clear()
+        else:
+            _payment_status_cache.pop(reservation_id, None)
+
+
+def _payment_conflict(
+    reservation_id: str, reservation: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Return the error for a reservation that cannot be paid, or None if it can."""
+    if not reservation:
+        error = ToolError.from_code(
+            ErrorCode.RESERVATION_NOT_FOUND,
+            details={"reservation_id": reservation_id},
+        )
+        return error.model_dump()
+
+    if reservation.get("status") == ReservationStatus.CANCELLED.value:
+        error = ToolError.from_code(
+            ErrorCode.UNAUTHORIZED,
+            details={"reason": "reservation_cancelled", "reservation_id": reservation_id},
+        )
+        return error.model_dump()
+
+    if reservation.get("payment_status") == PaymentStatus.PAID.value:
+        error = ToolError.from_code(
+            ErrorCode.PAYMENT_FAILED,
+            details={"reason": "already_paid", "reservation_id": reservation_id},
+        )
+        return error.model_dump()
+
+    return None
+
+
+# How long a stored payment result is replayed for a retried request
+_IDEMPOTENCY_WINDOW_SECONDS = 24 * 60 * 60
+
+
+def _payment_request_hash(reservation_id: str, payment_method: str) -> str:
+    """Fingerprint the payment request an idempotency key was first used for."""
+    return hashlib.sha256(f"{reservation_id}:{payment_method}".encode()).hexdigest()
+
+
+def _replayed_payment(
+    reservation: dict[str, Any] | None, idempotency_key: str, request_hash: str
+) -> dict[str, Any] | None:
+    """Return the stored result if this request already paid the reservation.
+
+    The record is written with the payment itself, so a retry after a timeout
+    gets the original confirmation instead of a second charge or an error.
+    A key reused for a different request is not replayed; the caller then
+    reports the reservation as already paid. Nor is a reservation that has
+    since been cancelled or refunded, so the stale confirmation is never shown.
+    """
+    reservation = reservation or {}
+    record = reservation.get("payment_idempotency")
+    if (
+        not record
+        or reservation.get("status") != ReservationStatus.CONFIRMED.value
+        or reservation.get("payment_status") != PaymentStatus.PAID.value
+        or record.get("key") != idempotency_key
+        or record.get("request_hash") != request_hash
+        or time.time() >= record.get("expires_at", 0)
+    ):
+        return None
+    logger.info(
+        "process_payment replayed stored result",
+        extra={"idempotency_key": idempotency_key},
+    )
+    result: dict[str, Any] = json.loads(record["response"])
+    return result
+
+
 def _generate_transaction_id() -> str:
     """Generate a unique transaction ID."""
-    return f"TXN-{uuid.uuid4().hex[:12].upper()}"
+    return f"TXN-{secrets.token_hex(6).upper()}"
 
 
 @tool
 def process_payment(
     reservation_id: str,
     payment_method: str = "card",
+    idempotency_key: str | None = None,
 ) -> dict[str, Any]:
     """Process payment for a reservation.
 
     Use this tool when a guest is ready to pay for their booking.
     The payment is processed and the reservation is confirmed upon success.
+    Repeating a successful call returns the original result without charging again.
 
     NOTE: This is a mock implementation that always succeeds.
     In production, this would integrate with Stripe, PayPal, etc.
@@ -51,6 +153,8 @@ def process_payment(
     Args:
         reservation_id: The reservation ID to pay for (e.g., 'RES-2025-ABCD1234')
         payment_method: Payment method - 'card', 'paypal', or 'bank_transfer' (default: 'card')
+        idempotency_key: Optional key identifying this payment attempt
+            (default: one key per reservation)
 
     Returns:
         Dictionary with payment result and updated reservation status
@@ -59,38 +163,27 @@ def process_payment(
     db = _get_db()
 
     # Validate payment method
-    valid_methods = [m.value for m in PaymentMethod]
-    if payment_method not in valid_methods:
+    if payment_method not in _VALID_PAYMENT_METHODS:
         return {
             "status": "error",
-            "message": f"Invalid payment method. Valid options: {', '.join(valid_methods)}",
+            "message": f"Invalid payment method. Valid options: {_VALID_PAYMENT_METHODS_STR}",
         }
 
-    # Get reservation
-    reservation = db.get_item("reservations", {"reservation_id": reservation_id})
-
-    if not reservation:
-        error = ToolError.from_code(
-            ErrorCode.RESERVATION_NOT_FOUND,
-            details={"reservation_id": reservation_id},
-        )
-        return error.model_dump()
-
-    # Check if already paid
-    if reservation.get("payment_status") == PaymentStatus.PAID.value:
-        error = ToolError.from_code(
-            ErrorCode.PAYMENT_FAILED,
-            details={"reason": "already_paid", "reservation_id": reservation_id},
-        )
-        return error.model_dump()
-
-    # Check reservation status
-    if reservation.get("status") == ReservationStatus.CANCELLED.value:
-        error = ToolError.from_code(
-            ErrorCode.UNAUTHORIZED,
-            details={"reason": "reservation_cancelled", "reservation_id": reservation_id},
-        )
-        return error.model_dump()
+    # Read the reservation for the amount to charge. TransactWriteItems cannot
+    # return values on success, so this is the only read; the status checks
+    # are enforced again by the transaction's conditions. Consistent so a
+    # just-modified total is never charged from a stale copy.
+    reservation = db.get_item(
+        "reservations", {"reservation_id": reservation_id}, consistent_read=True
+    )
+    idempotency_key = idempotency_key or f"pay:{reservation_id}"
+    request_hash = _payment_request_hash(reservation_id, payment_method)
+    replayed = _replayed_payment(reservation, idempotency_key, request_hash)
+    if replayed is not None:
+        return replayed
+    conflict = _payment_conflict(reservation_id, reservation)
+    if conflict is not None:
+        return conflict
 
     # Get amount to charge
     amount_cents = int(reservation["total_amount"])
@@ -99,6 +192,7 @@ def process_payment(
     # Generate transaction ID
     transaction_id = _generate_transaction_id()
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     # MOCK: Simulate payment processing
     # In production, call Stripe/PayPal API here
@@ -122,27 +216,11 @@ def process_payment(
         "payment_method": payment_method,
         "provider": PaymentProvider.MOCK.value,
         "status": TransactionStatus.COMPLETED.value,
-        "created_at": now.isoformat(),
-        "completed_at": now.isoformat(),
+        "created_at": now_iso,
+        "completed_at": now_iso,
     }
 
-    # Store payment record
-    db.put_item("payments", payment_record)
-
-    # Update reservation status
-    db.update_item(
-        "reservations",
-        {"reservation_id": reservation_id},
-        "SET #status = :confirmed, payment_status = :paid, updated_at = :now",
-        {
-            ":confirmed": ReservationStatus.CONFIRMED.value,
-            ":paid": PaymentStatus.PAID.value,
-            ":now": now.isoformat(),
-        },
-        expression_attribute_names={"#status": "status"},
-    )
-
-    return {
+    result = {
         "status": "success",
         "transaction_id": transaction_id,
         "reservation_id": reservation_id,
@@ -153,6 +231,70 @@ def process_payment(
         "payment_status": PaymentStatus.PAID.value,
         "message": f"Payment of €{amount_eur:.2f} processed successfully! Your reservation {reservation_id} is now confirmed. You will receive a confirmation email shortly.",
     }
+    # Stored with the confirmation, in the same transaction, for replaying
+    idempotency_record = {
+        "key": idempotency_key,
+        "request_hash": request_hash,
+        "response": json.dumps(result),
+        "expires_at": int(now.timestamp()) + _IDEMPOTENCY_WINDOW_SECONDS,
+    }
+
+    # Store the payment and confirm the reservation in one atomic round trip.
+    # The conditions guard against a cancellation or payment landing between
+    # the read above and this write.
+    transact_items: list[dict[str, Any]] = [
+        {
+            "Put": {
+                "TableName": db._table_name("payments"),
+                "Item": {k: _serializer.serialize(v) for k, v in payment_record.items()},
+                "ConditionExpression": "attribute_not_exists(payment_id)",
+            }
+        },
+        {
+            "Update": {
+                "TableName": db._table_name("reservations"),
+                "Key": {"reservation_id": {"S": reservation_id}},
+                "UpdateExpression": (
+                    "SET #s = :confirmed, payment_status = :paid, updated_at = :now,"
+                    " payment_idempotency = :idempotency"
+                ),
+                "ConditionExpression": (
+                    "attribute_exists(reservation_id)"
+                    " AND #s <> :cancelled AND payment_status <> :paid"
+                ),
+                "ExpressionAttributeNames": {"#s": "status"},
+                "ExpressionAttributeValues": {
+                    ":confirmed": {"S": ReservationStatus.CONFIRMED.value},
+                    ":cancelled": {"S": ReservationStatus.CANCELLED.value},
+                    ":paid": {"S": PaymentStatus.PAID.value},
+                    ":now": {"S": now_iso},
+                    ":idempotency": _serializer.serialize(idempotency_record),
+                },
+                "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+            }
+        },
+    ]
+
+    reasons: list[str] = []
+    cancelled_items: list[dict[str, Any] | None] = []
+    if not db.transact_write(transact_items, reasons, cancelled_items):
+        # The reservation changed since the read: report what it is now
+        if reasons[1:2] == ["ConditionalCheckFailed"]:
+            # A concurrent retry of this same request may have won the race
+            replayed = _replayed_payment(cancelled_items[1], idempotency_key, request_hash)
+            if replayed is not None:
+                return replayed
+            conflict = _payment_conflict(reservation_id, cancelled_items[1])
+            if conflict is not None:
+                return conflict
+        error = ToolError.from_code(
+            ErrorCode.PAYMENT_FAILED,
+            details={"reason": "reservation_changed", "reservation_id": reservation_id},
+        )
+        return error.model_dump()
+
+    invalidate_payment_status_cache(reservation_id)
+    return result
 
 
 @tool
@@ -169,6 +311,11 @@ def get_payment_status(reservation_id: str) -> dict[str, Any]:
         Dictionary with payment status information
     """
     logger.info("get_payment_status called", extra={"reservation_id": reservation_id})
+    now = time.monotonic()
+    entry = _payment_status_cache.get(reservation_id)
+    if entry is not None and entry[0] > now:
+        return dict(entry[1])
+
     db = _get_db()
 
     # Get reservation
@@ -185,22 +332,18 @@ def get_payment_status(reservation_id: str) -> dict[str, Any]:
     reservation_status = reservation.get("status", ReservationStatus.PENDING.value)
     amount_eur = int(reservation["total_amount"]) / 100
 
-    # Get payment record if exists
-    # In production, query by reservation_id GSI
+    # Only a paid reservation has a completed payment worth looking up. The
+    # index has no sort key, so pick the completed record rather than
+    # whichever comes first (failed attempts share the reservation_id).
     payment_info = None
-    try:
-        # Simple scan for demo - use GSI in production
-        from boto3.dynamodb.conditions import Key
-
+    if payment_status == PaymentStatus.PAID.value:
         payments = db.query(
             "payments",
             Key("reservation_id").eq(reservation_id),
             index_name="reservation-index",
+            projection_expression="transaction_id, completed_at",
         )
-        if payments:
-            payment_info = payments[0]
-    except Exception:
-        pass
+        payment_info = next((p for p in payments if p.get("completed_at")), None)
 
     result: dict[str, Any] = {
         "status": "success",
@@ -222,7 +365,17 @@ def get_payment_status(reservation_id: str) -> dict[str, Any]:
         result["message"] = "Payment has been refunded."
         result["refund_amount_eur"] = int(reservation.get("refund_amount", 0)) / 100
 
-    return result
+    # Misses are not cached so a reservation created just now is found
+    with _payment_status_cache_lock:
+        full = len(_payment_status_cache) >= _PAYMENT_STATUS_CACHE_MAX_ENTRIES
+        if full and reservation_id not in _payment_status_cache:
+            # Evict the oldest insertion
+            del _payment_status_cache[next(iter(_payment_status_cache))]
+        _payment_status_cache[reservation_id] = (
+            now + _PAYMENT_STATUS_CACHE_TTL_SECONDS,
+            result,
+        )
+    return dict(result)
 
 
 @tool
@@ -243,32 +396,6 @@ def retry_payment(
         Dictionary with payment result
     """
     logger.info("retry_payment called", extra={"reservation_id": reservation_id, "payment_method": payment_method})
-    # This essentially calls process_payment but with explicit retry semantics
-    db = _get_db()
-
-    # Check if reservation exists and is in retryable state
-    reservation = db.get_item("reservations", {"reservation_id": reservation_id})
-
-    if not reservation:
-        error = ToolError.from_code(
-            ErrorCode.RESERVATION_NOT_FOUND,
-            details={"reservation_id": reservation_id},
-        )
-        return error.model_dump()
-
-    if reservation.get("payment_status") == PaymentStatus.PAID.value:
-        error = ToolError.from_code(
-            ErrorCode.PAYMENT_FAILED,
-            details={"reason": "already_paid", "reservation_id": reservation_id},
-        )
-        return error.model_dump()
-
-    if reservation.get("status") == ReservationStatus.CANCELLED.value:
-        error = ToolError.from_code(
-            ErrorCode.UNAUTHORIZED,
-            details={"reason": "reservation_cancelled", "reservation_id": reservation_id},
-        )
-        return error.model_dump()
-
-    # Delegate to process_payment
+    # process_payment checks the reservation is still payable, both before
+    # and atomically with the write, so there is nothing to pre-check here
     return process_payment(reservation_id, payment_method)
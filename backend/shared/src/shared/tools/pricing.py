@@ -4,32 +4,92 @@ These tools allow the booking agent to get pricing information,
 calculate totals, explain seasonal variations, and validate minimum stays.
 """
 
+import bisect
 import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from boto3.dynamodb.conditions import Key
 from strands import tool
 
-logger = logging.getLogger(__name__)
-
 from shared.models.errors import ErrorCode, ToolError
 from shared.models.pricing import Pricing
 from shared.services.dynamodb import get_dynamodb_service
 
+logger = logging.getLogger(__name__)
+
 
 # Season categorization thresholds (rates in cents)
 LOW_SEASON_MAX_RATE = 10000  # €100 or less is low season
 HIGH_SEASON_MIN_RATE = 14000  # €140 or more is high/peak season
 
+# In-process cache of active seasons. The pricing table is tiny and rarely
+# changes, so every tool call reuses one query result for up to a minute.
+# Failed queries are cached briefly so transient errors don't pin the fallback.
+# Entries are (expires_at, seasons sorted by start_date, lookup start dates,
+# parallel lookup seasons); see _build_season_index.
+_SEASONS_CACHE_TTL_SECONDS = 60.0
+_SEASONS_ERROR_TTL_SECONDS = 5.0
+_seasons_cache: tuple[float, Sequence[Pricing], Sequence[date], Sequence[Pricing]] | None = None
+
+# Shared (immutable) result for a failed season query
+_EMPTY_SEASONS: tuple[Pricing, ...] = ()
+_EMPTY_STARTS: tuple[date, ...] = ()
+
+# Only the season attributes the tools read
+_SEASON_PROJECTION = (
+    "season_id, season_name, start_date, end_date, nightly_rate, minimum_nights, cleaning_fee"
+)
+
+# get_seasonal_rates payload when no seasons are configured (built once)
+_DEFAULT_SEASONAL_RATES_RESPONSE: dict[str, Any] = {
+    "status": "success",
+    "seasons": [
+        {
+            "name": "Low Season",
+            "period": "November - March (excluding Christmas/New Year)",
+            "nightly_rate_eur": 100.00,
+            "minimum_nights": 3,
+        },
+        {
+            "name": "Mid Season",
+            "period": "April - June, September - October",
+            "nightly_rate_eur": 120.00,
+            "minimum_nights": 5,
+        },
+        {
+            "name": "High Season",
+            "period": "July - August",
+            "nightly_rate_eur": 150.00,
+            "minimum_nights": 7,
+        },
+        {
+            "name": "Peak Season",
+            "period": "Christmas, New Year, Easter",
+            "nightly_rate_eur": 180.00,
+            "minimum_nights": 7,
+        },
+    ],
+    "cleaning_fee_eur": 50.00,
+    "message": "Our rates vary by season. Low season offers the best value at €100/night, while peak periods are €180/night. All stays include a €50 cleaning fee.",
+}
+
 
 def _get_db():
     """Get shared DynamoDB service instance (singleton for performance)."""
     return get_dynamodb_service()
 
 
+@lru_cache(maxsize=512)
 def _parse_date(date_str: str) -> date:
     """Parse date string in YYYY-MM-DD format."""
+    # Fast path for the canonical form; date() still validates month/day ranges
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
@@ -39,39 +99,32 @@ def _get_applicable_pricing(check_in: date, check_out: date) -> Pricing | None:
     For simplicity, we use the pricing that applies to the check-in date.
     In a more complex system, you might prorate across multiple seasons.
     """
-    db = _get_db()
+    return _get_all_seasons_and_applicable(check_in)[1]
 
-    # Query all active pricing records
-    # In production, you'd use a more efficient query with GSI
-    items = db.query(
-        "pricing",
-        Key("is_active").eq("true"),
-        index_name="active-index",
-    )
 
-    check_in_str = check_in.isoformat()
+def _get_all_seasons_and_applicable(check_in: date) -> tuple[Sequence[Pricing], Pricing | None]:
+    """Get all active seasons and the one containing check_in from a single lookup.
 
-    for item in items:
-        start = item.get("start_date", "")
-        end = item.get("end_date", "")
-        if start <= check_in_str <= end:
-            return Pricing(
-                season_id=item["season_id"],
-                season_name=item["season_name"],
-                start_date=_parse_date(item["start_date"]),
-                end_date=_parse_date(item["end_date"]),
-                nightly_rate=int(item["nightly_rate"]),
-                minimum_nights=int(item["minimum_nights"]),
-                cleaning_fee=int(item["cleaning_fee"]),
-                is_active=True,
-            )
+    Tools that need both (get_pricing, get_minimum_stay_info) use this so the
+    season list is fetched once per call.
+    """
+    seasons, starts, indexed = _get_sorted_seasons()
+    # Last season starting on or before check-in is the only candidate
+    idx = bisect.bisect_right(starts, check_in) - 1
+    if idx >= 0 and indexed[idx].end_date >= check_in:
+        return seasons, indexed[idx]
 
-    return None
+    return seasons, None
 
 
 def _get_default_pricing() -> Pricing:
     """Return default pricing when no seasonal pricing is configured."""
-    today = date.today()
+    return _default_pricing_for(date.today())
+
+
+@lru_cache(maxsize=1)
+def _default_pricing_for(today: date) -> Pricing:
+    """Build the default pricing anchored at today (rebuilt once per day)."""
     return Pricing(
         season_id="default",
         season_name="Standard Season",
@@ -84,17 +137,69 @@ def _get_default_pricing() -> Pricing:
     )
 
 
-def _get_all_seasons() -> list[Pricing]:
-    """Get all active pricing seasons for comparison."""
+def _get_all_seasons() -> Sequence[Pricing]:
+    """Get all active pricing seasons, sorted by start date."""
+    return _get_sorted_seasons()[0]
+
+
+def _build_season_index(
+    seasons: Sequence[Pricing],
+) -> tuple[Sequence[date], Sequence[Pricing]]:
+    """Build the (start date, season) lookup lists bisected by check-in date.
+
+    Seasons should not overlap. If they do, the earliest-starting season keeps
+    the shared dates: a later season is indexed from the day after the seasons
+    before it end, and one that falls entirely within them is left out.
+
+    Args:
+        seasons: Active seasons sorted by start date
+    """
+    starts: list[date] = []
+    indexed: list[Pricing] = []
+    covered_until: date | None = None
+    for season in seasons:
+        start = season.start_date
+        if covered_until is not None and start <= covered_until:
+            logger.warning("Pricing season %s overlaps an earlier season", season.season_id)
+            if season.end_date <= covered_until:
+                continue
+            start = covered_until + timedelta(days=1)
+        starts.append(start)
+        indexed.append(season)
+        covered_until = season.end_date
+    return starts, indexed
+
+
+def _get_sorted_seasons() -> tuple[Sequence[Pricing], Sequence[date], Sequence[Pricing]]:
+    """Get active seasons sorted by start date plus their bisect lookup lists.
+
+    Results are cached in-process for _SEASONS_CACHE_TTL_SECONDS
+    (_SEASONS_ERROR_TTL_SECONDS when the query fails).
+    """
+    global _seasons_cache
+    now = time.monotonic()
+    if _seasons_cache is not None and now < _seasons_cache[0]:
+        return _seasons_cache[1], _seasons_cache[2], _seasons_cache[3]
+
     db = _get_db()
     try:
+        # active-index is keyed (is_active, start_date), so DynamoDB does the
+        # filtering and returns seasons already in start_date order
         items = db.query(
             "pricing",
             Key("is_active").eq("true"),
             index_name="active-index",
+            projection_expression=_SEASON_PROJECTION,
         )
     except Exception:
-        items = []
+        _seasons_cache = (
+            now + _SEASONS_ERROR_TTL_SECONDS,
+            _EMPTY_SEASONS,
+            _EMPTY_STARTS,
+            _EMPTY_SEASONS,
+        )
+        _cached_quote.cache_clear()
+        return _EMPTY_SEASONS, _EMPTY_STARTS, _EMPTY_SEASONS
 
     seasons = []
     for item in items:
@@ -110,10 +215,78 @@ def _get_all_seasons() -> list[Pricing]:
                 is_active=True,
             )
         )
-    return sorted(seasons, key=lambda s: s.start_date)
+    seasons.sort(key=lambda s: s.start_date)
+    starts, indexed = _build_season_index(seasons)
+    _seasons_cache = (now + _SEASONS_CACHE_TTL_SECONDS, seasons, starts, indexed)
+    # Quotes were computed from the previous season list
+    _cached_quote.cache_clear()
+    return seasons, starts, indexed
+
+
+def reset_seasons_cache() -> None:
+    """Drop cached pricing seasons and quotes (for testing or after pricing updates)."""
+    global _seasons_cache
+    _seasons_cache = None
+    _cached_quote.cache_clear()
+
 
+@dataclass(frozen=True, slots=True)
+class _Quote:
+    """Price quote for a stay, shared by the pricing tools."""
 
-def _get_seasonal_context(current_rate: int, seasons: list[Pricing]) -> dict[str, Any]:
+    start: date
+    end: date
+    nights: int
+    pricing: Pricing
+    all_seasons: Sequence[Pricing]
+    subtotal: int
+    total: int
+
+
+def _compute_quote(check_in: str, check_out: str) -> _Quote:
+    """Compute (or reuse) the quote for a stay.
+
+    Agents often chain check_minimum_stay -> get_pricing -> calculate_total for
+    the same dates, so quotes are memoized until the season cache refreshes.
+
+    Raises:
+        ValueError: If either date is not in YYYY-MM-DD format
+    """
+    # Refreshes the season cache when stale, which also invalidates quotes
+    _get_sorted_seasons()
+    return _cached_quote(check_in, check_out)
+
+
+@lru_cache(maxsize=256)
+def _cached_quote(check_in: str, check_out: str) -> _Quote:
+    """Build a quote from the cached seasons (see _compute_quote)."""
+    start = _parse_date(check_in)
+    end = _parse_date(check_out)
+    nights = (end - start).days
+
+    all_seasons, pricing = _get_all_seasons_and_applicable(start)
+    if pricing is None:
+        pricing = _get_default_pricing()
+
+    subtotal = pricing.nightly_rate * nights
+    return _Quote(
+        start=start,
+        end=end,
+        nights=nights,
+        pricing=pricing,
+        all_seasons=all_seasons,
+        subtotal=subtotal,
+        total=subtotal + pricing.cleaning_fee,
+    )
+
+
+@lru_cache(maxsize=64)
+def _season_period_label(start: date, end: date) -> str:
+    """Format a season's period as 'Mon DD - Mon DD' (cached; seasons rarely change)."""
+    return f"{start.strftime('%b %d')} - {end.strftime('%b %d')}"
+
+
+def _get_seasonal_context(current_rate: int, seasons: Sequence[Pricing]) -> dict[str, Any]:
     """Generate context about how current rate compares to other seasons.
 
     Args:
@@ -130,9 +303,16 @@ def _get_seasonal_context(current_rate: int, seasons: list[Pricing]) -> dict[str
             "savings_tip": "",
         }
 
-    rates = [s.nightly_rate for s in seasons]
-    min_rate = min(rates)
-    max_rate = max(rates)
+    # Single pass for min/max rate and the (first) cheapest season
+    cheapest_season = seasons[0]
+    min_rate = max_rate = cheapest_season.nightly_rate
+    for season in seasons:
+        rate = season.nightly_rate
+        if rate < min_rate:
+            min_rate = rate
+            cheapest_season = season
+        elif rate > max_rate:
+            max_rate = rate
 
     # Categorize the current rate
     if current_rate <= LOW_SEASON_MAX_RATE:
@@ -142,15 +322,14 @@ def _get_seasonal_context(current_rate: int, seasons: list[Pricing]) -> dict[str
     else:
         rate_category = "mid"
 
-    # Find cheapest season for savings tip
-    cheapest_season = min(seasons, key=lambda s: s.nightly_rate)
+    # Savings tip points at the cheapest season
     savings_tip = ""
     if current_rate > min_rate:
         savings_per_night = (current_rate - min_rate) / 100
+        period = _season_period_label(cheapest_season.start_date, cheapest_season.end_date)
         savings_tip = (
             f"Tip: You could save €{savings_per_night:.0f}/night by booking during "
-            f"{cheapest_season.season_name} ({cheapest_season.start_date.strftime('%b %d')} - "
-            f"{cheapest_season.end_date.strftime('%b %d')})."
+            f"{cheapest_season.season_name} ({period})."
         )
 
     # Generate comparison note
@@ -187,26 +366,21 @@ def get_pricing(check_in: str, check_out: str) -> dict[str, Any]:
     """
     logger.info("get_pricing called", extra={"check_in": check_in, "check_out": check_out})
     try:
-        start_date = _parse_date(check_in)
-        end_date = _parse_date(check_out)
+        quote = _compute_quote(check_in, check_out)
     except ValueError:
         return {
             "status": "error",
             "message": "Invalid date format. Please use YYYY-MM-DD format.",
         }
 
-    if end_date <= start_date:
+    if quote.nights <= 0:
         return {
             "status": "error",
             "message": "Check-out date must be after check-in date.",
         }
 
-    nights = (end_date - start_date).days
-
-    # Get applicable pricing
-    pricing = _get_applicable_pricing(start_date, end_date)
-    if pricing is None:
-        pricing = _get_default_pricing()
+    nights = quote.nights
+    pricing = quote.pricing
 
     # Check minimum nights
     if nights < pricing.minimum_nights:
@@ -220,13 +394,11 @@ def get_pricing(check_in: str, check_out: str) -> dict[str, Any]:
         )
         return error.model_dump()
 
-    # Calculate total
-    subtotal = pricing.nightly_rate * nights
-    total = subtotal + pricing.cleaning_fee
+    subtotal = quote.subtotal
+    total = quote.total
 
     # Get seasonal context for enhanced response (T073)
-    all_seasons = _get_all_seasons()
-    seasonal_context = _get_seasonal_context(pricing.nightly_rate, all_seasons)
+    seasonal_context = _get_seasonal_context(pricing.nightly_rate, quote.all_seasons)
 
     # Build the response message with seasonal context
     base_message = (
@@ -283,26 +455,21 @@ def calculate_total(
     """
     logger.info("calculate_total called", extra={"check_in": check_in, "check_out": check_out, "include_breakdown": include_breakdown})
     try:
-        start_date = _parse_date(check_in)
-        end_date = _parse_date(check_out)
+        quote = _compute_quote(check_in, check_out)
     except ValueError:
         return {
             "status": "error",
             "message": "Invalid date format. Please use YYYY-MM-DD format.",
         }
 
-    if end_date <= start_date:
+    if quote.nights <= 0:
         return {
             "status": "error",
             "message": "Check-out date must be after check-in date.",
         }
 
-    nights = (end_date - start_date).days
-
-    # Get applicable pricing
-    pricing = _get_applicable_pricing(start_date, end_date)
-    if pricing is None:
-        pricing = _get_default_pricing()
+    nights = quote.nights
+    pricing = quote.pricing
 
     # Check minimum nights
     if nights < pricing.minimum_nights:
@@ -315,9 +482,8 @@ def calculate_total(
         )
         return error.model_dump()
 
-    # Calculate amounts
-    subtotal = pricing.nightly_rate * nights
-    total = subtotal + pricing.cleaning_fee
+    subtotal = quote.subtotal
+    total = quote.total
 
     result: dict[str, Any] = {
         "status": "success",
@@ -367,44 +533,15 @@ def get_seasonal_rates() -> dict[str, Any]:
             "pricing",
             Key("is_active").eq("true"),
             index_name="active-index",
+            projection_expression=_SEASON_PROJECTION,
         )
     except Exception:
         # If query fails (e.g., index doesn't exist), return defaults
         items = []
 
     if not items:
-        # Return default seasonal structure
-        return {
-            "status": "success",
-            "seasons": [
-                {
-                    "name": "Low Season",
-                    "period": "November - March (excluding Christmas/New Year)",
-                    "nightly_rate_eur": 100.00,
-                    "minimum_nights": 3,
-                },
-                {
-                    "name": "Mid Season",
-                    "period": "April - June, September - October",
-                    "nightly_rate_eur": 120.00,
-                    "minimum_nights": 5,
-                },
-                {
-                    "name": "High Season",
-                    "period": "July - August",
-                    "nightly_rate_eur": 150.00,
-                    "minimum_nights": 7,
-                },
-                {
-                    "name": "Peak Season",
-                    "period": "Christmas, New Year, Easter",
-                    "nightly_rate_eur": 180.00,
-                    "minimum_nights": 7,
-                },
-            ],
-            "cleaning_fee_eur": 50.00,
-            "message": "Our rates vary by season. Low season offers the best value at €100/night, while peak periods are €180/night. All stays include a €50 cleaning fee.",
-        }
+        # Return default seasonal structure (shallow copy keeps callers isolated)
+        return dict(_DEFAULT_SEASONAL_RATES_RESPONSE)
 
     # Format actual pricing data
     seasons = []
@@ -446,31 +583,27 @@ def check_minimum_stay(check_in: str, check_out: str) -> dict[str, Any]:
     """
     logger.info("check_minimum_stay called", extra={"check_in": check_in, "check_out": check_out})
     try:
-        start_date = _parse_date(check_in)
-        end_date = _parse_date(check_out)
+        quote = _compute_quote(check_in, check_out)
     except ValueError:
         return {
             "status": "error",
             "message": "Invalid date format. Please use YYYY-MM-DD format.",
         }
 
-    if end_date <= start_date:
+    if quote.nights <= 0:
         return {
             "status": "error",
             "message": "Check-out date must be after check-in date.",
         }
 
-    nights = (end_date - start_date).days
-
-    # Get applicable pricing for the check-in date
-    pricing = _get_applicable_pricing(start_date, end_date)
-    if pricing is None:
-        pricing = _get_default_pricing()
+    nights = quote.nights
+    pricing = quote.pricing
 
-    # Check if minimum nights requirement is met
-    meets_minimum = nights >= pricing.minimum_nights
+    # Nights still missing to meet the season minimum (<= 0 means the stay is valid);
+    # the suggestion date is only built on the invalid path
+    additional_nights = pricing.minimum_nights - nights
 
-    if meets_minimum:
+    if additional_nights <= 0:
         return {
             "status": "success",
             "is_valid": True,
@@ -482,25 +615,23 @@ def check_minimum_stay(check_in: str, check_out: str) -> dict[str, Any]:
                 f"The minimum for {pricing.season_name} is {pricing.minimum_nights} nights."
             ),
         }
-    else:
-        # Calculate how many more nights needed
-        additional_nights = pricing.minimum_nights - nights
-        suggested_checkout = end_date + timedelta(days=additional_nights)
 
-        return {
-            "status": "error",
-            "is_valid": False,
-            "nights_requested": nights,
-            "minimum_nights_required": pricing.minimum_nights,
-            "additional_nights_needed": additional_nights,
-            "season_name": pricing.season_name,
-            "suggested_checkout": suggested_checkout.isoformat(),
-            "message": (
-                f"The minimum stay during {pricing.season_name} is {pricing.minimum_nights} nights. "
-                f"You've selected {nights} night(s). Please add {additional_nights} more night(s), "
-                f"or consider a checkout date of {suggested_checkout.strftime('%B %d, %Y')}."
-            ),
-        }
+    suggested_checkout = quote.end + timedelta(days=additional_nights)
+
+    return {
+        "status": "error",
+        "is_valid": False,
+        "nights_requested": nights,
+        "minimum_nights_required": pricing.minimum_nights,
+        "additional_nights_needed": additional_nights,
+        "season_name": pricing.season_name,
+        "suggested_checkout": suggested_checkout.isoformat(),
+        "message": (
+            f"The minimum stay during {pricing.season_name} is {pricing.minimum_nights} nights. "
+            f"You've selected {nights} night(s). Please add {additional_nights} more night(s), "
+            f"or consider a checkout date of {suggested_checkout.strftime('%B %d, %Y')}."
+        ),
+    }
 
 
 @tool
@@ -525,12 +656,11 @@ def get_minimum_stay_info(target_date: str) -> dict[str, Any]:
             "message": "Invalid date format. Please use YYYY-MM-DD format.",
         }
 
-    pricing = _get_applicable_pricing(check_date, check_date + timedelta(days=1))
+    # Get applicable pricing and all seasons (to show comparison) in one lookup
+    all_seasons, pricing = _get_all_seasons_and_applicable(check_date)
     if pricing is None:
         pricing = _get_default_pricing()
 
-    # Get all seasons to show comparison
-    all_seasons = _get_all_seasons()
     season_minimums = [
         {"season": s.season_name, "minimum_nights": s.minimum_nights}
         for s in all_seasons
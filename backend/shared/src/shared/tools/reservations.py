@@ -12,29 +12,41 @@ Authentication Architecture (Spec 005 - AgentCore Identity OAuth2):
 - Tools are decorated with @requires_access_token(auth_flow="USER_FEDERATION")
 - Decorator checks TokenVault for existing token
 - If no token, decorator generates authorization URL via on_auth_url callback
-- Authorization URL is streamed to user via shared auth queue
+- Authorization URL is passed to the handler registered via set_auth_url_handler()
 - User completes OAuth2 login (Amplify EMAIL_OTP) in browser
 - Frontend callback page calls CompleteResourceTokenAuth to bind token
 - Decorator polling succeeds, tool executes with injected access_token
 - Tool extracts cognito_sub/email from JWT to scope DynamoDB queries
 
-The auth URL queue is set by the entrypoint (agent_app.py) at invocation start.
+The entrypoint (agent/main.py) registers the handler at invocation start. The
+handler puts an auth_required event on the queue that merges it with the agent's
+stream, which runs in a TaskGroup so the auth URL reaches the client while the
+decorator polls for the token.
 """
 
 import asyncio
+import base64
+import binascii
+import json
 import logging
 import os
-import uuid
-from datetime import UTC, date, datetime, timedelta
+import secrets
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from enum import Enum
 from typing import Any
 
 from bedrock_agentcore.identity import requires_access_token
+from botocore.exceptions import ClientError
 from strands import ToolContext, tool
 
 from shared.models.enums import AvailabilityStatus, PaymentStatus, ReservationStatus
 from shared.models.errors import ErrorCode, ToolError
 from shared.models.reservation import Reservation
+from shared.services.customer_cache import get_customer_cached
 from shared.services.dynamodb import DynamoDBService, get_dynamodb_service
+from shared.tools.payments import invalidate_payment_status_cache
 from shared.utils.jwt import extract_cognito_claims, extract_cognito_sub
 
 logger = logging.getLogger(__name__)
@@ -43,41 +55,43 @@ logger = logging.getLogger(__name__)
 # AgentCore Identity OAuth2 Configuration
 # -----------------------------------------------------------------------------
 
-# Shared queue for streaming auth URLs to the entrypoint
-# Set by agent_app.py at invocation start via set_auth_url_queue()
-_auth_url_queue: asyncio.Queue[str] | None = None
+# Handler for streaming auth URLs to the entrypoint
+# Set by agent/main.py at invocation start via set_auth_url_handler()
+_auth_url_handler: Callable[[str], None] | None = None
 
 
-def set_auth_url_queue(queue: asyncio.Queue[str] | None) -> None:
-    """Set the shared queue for streaming auth URLs to the entrypoint.
+def set_auth_url_handler(handler: Callable[[str], None] | None) -> None:
+    """Set the handler that streams auth URLs to the entrypoint.
 
-    Called by agent_app.py at the start of each invocation to enable
-    auth URL streaming from @requires_access_token callbacks.
+    Called by agent/main.py at the start of each invocation to enable
+    auth URL streaming from @requires_access_token callbacks. The handler
+    runs on the event loop and must not block; the entrypoint uses it to
+    put an auth_required event on its merged event queue.
 
     Args:
-        queue: asyncio.Queue to put auth URLs into, or None to disable
+        handler: Callable receiving the authorization URL, or None to disable
     """
-    global _auth_url_queue
-    _auth_url_queue = queue
+    global _auth_url_handler
+    _auth_url_handler = handler
 
 
 async def _handle_auth_url(url: str) -> None:
     """Callback for @requires_access_token to stream auth URL to client.
 
     This is called by the decorator when user consent is needed for OAuth2.
-    The URL is put into the shared queue, which the entrypoint yields to
-    the client as an auth event.
+    The URL is passed to the registered handler, which streams it to the
+    client as an auth event.
 
     Args:
         url: Authorization URL for user to complete OAuth2 login
     """
     logger.info("[OAUTH2_AUTH_URL] _handle_auth_url CALLED with URL: %s", url[:100] if url else "(empty)")
-    if _auth_url_queue is not None:
-        logger.info("[OAUTH2_AUTH_URL] Streaming auth URL to client (queue available)")
-        await _auth_url_queue.put(url)
+    if _auth_url_handler is not None:
+        logger.info("[OAUTH2_AUTH_URL] Streaming auth URL to client (handler available)")
+        _auth_url_handler(url)
     else:
         # Fallback: log the URL (shouldn't happen in production)
-        logger.warning("[OAUTH2_AUTH_URL] Auth URL generated but no queue available: %s", url[:100])
+        logger.warning("[OAUTH2_AUTH_URL] Auth URL generated but no handler available: %s", url[:100])
 
 
 # OAuth2 configuration from environment (set by Terraform)
@@ -104,40 +118,226 @@ if not OAUTH2_CALLBACK_URL:
     )
 
 
+# Most recent reservations returned per get_my_reservations call
+_MY_RESERVATIONS_PAGE_SIZE = 20
+
+# DynamoDB accepts at most 100 actions per TransactWriteItems call
+_MAX_TRANSACT_ITEMS = 100
+
+# In-flight chunked writes per call, well under the DynamoDB client's 64-connection pool
+_MAX_CONCURRENT_WRITES = 10
+
+# Static parts of availability transaction items, shared by every item
+# (boto3 only reads them). Only the per-date fields are built per night.
+_AVAILABLE_AV = {"S": AvailabilityStatus.AVAILABLE.value}
+_BOOKED_AV = {"S": AvailabilityStatus.BOOKED.value}
+# Only book a date that is available or has no availability record yet
+_BOOK_IF_AVAILABLE: dict[str, Any] = {
+    "ConditionExpression": "attribute_not_exists(#s) OR #s = :available",
+    "ExpressionAttributeNames": {"#s": "status"},
+    "ExpressionAttributeValues": {":available": _AVAILABLE_AV},
+}
+
+
 def _get_db() -> DynamoDBService:
     """Get shared DynamoDB service instance (singleton for performance)."""
     return get_dynamodb_service()
 
 
+# Concurrent get_reservation reads are coalesced into one BatchGetItem when
+# they arrive within this window, up to this many keys per batch
+_RESERVATION_BATCH_WINDOW_SECONDS = 0.005
+_RESERVATION_BATCH_MAX_KEYS = 25
+
+
+class _ReservationBatcher:
+    """Coalesce concurrent reservation reads into BatchGetItem calls.
+
+    Bound to the event loop it was created on; see _get_reservation_batcher.
+    """
+
+    def __init__(self, db: DynamoDBService) -> None:
+        self.db = db
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def get(self, reservation_id: str) -> asyncio.Future[dict[str, Any] | None]:
+        """Queue a read; the future resolves to the item, or None if not found."""
+        future: asyncio.Future[dict[str, Any] | None] = self.loop.create_future()
+        self._pending.setdefault(reservation_id, []).append(future)
+        if len(self._pending) >= _RESERVATION_BATCH_MAX_KEYS:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(
+                _RESERVATION_BATCH_WINDOW_SECONDS, self._flush
+            )
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        task = self.loop.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self, batch: dict[str, list[asyncio.Future[dict[str, Any] | None]]]
+    ) -> None:
+        try:
+            if len(batch) == 1:
+                # A lone read needs no batching
+                (reservation_id,) = batch
+                item = await asyncio.to_thread(
+                    self.db.get_item, "reservations", {"reservation_id": reservation_id}
+                )
+                items = [item] if item else []
+            else:
+                keys = [{"reservation_id": reservation_id} for reservation_id in batch]
+                items = await asyncio.to_thread(self.db.batch_get, "reservations", keys)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        by_id = {item["reservation_id"]: item for item in items}
+        for reservation_id, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(by_id.get(reservation_id))
+
+
+_reservation_batcher: _ReservationBatcher | None = None
+
+
+def _get_reservation_batcher(db: DynamoDBService) -> _ReservationBatcher:
+    """Get the batcher for the running event loop and DynamoDB service."""
+    global _reservation_batcher
+    batcher = _reservation_batcher
+    if batcher is None or batcher.loop is not asyncio.get_running_loop() or batcher.db is not db:
+        batcher = _reservation_batcher = _ReservationBatcher(db)
+    return batcher
+
+
+def _encode_page_token(reservation: dict[str, Any]) -> str:
+    """Encode where the next get_my_reservations page starts as an opaque token.
+
+    Holds the index key of the last reservation returned, minus the
+    customer_id, which is always taken from the caller's own record.
+    """
+    key = {"reservation_id": reservation["reservation_id"], "check_in": reservation["check_in"]}
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_page_token(page_token: str) -> dict[str, str] | None:
+    """Decode a page token from _encode_page_token, or None if it is malformed."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if (
+        not isinstance(key, dict)
+        or set(key) != {"reservation_id", "check_in"}
+        or not all(isinstance(v, str) for v in key.values())
+    ):
+        return None
+    return key
+
+
+def _get_customer_reservations(
+    db: DynamoDBService, cognito_sub: str, start_after: dict[str, str] | None = None
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Get a customer and a page of their reservations in one worker-thread hop.
+
+    The reservations query needs the customer_id, so the two reads cannot be
+    coalesced into a BatchGetItem; the cached customer lookup leaves a warm
+    call with a single round-trip. One reservation past the page is read so
+    the caller knows whether another page exists.
+    """
+    customer = get_customer_cached(db, cognito_sub)
+    if not customer:
+        return None, []
+    reservations = db.get_reservations_by_customer_id(
+        customer["customer_id"],
+        limit=_MY_RESERVATIONS_PAGE_SIZE + 1,
+        exclusive_start_key=(
+            {**start_after, "customer_id": customer["customer_id"]} if start_after else None
+        ),
+    )
+    return customer, reservations
+
+
 def _parse_date(date_str: str) -> date:
     """Parse date string in YYYY-MM-DD format."""
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
-def _date_range(start: date, end: date) -> list[date]:
-    """Generate list of dates from start to end (exclusive of end)."""
-    dates = []
-    current = start
-    while current < end:
-        dates.append(current)
-        current += timedelta(days=1)
-    return dates
+def _date_range_iso(start: date, end: date) -> list[str]:
+    """Generate YYYY-MM-DD strings from start to end (exclusive of end)."""
+    return [date.fromordinal(o).isoformat() for o in range(start.toordinal(), end.toordinal())]
+
+
+def _range_difference_iso(start: date, end: date, other_start: date, other_end: date) -> list[str]:
+    """Dates in [start, end) that fall outside [other_start, other_end), as ISO strings.
+
+    Stays are contiguous, so this compares day ordinals against the other
+    interval instead of building and diffing two sets of dates.
+    """
+    lo, hi = other_start.toordinal(), other_end.toordinal()
+    return [
+        date.fromordinal(o).isoformat()
+        for o in range(start.toordinal(), end.toordinal())
+        if not lo <= o < hi
+    ]
+
+
+# (UTC day number, year) so reservation IDs don't build a datetime per call
+_year_cache: tuple[int, int] = (-1, 0)
+
+
+def _current_year() -> int:
+    """Get the current UTC year, refreshed at most once per day."""
+    global _year_cache
+    day = int(time.time()) // 86400
+    if day != _year_cache[0]:
+        _year_cache = (day, datetime.now(UTC).year)
+    return _year_cache[1]
 
 
 def _generate_reservation_id() -> str:
     """Generate a unique reservation ID."""
-    year = datetime.now().year
-    unique_part = uuid.uuid4().hex[:8].upper()
+    year = _current_year()
+    unique_part = secrets.token_hex(4).upper()
     return f"RES-{year}-{unique_part}"
 
 
-def _check_dates_available(db: DynamoDBService, dates: list[date]) -> tuple[bool, list[str]]:
-    """Check if all dates are available.
+def _check_dates_available(db: DynamoDBService, dates: list[str]) -> tuple[bool, list[str]]:
+    """Check if all dates (YYYY-MM-DD strings) are available.
 
     Returns tuple of (all_available, list_of_unavailable_dates)
     """
-    keys = [{"date": d.isoformat()} for d in dates]
-    items = db.batch_get("availability", keys)
+    keys = [{"date": d} for d in dates]
+    # Only date and status are read; both are DynamoDB reserved words
+    items = db.batch_get(
+        "availability",
+        keys,
+        projection_expression="#d, #s",
+        expression_attribute_names={"#d": "date", "#s": "status"},
+    )
+    if not items:
+        # Dates without an availability record have never been booked
+        return True, []
+    if len(items) < len(keys):
+        logger.debug(
+            "Availability records missing for %d of %d dates",
+            len(keys) - len(items),
+            len(keys),
+        )
 
     unavailable = []
     for item in items:
@@ -147,6 +347,104 @@ def _check_dates_available(db: DynamoDBService, dates: list[date]) -> tuple[bool
     return len(unavailable) == 0, unavailable
 
 
+async def _transact_write_chunked(
+    db: DynamoDBService, items: list[dict[str, Any]], undo_items: list[dict[str, Any]]
+) -> bool:
+    """Execute transaction items, splitting them past the per-call limit.
+
+    Chunks are written concurrently, at most _MAX_CONCURRENT_WRITES at a
+    time. Each chunk is atomic on its own, so when any chunk fails the chunks
+    that did commit are reverted by writing their undo_items, where
+    undo_items[i] reverses items[i].
+
+    Returns True if every chunk succeeded.
+    """
+    if len(items) <= _MAX_TRANSACT_ITEMS:
+        return await asyncio.to_thread(db.transact_write, items)
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+    async def _write(chunk: list[dict[str, Any]]) -> bool:
+        async with semaphore:
+            return await asyncio.to_thread(db.transact_write, chunk)
+
+    starts = range(0, len(items), _MAX_TRANSACT_ITEMS)
+    results = await asyncio.gather(*(_write(items[i : i + _MAX_TRANSACT_ITEMS]) for i in starts))
+    if all(results):
+        return True
+
+    committed = [i for i, ok in zip(starts, results, strict=True) if ok]
+    undone = await asyncio.gather(
+        *(_write(undo_items[i : i + _MAX_TRANSACT_ITEMS]) for i in committed)
+    )
+    for start, ok in zip(committed, undone, strict=True):
+        if not ok:
+            logger.error(
+                "Failed to roll back transaction items %d-%d",
+                start,
+                min(start + _MAX_TRANSACT_ITEMS, len(items)) - 1,
+            )
+    return False
+
+
+async def _release_dates(
+    db: DynamoDBService, reservation_id: str, dates: list[str], now_iso: str
+) -> list[str]:
+    """Mark a reservation's dates available again.
+
+    Each date is released with its own UpdateItem conditioned on still being
+    held by the reservation (at most _MAX_CONCURRENT_WRITES in flight), so a
+    date someone else has booked since is never freed. Dates that fail that
+    condition are skipped.
+
+    Returns the dates whose release failed for any other reason.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+    values = {
+        ":available": AvailabilityStatus.AVAILABLE.value,
+        ":upd": now_iso,
+        ":rid": reservation_id,
+    }
+
+    async def _release(d: str) -> bool:
+        async with semaphore:
+            try:
+                await asyncio.to_thread(
+                    db.update_item,
+                    "availability",
+                    {"date": d},
+                    "SET #s = :available, updated_at = :upd REMOVE reservation_id",
+                    values,
+                    {"#s": "status"},
+                    "reservation_id = :rid",
+                )
+            except ClientError:
+                return False
+        return True
+
+    results = await asyncio.gather(*(_release(d) for d in dates))
+    return [d for d, ok in zip(dates, results, strict=True) if not ok]
+
+
+def _reservation_to_item(reservation: Reservation) -> dict[str, dict[str, str]]:
+    """Build the low-level DynamoDB item for a reservation in a single pass.
+
+    None fields are omitted; dates and timestamps are stored as ISO strings.
+    """
+    item: dict[str, dict[str, str]] = {}
+    # Python-mode dump keeps enums/dates as objects; exclude_none does the filtering
+    for name, value in reservation.model_dump(exclude_none=True).items():
+        if isinstance(value, Enum):
+            item[name] = {"S": value.value}
+        elif isinstance(value, int):
+            item[name] = {"N": str(value)}
+        elif isinstance(value, date):  # also covers datetime
+            item[name] = {"S": value.isoformat()}
+        else:
+            item[name] = {"S": value}
+    return item
+
+
 def _get_pricing_for_dates(check_in: date, check_out: date) -> tuple[int, int]:  # noqa: ARG001
     """Get nightly rate and cleaning fee for dates.
 
@@ -219,18 +517,6 @@ async def create_reservation(
         )
         return error.model_dump()
 
-    # Look up or create customer record for this user
-    db = _get_db()
-    customer = db.get_customer_by_cognito_sub(cognito_sub)
-    if not customer:
-        error = ToolError.from_code(
-            ErrorCode.VERIFICATION_REQUIRED,
-            details={"reason": "Please complete your profile before booking"},
-        )
-        return error.model_dump()
-
-    customer_id = customer["customer_id"]
-    logger.info("create_reservation called", extra={"customer_id": customer_id, "check_in": check_in, "check_out": check_out, "num_adults": num_adults, "num_children": num_children})
     try:
         start_date = _parse_date(check_in)
         end_date = _parse_date(check_out)
@@ -262,30 +548,20 @@ async def create_reservation(
         return error.model_dump()
 
     nights = (end_date - start_date).days
-    dates_to_book = _date_range(start_date, end_date)
-
-    # db already retrieved above when looking up customer
-
-    # Check availability with atomic check
-    is_available, unavailable_dates = _check_dates_available(db, dates_to_book)
-
-    if not is_available:
-        logger.warning(
-            "create_reservation FAILED - dates unavailable",
-            extra={
-                "check_in": check_in,
-                "check_out": check_out,
-                "unavailable_dates": unavailable_dates,
-                "total_dates_requested": len(dates_to_book),
-                "unavailable_count": len(unavailable_dates),
-            },
-        )
+    dates_to_book = _date_range_iso(start_date, end_date)
+
+    db = _get_db()
+    customer = await asyncio.to_thread(get_customer_cached, db, cognito_sub)
+    if not customer:
         error = ToolError.from_code(
-            ErrorCode.DATES_UNAVAILABLE,
-            details={"unavailable_dates": ", ".join(unavailable_dates)},
+            ErrorCode.VERIFICATION_REQUIRED,
+            details={"reason": "Please complete your profile before booking"},
         )
         return error.model_dump()
 
+    customer_id = customer["customer_id"]
+    logger.info("create_reservation called", extra={"customer_id": customer_id, "check_in": check_in, "check_out": check_out, "num_adults": num_adults, "num_children": num_children})
+
     # Get pricing
     nightly_rate, cleaning_fee = _get_pricing_for_dates(start_date, end_date)
     total_amount = (nightly_rate * nights) + cleaning_fee
@@ -293,6 +569,7 @@ async def create_reservation(
     # Generate reservation ID
     reservation_id = _generate_reservation_id()
     now = datetime.now(UTC)
+    now_iso = now.isoformat()
 
     # Create reservation record
     reservation = Reservation(
@@ -318,53 +595,72 @@ async def create_reservation(
     # 2. Mark dates as booked
 
     # Build transaction items
+    reservations_table = db._table_name("reservations")
+    availability_table = db._table_name("availability")
     transact_items: list[dict[str, Any]] = []
 
     # Add reservation
-    reservation_item = reservation.model_dump(mode="json")
-    # Convert date/datetime to strings for DynamoDB
-    reservation_item["check_in"] = start_date.isoformat()
-    reservation_item["check_out"] = end_date.isoformat()
-    reservation_item["created_at"] = now.isoformat()
-    reservation_item["updated_at"] = now.isoformat()
-
     transact_items.append(
         {
             "Put": {
-                "TableName": db._table_name("reservations"),
-                "Item": {k: _serialize_dynamodb(v) for k, v in reservation_item.items() if v is not None},
+                "TableName": reservations_table,
+                "Item": _reservation_to_item(reservation),
                 "ConditionExpression": "attribute_not_exists(reservation_id)",
             }
         }
     )
 
     # Add availability updates with condition checks (double-booking prevention)
+    rid_av = {"S": reservation_id}
+    now_av = {"S": now_iso}
     for d in dates_to_book:
         transact_items.append(
             {
                 "Put": {
-                    "TableName": db._table_name("availability"),
+                    "TableName": availability_table,
                     "Item": {
-                        "date": {"S": d.isoformat()},
-                        "status": {"S": AvailabilityStatus.BOOKED.value},
-                        "reservation_id": {"S": reservation_id},
-                        "updated_at": {"S": now.isoformat()},
-                    },
-                    # Only succeed if date is available or doesn't exist
-                    "ConditionExpression": "attribute_not_exists(#s) OR #s = :available",
-                    "ExpressionAttributeNames": {"#s": "status"},
-                    "ExpressionAttributeValues": {
-                        ":available": {"S": AvailabilityStatus.AVAILABLE.value}
+                        "date": {"S": d},
+                        "status": _BOOKED_AV,
+                        "reservation_id": rid_av,
+                        "updated_at": now_av,
                     },
+                    **_BOOK_IF_AVAILABLE,
                 }
             }
         )
 
-    # Execute transaction
-    success = db.transact_write(transact_items)
+    # Execute transaction. The per-date condition checks enforce availability
+    # atomically, so there is no separate availability read beforehand.
+    cancellation_reasons: list[str] = []
+    success = await asyncio.to_thread(
+        db.transact_write, transact_items, cancellation_reasons=cancellation_reasons
+    )
 
     if not success:
-        # Booking conflict is a form of dates unavailable (race condition)
+        # Item 0 is the reservation Put; item i books dates_to_book[i - 1]
+        unavailable_dates = [
+            d
+            for d, reason in zip(dates_to_book, cancellation_reasons[1:], strict=False)
+            if reason == "ConditionalCheckFailed"
+        ]
+        if unavailable_dates:
+            logger.warning(
+                "create_reservation FAILED - dates unavailable",
+                extra={
+                    "check_in": check_in,
+                    "check_out": check_out,
+                    "unavailable_dates": unavailable_dates,
+                    "total_dates_requested": len(dates_to_book),
+                    "unavailable_count": len(unavailable_dates),
+                },
+            )
+            error = ToolError.from_code(
+                ErrorCode.DATES_UNAVAILABLE,
+                details={"unavailable_dates": ", ".join(unavailable_dates)},
+            )
+            return error.model_dump()
+
+        # Cancelled for another reason (e.g. transaction conflict under a race)
         error = ToolError.from_code(
             ErrorCode.DATES_UNAVAILABLE,
             details={"reason": "booking_conflict"},
@@ -388,24 +684,6 @@ async def create_reservation(
     }
 
 
-def _serialize_dynamodb(value: Any) -> dict[str, Any]:
-    """Serialize a Python value to DynamoDB format."""
-    if isinstance(value, str):
-        return {"S": value}
-    elif isinstance(value, bool):
-        return {"BOOL": value}
-    elif isinstance(value, int | float):
-        return {"N": str(value)}
-    elif value is None:
-        return {"NULL": True}
-    elif isinstance(value, list):
-        return {"L": [_serialize_dynamodb(v) for v in value]}
-    elif isinstance(value, dict):
-        return {"M": {k: _serialize_dynamodb(v) for k, v in value.items()}}
-    else:
-        return {"S": str(value)}
-
-
 @tool(context=True)
 @requires_access_token(
     provider_name=OAUTH2_PROVIDER_NAME,
@@ -463,8 +741,11 @@ async def modify_reservation(
     logger.info("modify_reservation called", extra={"reservation_id": reservation_id})
     db = _get_db()
 
-    # Get existing reservation
-    item = db.get_item("reservations", {"reservation_id": reservation_id})
+    # Get existing reservation and the caller's customer record concurrently
+    item, customer = await asyncio.gather(
+        asyncio.to_thread(db.get_item, "reservations", {"reservation_id": reservation_id}),
+        asyncio.to_thread(get_customer_cached, db, cognito_sub),
+    )
 
     if not item:
         error = ToolError.from_code(
@@ -474,7 +755,6 @@ async def modify_reservation(
         return error.model_dump()
 
     # Verify ownership: check that reservation belongs to authenticated user
-    customer = db.get_customer_by_cognito_sub(cognito_sub)
     if not customer or item.get("customer_id") != customer.get("customer_id"):
         error = ToolError.from_code(
             ErrorCode.UNAUTHORIZED,
@@ -534,14 +814,17 @@ async def modify_reservation(
 
     if dates_changing:
         # Get dates to check (excluding current booking's dates)
-        current_dates = set(_date_range(current_check_in, current_check_out))
-        new_dates = set(_date_range(check_in, check_out))
+        dates_to_release = _range_difference_iso(
+            current_check_in, current_check_out, check_in, check_out
+        )
 
         # Only need to check dates that are new (not already booked by this reservation)
-        dates_to_check = list(new_dates - current_dates)
+        dates_to_book = _range_difference_iso(check_in, check_out, current_check_in, current_check_out)
 
-        if dates_to_check:
-            is_available, unavailable_dates = _check_dates_available(db, dates_to_check)
+        if dates_to_book:
+            is_available, unavailable_dates = await asyncio.to_thread(
+                _check_dates_available, db, dates_to_book
+            )
             if not is_available:
                 error = ToolError.from_code(
                     ErrorCode.DATES_UNAVAILABLE,
@@ -557,7 +840,7 @@ async def modify_reservation(
     price_difference = new_total - old_total
 
     # Build update
-    now = datetime.now(UTC)
+    now_iso = datetime.now(UTC).isoformat()
     updates = {
         "check_in": check_in.isoformat(),
         "check_out": check_out.isoformat(),
@@ -566,12 +849,71 @@ async def modify_reservation(
         "num_children": num_children,
         "total_amount": new_total,
         "nightly_rate": nightly_rate,
-        "updated_at": now.isoformat(),
+        "updated_at": now_iso,
     }
 
     if new_special_requests is not None:
         updates["special_requests"] = new_special_requests
 
+    # If dates changed, update availability before touching the reservation so
+    # a booking conflict leaves the existing reservation as it was
+    if dates_changing:
+        availability_table = db._table_name("availability")
+        rid_av = {"S": reservation_id}
+        now_av = {"S": now_iso}
+
+        # Release a date (only if still ours)
+        release_static = {
+            "UpdateExpression": "SET #s = :available, updated_at = :upd REMOVE reservation_id",
+            "ConditionExpression": "reservation_id = :rid",
+            "ExpressionAttributeNames": {"#s": "status"},
+            "ExpressionAttributeValues": {
+                ":available": _AVAILABLE_AV,
+                ":upd": now_av,
+                ":rid": rid_av,
+            },
+        }
+
+        def _release(d: str) -> dict[str, Any]:
+            return {
+                "Update": {
+                    "TableName": availability_table,
+                    "Key": {"date": {"S": d}},
+                    **release_static,
+                }
+            }
+
+        # Book a date with the same double-booking condition as create
+        def _book(d: str) -> dict[str, Any]:
+            return {
+                "Put": {
+                    "TableName": availability_table,
+                    "Item": {
+                        "date": {"S": d},
+                        "status": _BOOKED_AV,
+                        "reservation_id": rid_av,
+                        "updated_at": now_av,
+                    },
+                    **_BOOK_IF_AVAILABLE,
+                }
+            }
+
+        # Release old dates that are no longer needed and book the new ones.
+        # The undo items reverse each write if a chunked change fails part-way.
+        transact_items = [_release(d) for d in dates_to_release] + [
+            _book(d) for d in dates_to_book
+        ]
+        undo_items = [_book(d) for d in dates_to_release] + [
+            _release(d) for d in dates_to_book
+        ]
+
+        if not await _transact_write_chunked(db, transact_items, undo_items):
+            error = ToolError.from_code(
+                ErrorCode.DATES_UNAVAILABLE,
+                details={"reason": "booking_conflict"},
+            )
+            return error.model_dump()
+
     # Update reservation - build proper DynamoDB update expression
     set_parts = []
     attr_values: dict[str, Any] = {}
@@ -585,43 +927,15 @@ async def modify_reservation(
         attr_values[f":{key}"] = value
 
     update_expression = "SET " + ", ".join(set_parts)
-    db.update_item(
+    await asyncio.to_thread(
+        db.update_item,
         "reservations",
         {"reservation_id": reservation_id},
         update_expression,
         attr_values,
         attr_names,
     )
-
-    # If dates changed, update availability
-    if dates_changing:
-        # Release old dates that are no longer needed
-        dates_to_release = list(current_dates - new_dates)
-        for d in dates_to_release:
-            db.update_item(
-                "availability",
-                {"date": d.isoformat()},
-                "SET #status = :status, reservation_id = :rid, updated_at = :upd",
-                {
-                    ":status": AvailabilityStatus.AVAILABLE.value,
-                    ":rid": None,
-                    ":upd": now.isoformat(),
-                },
-                {"#status": "status"},  # 'status' is a reserved word
-            )
-
-        # Book new dates
-        dates_to_book = list(new_dates - current_dates)
-        for d in dates_to_book:
-            db.put_item(
-                "availability",
-                {
-                    "date": d.isoformat(),
-                    "status": AvailabilityStatus.BOOKED.value,
-                    "reservation_id": reservation_id,
-                    "updated_at": now.isoformat(),
-                },
-            )
+    invalidate_payment_status_cache(reservation_id)
 
     # Build response
     result = {
@@ -699,8 +1013,11 @@ async def cancel_reservation(
     logger.info("cancel_reservation called", extra={"reservation_id": reservation_id})
     db = _get_db()
 
-    # Get existing reservation
-    item = db.get_item("reservations", {"reservation_id": reservation_id})
+    # Get existing reservation and the caller's customer record concurrently
+    item, customer = await asyncio.gather(
+        asyncio.to_thread(db.get_item, "reservations", {"reservation_id": reservation_id}),
+        asyncio.to_thread(get_customer_cached, db, cognito_sub),
+    )
 
     if not item:
         error = ToolError.from_code(
@@ -710,7 +1027,6 @@ async def cancel_reservation(
         return error.model_dump()
 
     # Verify ownership: check that reservation belongs to authenticated user
-    customer = db.get_customer_by_cognito_sub(cognito_sub)
     if not customer or item.get("customer_id") != customer.get("customer_id"):
         error = ToolError.from_code(
             ErrorCode.UNAUTHORIZED,
@@ -761,56 +1077,59 @@ async def cancel_reservation(
         refund_percentage = 0
         refund_amount = 0
 
-    # Prepare transaction items
-    now = datetime.now(UTC)
-    transact_items: list[dict[str, Any]] = []
-
-    # Update reservation status
-    transact_items.append(
+    # Cancel the reservation first with an UpdateItem conditioned on the stay
+    # read above, so a concurrent cancel or date change makes it fail instead
+    # of releasing the wrong range. The dates are then released one by one,
+    # each only if still held by this reservation. The release is not atomic
+    # with the cancellation; a failed release leaves the dates booked (never
+    # double-booked) and is logged for reconciliation.
+    now_iso = datetime.now(UTC).isoformat()
+    cancellation_reason = reason or "No reason provided"
+    refund_status = PaymentStatus.REFUNDED if refund_amount > 0 else PaymentStatus.CANCELLED
+    updated = await asyncio.to_thread(
+        db.update_item,
+        "reservations",
+        {"reservation_id": reservation_id},
+        "SET #s = :cancelled, payment_status = :refund_status, "
+        "cancellation_reason = :reason, cancelled_at = :now, "
+        "refund_amount = :refund, updated_at = :now",
         {
-            "Update": {
-                "TableName": db._table_name("reservations"),
-                "Key": {"reservation_id": {"S": reservation_id}},
-                "UpdateExpression": "SET #s = :cancelled, payment_status = :refund_status, cancellation_reason = :reason, cancelled_at = :now, refund_amount = :refund, updated_at = :now",
-                "ExpressionAttributeNames": {"#s": "status"},
-                "ExpressionAttributeValues": {
-                    ":cancelled": {"S": ReservationStatus.CANCELLED.value},
-                    ":refund_status": {"S": PaymentStatus.REFUNDED.value if refund_amount > 0 else PaymentStatus.CANCELLED.value},
-                    ":reason": {"S": reason or "No reason provided"},
-                    ":now": {"S": now.isoformat()},
-                    ":refund": {"N": str(refund_amount)},
-                },
-            }
-        }
+            ":cancelled": ReservationStatus.CANCELLED.value,
+            ":refund_status": refund_status.value,
+            ":reason": cancellation_reason,
+            ":now": now_iso,
+            ":refund": refund_amount,
+            ":ci": item["check_in"],
+            ":co": item["check_out"],
+        },
+        {"#s": "status"},
+        "#s <> :cancelled AND check_in = :ci AND check_out = :co",
     )
 
-    # Release all booked dates
-    dates_to_release = _date_range(check_in, check_out)
-    for d in dates_to_release:
-        transact_items.append(
-            {
-                "Put": {
-                    "TableName": db._table_name("availability"),
-                    "Item": {
-                        "date": {"S": d.isoformat()},
-                        "status": {"S": AvailabilityStatus.AVAILABLE.value},
-                        "updated_at": {"S": now.isoformat()},
-                    },
-                }
-            }
-        )
-
-    # Execute transaction
-    success = db.transact_write(transact_items)
-
-    if not success:
-        # Use PAYMENT_FAILED as closest match for transactional failure
+    if not updated:
+        # A concurrent cancellation or modification got there first
         error = ToolError.from_code(
-            ErrorCode.PAYMENT_FAILED,
-            details={"operation": "cancellation", "reason": "Transaction failed"},
+            ErrorCode.UNAUTHORIZED,
+            details={
+                "reason": "Reservation was changed while cancelling. "
+                "Please check it and try again."
+            },
         )
         return error.model_dump()
+    invalidate_payment_status_cache(reservation_id)
+
+    # Release all booked dates
+    dates_to_release = _date_range_iso(check_in, check_out)
+    failed = await _release_dates(db, reservation_id, dates_to_release, now_iso)
+    if failed:
+        # The cancellation itself is committed; the dates need reconciling
+        logger.error(
+            "cancel_reservation could not release dates",
+            extra={"reservation_id": reservation_id, "dates": failed},
+        )
 
+    refund_eur = refund_amount / 100
+    total_eur = total_amount / 100
     return {
         "status": "success",
         "reservation_id": reservation_id,
@@ -819,12 +1138,28 @@ async def cancel_reservation(
         "days_until_checkin": days_until_checkin,
         "refund_percentage": refund_percentage,
         "refund_amount_cents": refund_amount,
-        "refund_amount_eur": refund_amount / 100,
+        "refund_amount_eur": refund_eur,
         "original_amount_cents": total_amount,
-        "original_amount_eur": total_amount / 100,
-        "cancellation_reason": reason or "No reason provided",
-        "cancelled_at": now.isoformat(),
-        "message": f"Reservation {reservation_id} has been cancelled. Refund: €{refund_amount / 100:.2f} ({refund_percentage}% of €{total_amount / 100:.2f}).",
+        "original_amount_eur": total_eur,
+        "cancellation_reason": cancellation_reason,
+        "cancelled_at": now_iso,
+        "message": f"Reservation {reservation_id} has been cancelled. Refund: €{refund_eur:.2f} ({refund_percentage}% of €{total_eur:.2f}).",
+    }
+
+
+def _reservation_summary(res: dict[str, Any]) -> dict[str, Any]:
+    """Format a reservation item for the get_my_reservations listing."""
+    get = res.get
+    return {
+        "reservation_id": res["reservation_id"],
+        "check_in": res["check_in"],
+        "check_out": res["check_out"],
+        "nights": get("nights", 0),
+        "num_adults": get("num_adults", 1),
+        "num_children": get("num_children", 0),
+        "total_amount_eur": int(get("total_amount", 0)) / 100,
+        "status": get("status", "unknown"),
+        "payment_status": get("payment_status", "unknown"),
     }
 
 
@@ -838,20 +1173,27 @@ async def cancel_reservation(
 )
 async def get_my_reservations(
     tool_context: ToolContext,  # noqa: ARG001 - Required by @tool(context=True)
+    page_token: str | None = None,
     *,
     access_token: str,
 ) -> dict[str, Any]:
-    """Get all reservations for the authenticated user.
+    """Get the authenticated user's reservations, most recent check-in first.
 
     Use this tool when an authenticated customer asks about their bookings,
     such as "What are my reservations?" or "Show me my bookings".
 
+    Returns up to 20 reservations. If "has_more" is true and the customer
+    asks for older bookings, call again with page_token set to the
+    "next_page_token" from the previous result.
+
     Authentication is handled automatically via @requires_access_token decorator.
     If the user is not logged in, an authorization URL will be streamed to the
     client for them to complete OAuth2 login.
 
     Args:
         tool_context: Strands ToolContext (automatically injected)
+        page_token: "next_page_token" from a previous call, for paging back
+            through older bookings
         access_token: JWT access token (injected by @requires_access_token)
 
     Returns:
@@ -859,6 +1201,15 @@ async def get_my_reservations(
     """
     logger.info("get_my_reservations called")
 
+    start_after = None
+    if page_token is not None:
+        start_after = _decode_page_token(page_token)
+        if start_after is None:
+            return {
+                "status": "error",
+                "message": "Invalid page token. Use the next_page_token from the previous result.",
+            }
+
     # T015: Extract cognito_sub from decorator-provided access_token
     cognito_sub = extract_cognito_sub(access_token)
     if not cognito_sub:
@@ -871,8 +1222,10 @@ async def get_my_reservations(
 
     db = _get_db()
 
-    # Look up customer by cognito_sub
-    customer = db.get_customer_by_cognito_sub(cognito_sub)
+    # Look up customer by cognito_sub, then their reservations
+    customer, reservations = await asyncio.to_thread(
+        _get_customer_reservations, db, cognito_sub, start_after
+    )
     if not customer:
         # User is authenticated but has no customer record yet
         logger.info(
@@ -886,45 +1239,41 @@ async def get_my_reservations(
             "message": "You don't have any reservations yet. Would you like to make a booking?",
         }
 
-    customer_id = customer["customer_id"]
-    logger.info("Looking up reservations for customer", extra={"customer_id": customer_id})
-
-    # Get reservations for this customer
-    reservations = db.get_reservations_by_customer_id(customer_id)
-
-    # Format reservations for response
-    formatted = []
-    for res in reservations:
-        formatted.append({
-            "reservation_id": res["reservation_id"],
-            "check_in": res["check_in"],
-            "check_out": res["check_out"],
-            "nights": res.get("nights", 0),
-            "num_adults": res.get("num_adults", 1),
-            "num_children": res.get("num_children", 0),
-            "total_amount_eur": int(res.get("total_amount", 0)) / 100,
-            "status": res.get("status", "unknown"),
-            "payment_status": res.get("payment_status", "unknown"),
-        })
+    logger.info(
+        "Found reservations for customer",
+        extra={"customer_id": customer["customer_id"], "count": len(reservations)},
+    )
+
+    # Format reservations for response; anything past the page only means there is more
+    page = reservations[:_MY_RESERVATIONS_PAGE_SIZE]
+    formatted = [_reservation_summary(res) for res in page]
 
     if not formatted:
         return {
             "status": "success",
             "reservations": [],
             "count": 0,
-            "message": "You don't have any reservations yet. Would you like to make a booking?",
+            "message": (
+                "You don't have any older reservations."
+                if page_token
+                else "You don't have any reservations yet. Would you like to make a booking?"
+            ),
         }
 
-    return {
+    result: dict[str, Any] = {
         "status": "success",
         "reservations": formatted,
         "count": len(formatted),
+        "has_more": len(reservations) > _MY_RESERVATIONS_PAGE_SIZE,
         "message": f"Found {len(formatted)} reservation(s).",
     }
+    if result["has_more"]:
+        result["next_page_token"] = _encode_page_token(page[-1])
+    return result
 
 
 @tool
-def get_reservation(reservation_id: str) -> dict[str, Any]:
+async def get_reservation(reservation_id: str) -> dict[str, Any]:
     """Get details of an existing reservation.
 
     Use this tool when a customer asks about their booking,
@@ -939,7 +1288,7 @@ def get_reservation(reservation_id: str) -> dict[str, Any]:
     logger.info("get_reservation called", extra={"reservation_id": reservation_id})
     db = _get_db()
 
-    item = db.get_item("reservations", {"reservation_id": reservation_id})
+    item = await _get_reservation_batcher(db).get(reservation_id)
 
     if not item:
         error = ToolError.from_code(
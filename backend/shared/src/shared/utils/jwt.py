@@ -4,19 +4,33 @@ T032: Provides a simple utility for backend tools to extract the cognito_sub
 (user identifier) from JWT tokens passed in the request payload.
 
 Architecture Note:
-- Tokens are passed in the request payload as `auth_token` (not headers)
-- We decode the JWT payload without signature verification using PyJWT
-- Signature verification was already done by Cognito during authentication
+- Reservation tools receive the access token from the @requires_access_token
+  decorator, which obtains it from AgentCore Identity for the signed-in user
+- Signature verification was already done by Cognito during authentication,
+  so tools only read claims: the payload segment is base64-decoded directly,
+  with PyJWT (unverified) as the fallback for tokens it cannot parse
 - The `sub` claim contains the Cognito user ID (cognito_sub)
 """
 
+import base64
+import hashlib
+import json
 import logging
+import threading
+import time
 from typing import Any
 
 import jwt
 
 logger = logging.getLogger(__name__)
 
+# Decoded claims per token, keyed by a digest so raw bearer tokens are not
+# retained. Entries live until the token's exp, capped at five minutes.
+_CLAIMS_CACHE_TTL_SECONDS = 300.0
+_CLAIMS_CACHE_MAX_ENTRIES = 1024
+_claims_cache: dict[bytes, tuple[float, tuple[str | None, str | None]]] = {}
+_claims_cache_lock = threading.Lock()
+
 
 def decode_jwt_payload(token: str) -> dict[str, Any] | None:
     """Decode a JWT token and return the full payload using PyJWT.
@@ -49,6 +63,25 @@ def decode_jwt_payload(token: str) -> dict[str, Any] | None:
         return None
 
 
+def _decode_payload_segment(token: str) -> dict[str, Any] | None:
+    """Decode only the payload segment of a compact JWT.
+
+    Fast path for claim extraction: no signature is verified either way, so
+    the header and signature segments need not be parsed. Returns None for
+    anything that isn't a three-segment token with a JSON object payload.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    segment = parts[1]
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:  # binascii, unicode and JSON decode errors
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
 def extract_cognito_claims(auth_token: str | None) -> tuple[str | None, str | None]:
     """Extract Cognito sub and email from a JWT auth token.
 
@@ -71,9 +104,28 @@ def extract_cognito_claims(auth_token: str | None) -> tuple[str | None, str | No
     if not auth_token:
         return None, None
 
-    payload = decode_jwt_payload(auth_token)
+    # A session reuses the same access token for every tool call, so repeat
+    # lookups skip the base64 and JSON decode entirely
+    key = hashlib.blake2b(auth_token.encode(), digest_size=16).digest()
+    now = time.time()
+    entry = _claims_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    claims, expires_at = _decode_claims(auth_token)
+    with _claims_cache_lock:
+        if len(_claims_cache) >= _CLAIMS_CACHE_MAX_ENTRIES and key not in _claims_cache:
+            # Evict the oldest insertion
+            del _claims_cache[next(iter(_claims_cache))]
+        _claims_cache[key] = (min(expires_at, now + _CLAIMS_CACHE_TTL_SECONDS), claims)
+    return claims
+
+
+def _decode_claims(auth_token: str) -> tuple[tuple[str | None, str | None], float]:
+    """Decode ((sub, email), exp) from a token; exp is +inf when absent."""
+    payload = _decode_payload_segment(auth_token) or decode_jwt_payload(auth_token)
     if not payload:
-        return None, None
+        return (None, None), float("inf")
 
     cognito_sub = payload.get("sub")
     email = payload.get("email")
@@ -83,7 +135,10 @@ def extract_cognito_claims(auth_token: str | None) -> tuple[str | None, str | No
     else:
         logger.debug("No 'sub' claim found in token payload")
 
-    return (str(cognito_sub) if cognito_sub else None, str(email) if email else None)
+    exp = payload.get("exp")
+    expires_at = float(exp) if isinstance(exp, int | float) else float("inf")
+    claims = (str(cognito_sub) if cognito_sub else None, str(email) if email else None)
+    return claims, expires_at
 
 
 def extract_cognito_sub(auth_token: str | None) -> str | None:
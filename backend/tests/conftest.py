@@ -12,6 +12,7 @@ import base64
 import json
 import os
 import sys
+from collections.abc import Iterator
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from functools import wraps
@@ -100,6 +101,22 @@ if not os.environ.get("AWS_PROFILE") and not os.environ.get("AWS_ACCESS_KEY_ID")
 # === DynamoDB Fixtures ===
 
 
+@pytest.fixture(autouse=True)
+def reset_tool_caches() -> Iterator[None]:
+    """Clear the tools' customer and payment status caches after each test.
+
+    Tests reuse the same mock cognito_sub and reservation IDs with different
+    records, so a cached lookup must not leak into the next test.
+    """
+    yield
+    customer_cache = sys.modules.get("shared.services.customer_cache")
+    if customer_cache is not None:
+        customer_cache.invalidate_customer_cache()
+    payments = sys.modules.get("shared.tools.payments")
+    if payments is not None:
+        payments.invalidate_payment_status_cache()
+
+
 @pytest.fixture(autouse=True)
 def reset_dynamodb_singleton(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """Reset DynamoDB singleton before and after each test.
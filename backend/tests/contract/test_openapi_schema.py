@@ -10,29 +10,35 @@ import json
 from pathlib import Path
 
 import pytest
-from jsonschema import ValidationError, validate
+from jsonschema import Draft7Validator, ValidationError
 
 # Test configuration - matches Terraform inputs
 TEST_LAMBDA_ARN = "arn:aws:lambda:eu-west-1:123456789012:function:booking-api"
 TEST_USER_POOL_ID = "eu-west-1_TestPool123"
 TEST_CLIENT_ID = "test-client-id-12345"
 TEST_CORS_ORIGINS = ["*"]
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
 
 
-@pytest.fixture
-def openapi_schema() -> dict:
-    """Load the OpenAPI output schema for validation."""
+@pytest.fixture(scope="module")
+def openapi_schema() -> Draft7Validator:
+    """Load the OpenAPI output schema as a compiled validator."""
     # Path is relative to repo root - tests run from backend/ directory
     # Use Path(__file__) to get absolute path
     test_dir = Path(__file__).parent
     repo_root = test_dir.parent.parent.parent  # backend/tests/contract -> backend -> repo root
     schema_path = repo_root / "specs/006-backend-workspace-openapi/contracts/openapi-output.schema.json"
-    return json.loads(schema_path.read_text())
+    schema = json.loads(schema_path.read_text())
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generated_openapi() -> dict:
-    """Generate OpenAPI spec with test configuration."""
+    """Generate OpenAPI spec with test configuration.
+
+    Module-scoped: generation walks every route, and no test mutates the result.
+    """
     from api.scripts.generate_openapi import generate_openapi
 
     return generate_openapi(
@@ -43,15 +49,26 @@ def generated_openapi() -> dict:
     )
 
 
+@pytest.fixture(scope="module")
+def operations(generated_openapi: dict) -> list[tuple[str, str, dict]]:
+    """Every (path, method, operation) in the generated spec."""
+    return [
+        (path, method, operation)
+        for path, path_item in generated_openapi["paths"].items()
+        for method, operation in path_item.items()
+        if method in HTTP_METHODS
+    ]
+
+
 class TestOpenAPISchemaContract:
     """Test suite for OpenAPI schema contract compliance."""
 
     def test_generated_openapi_matches_contract_schema(
-        self, generated_openapi: dict, openapi_schema: dict
+        self, generated_openapi: dict, openapi_schema: Draft7Validator
     ) -> None:
         """Generated OpenAPI must match the contract schema."""
         # Should not raise ValidationError
-        validate(instance=generated_openapi, schema=openapi_schema)
+        openapi_schema.validate(generated_openapi)
 
     def test_openapi_version_is_3_0_x(self, generated_openapi: dict) -> None:
         """OpenAPI version must be 3.0.x for API Gateway compatibility."""
@@ -77,58 +94,45 @@ class TestAWSIntegrations:
     """Test suite for AWS API Gateway integration configuration."""
 
     def test_all_operations_have_lambda_integration(
-        self, generated_openapi: dict
+        self, operations: list[tuple[str, str, dict]]
     ) -> None:
         """Every operation must have x-amazon-apigateway-integration."""
-        for path, path_item in generated_openapi["paths"].items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method not in path_item:
-                    continue
-
-                operation = path_item[method]
-                integration = operation.get("x-amazon-apigateway-integration")
-                assert integration is not None, (
-                    f"Missing integration for {method.upper()} {path}"
-                )
+        for path, method, operation in operations:
+            integration = operation.get("x-amazon-apigateway-integration")
+            assert integration is not None, (
+                f"Missing integration for {method.upper()} {path}"
+            )
 
-    def test_integration_type_is_aws_proxy(self, generated_openapi: dict) -> None:
+    def test_integration_type_is_aws_proxy(
+        self, operations: list[tuple[str, str, dict]]
+    ) -> None:
         """All integrations must use AWS_PROXY type."""
-        for path, path_item in generated_openapi["paths"].items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method not in path_item:
-                    continue
-
-                integration = path_item[method].get("x-amazon-apigateway-integration", {})
-                assert integration.get("type") == "AWS_PROXY", (
-                    f"Expected AWS_PROXY for {method.upper()} {path}"
-                )
+        for path, method, operation in operations:
+            integration = operation.get("x-amazon-apigateway-integration", {})
+            assert integration.get("type") == "AWS_PROXY", (
+                f"Expected AWS_PROXY for {method.upper()} {path}"
+            )
 
     def test_integration_uri_contains_lambda_arn(
-        self, generated_openapi: dict
+        self, operations: list[tuple[str, str, dict]]
     ) -> None:
         """Integration URI must contain the Lambda ARN."""
-        for path, path_item in generated_openapi["paths"].items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method not in path_item:
-                    continue
-
-                integration = path_item[method].get("x-amazon-apigateway-integration", {})
-                uri = integration.get("uri", "")
-                assert TEST_LAMBDA_ARN in uri, (
-                    f"Lambda ARN not found in URI for {method.upper()} {path}"
-                )
+        for path, method, operation in operations:
+            integration = operation.get("x-amazon-apigateway-integration", {})
+            uri = integration.get("uri", "")
+            assert TEST_LAMBDA_ARN in uri, (
+                f"Lambda ARN not found in URI for {method.upper()} {path}"
+            )
 
-    def test_payload_format_version_is_2_0(self, generated_openapi: dict) -> None:
+    def test_payload_format_version_is_2_0(
+        self, operations: list[tuple[str, str, dict]]
+    ) -> None:
         """All integrations must use payloadFormatVersion 2.0."""
-        for path, path_item in generated_openapi["paths"].items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method not in path_item:
-                    continue
-
-                integration = path_item[method].get("x-amazon-apigateway-integration", {})
-                assert integration.get("payloadFormatVersion") == "2.0", (
-                    f"Expected payloadFormatVersion 2.0 for {method.upper()} {path}"
-                )
+        for path, method, operation in operations:
+            integration = operation.get("x-amazon-apigateway-integration", {})
+            assert integration.get("payloadFormatVersion") == "2.0", (
+                f"Expected payloadFormatVersion 2.0 for {method.upper()} {path}"
+            )
 
 
 class TestJWTAuthorizer:
@@ -178,17 +182,14 @@ class TestRouteSecurityClassification:
     based on the presence of require_auth dependency.
     """
 
-    def test_all_operations_have_security_field(self, generated_openapi: dict) -> None:
+    def test_all_operations_have_security_field(
+        self, operations: list[tuple[str, str, dict]]
+    ) -> None:
         """Every operation must have explicit security field."""
-        for path, path_item in generated_openapi["paths"].items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method not in path_item:
-                    continue
-
-                operation = path_item[method]
-                assert "security" in operation, (
-                    f"Missing security field for {method.upper()} {path}"
-                )
+        for path, method, operation in operations:
+            assert "security" in operation, (
+                f"Missing security field for {method.upper()} {path}"
+            )
 
     def test_public_routes_have_empty_security(self, generated_openapi: dict) -> None:
         """Public routes must have security: []."""
@@ -370,21 +371,18 @@ class TestAllEndpointsExist:
 
         assert not missing, f"Missing endpoints:\n" + "\n".join(missing)
 
-    def test_endpoint_count_matches_expected(self, generated_openapi: dict) -> None:
+    def test_endpoint_count_matches_expected(
+        self, operations: list[tuple[str, str, dict]]
+    ) -> None:
         """Total business endpoint count should match expected."""
         expected_count = sum(
             len(endpoints) for endpoints in self.EXPECTED_ENDPOINTS.values()
         )
         # Count actual endpoints (excluding framework routes like /docs, /openapi.json)
         # Routes are at root level; REST API stage 'api' provides /api prefix in URL
-        actual_count = 0
-        for path, path_item in generated_openapi.get("paths", {}).items():
-            # Skip OpenAPI framework routes
-            if path in ["/docs", "/openapi.json", "/redoc"]:
-                continue
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method in path_item:
-                    actual_count += 1
+        actual_count = sum(
+            1 for path, _, _ in operations if path not in ("/docs", "/openapi.json", "/redoc")
+        )
 
         assert actual_count >= expected_count, (
             f"Expected at least {expected_count} endpoints, found {actual_count}"
@@ -610,7 +610,7 @@ class TestPaymentProcessing:
         reservation_id = res_result["reservation_id"]
 
         # Get reservation - should be pending
-        res_before = get_reservation(reservation_id)
+        res_before = await get_reservation(reservation_id)
         assert res_before["reservation_status"] == "pending"
         assert res_before["payment_status"] == "pending"
 
@@ -624,7 +624,7 @@ class TestPaymentProcessing:
         assert payment_result["status"] == "success"
 
         # Get reservation again - should be confirmed
-        res_after = get_reservation(reservation_id)
+        res_after = await get_reservation(reservation_id)
         assert res_after["reservation_status"] == "confirmed"
         assert res_after["payment_status"] == "paid"
 
@@ -225,10 +225,11 @@ class TestGetCustomerMe:
 
     def test_returns_customer_profile_when_found(self) -> None:
         """GET /customers/me returns profile for authenticated user."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
@@ -248,16 +249,14 @@ class TestGetCustomerMe:
             "updated_at": "2025-01-01T00:00:00Z",
         }
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = mock_customer
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = mock_customer
 
-            response = client.get(
-                "/customers/me",
-                headers={"x-user-sub": "cognito-sub-abc123"},
-            )
+        response = client.get(
+            "/customers/me",
+            headers={"x-user-sub": "cognito-sub-abc123"},
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -267,26 +266,25 @@ class TestGetCustomerMe:
 
     def test_returns_404_when_profile_not_found(self) -> None:
         """GET /customers/me returns 404 when no profile exists."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
         app.include_router(router)
         client = TestClient(app)
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = None
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = None
 
-            response = client.get(
-                "/customers/me",
-                headers={"x-user-sub": "cognito-sub-nonexistent"},
-            )
+        response = client.get(
+            "/customers/me",
+            headers={"x-user-sub": "cognito-sub-nonexistent"},
+        )
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
@@ -316,36 +314,35 @@ class TestCreateCustomerMe:
 
     def test_creates_customer_profile_successfully(self) -> None:
         """POST /customers/me creates profile with provided data."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
         app.include_router(router)
         client = TestClient(app)
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            # No existing profile
-            mock_db.get_customer_by_cognito_sub.return_value = None
-            mock_db.create_customer.return_value = True
-
-            response = client.post(
-                "/customers/me",
-                headers={
-                    "x-user-sub": "cognito-sub-new-user",
-                    "x-user-email": "newuser@example.com",
-                },
-                json={
-                    "name": "New User",
-                    "phone": "+1987654321",
-                    "preferred_language": "es",
-                },
-            )
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        # No existing profile
+        mock_db.get_customer_by_cognito_sub.return_value = None
+        mock_db.create_customer.return_value = True
+
+        response = client.post(
+            "/customers/me",
+            headers={
+                "x-user-sub": "cognito-sub-new-user",
+                "x-user-email": "newuser@example.com",
+            },
+            json={
+                "name": "New User",
+                "phone": "+1987654321",
+                "preferred_language": "es",
+            },
+        )
 
         assert response.status_code == 201
         data = response.json()
@@ -356,10 +353,11 @@ class TestCreateCustomerMe:
 
     def test_returns_409_when_profile_already_exists(self) -> None:
         """POST /customers/me returns 409 if profile already exists."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
@@ -372,20 +370,18 @@ class TestCreateCustomerMe:
             "email": "existing@example.com",
         }
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = existing_customer
-
-            response = client.post(
-                "/customers/me",
-                headers={
-                    "x-user-sub": "cognito-sub-existing",
-                    "x-user-email": "existing@example.com",
-                },
-                json={"name": "Duplicate User"},
-            )
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = existing_customer
+
+        response = client.post(
+            "/customers/me",
+            headers={
+                "x-user-sub": "cognito-sub-existing",
+                "x-user-email": "existing@example.com",
+            },
+            json={"name": "Duplicate User"},
+        )
 
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"].lower()
@@ -478,10 +474,11 @@ class TestUpdateCustomerMe:
 
     def test_updates_customer_profile_successfully(self) -> None:
         """PUT /customers/me updates profile fields."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
@@ -503,21 +500,19 @@ class TestUpdateCustomerMe:
             "preferred_language": "es",
         }
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = existing_customer
-            mock_db.update_item.return_value = updated_customer
-
-            response = client.put(
-                "/customers/me",
-                headers={"x-user-sub": "cognito-sub-abc123"},
-                json={
-                    "name": "New Name",
-                    "preferred_language": "es",
-                },
-            )
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = existing_customer
+        mock_db.update_item.return_value = updated_customer
+
+        response = client.put(
+            "/customers/me",
+            headers={"x-user-sub": "cognito-sub-abc123"},
+            json={
+                "name": "New Name",
+                "preferred_language": "es",
+            },
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -526,27 +521,26 @@ class TestUpdateCustomerMe:
 
     def test_returns_404_when_profile_not_found(self) -> None:
         """PUT /customers/me returns 404 when no profile exists."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
         app.include_router(router)
         client = TestClient(app)
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = None
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = None
 
-            response = client.put(
-                "/customers/me",
-                headers={"x-user-sub": "cognito-sub-nonexistent"},
-                json={"name": "New Name"},
-            )
+        response = client.put(
+            "/customers/me",
+            headers={"x-user-sub": "cognito-sub-nonexistent"},
+            json={"name": "New Name"},
+        )
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
@@ -570,10 +564,11 @@ class TestUpdateCustomerMe:
 
     def test_updates_only_provided_fields(self) -> None:
         """PUT /customers/me only updates fields that are provided."""
-        from unittest.mock import patch
+        from unittest.mock import MagicMock
 
         from fastapi import FastAPI
 
+        from api.dependencies import get_db
         from api.routes.customers import router
 
         app = FastAPI()
@@ -595,18 +590,16 @@ class TestUpdateCustomerMe:
             "name": "Updated Name",
         }
 
-        with patch(
-            "api.routes.customers.get_dynamodb_service"
-        ) as mock_get_db:
-            mock_db = mock_get_db.return_value
-            mock_db.get_customer_by_cognito_sub.return_value = existing_customer
-            mock_db.update_item.return_value = updated_customer
-
-            response = client.put(
-                "/customers/me",
-                headers={"x-user-sub": "cognito-sub-abc123"},
-                json={"name": "Updated Name"},  # Only name, no phone
-            )
+        mock_db = MagicMock()
+        app.dependency_overrides[get_db] = lambda: mock_db
+        mock_db.get_customer_by_cognito_sub.return_value = existing_customer
+        mock_db.update_item.return_value = updated_customer
+
+        response = client.put(
+            "/customers/me",
+            headers={"x-user-sub": "cognito-sub-abc123"},
+            json={"name": "Updated Name"},  # Only name, no phone
+        )
 
         assert response.status_code == 200
         # Verify update_item was called with only the name field
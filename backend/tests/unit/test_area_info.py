@@ -305,3 +305,34 @@ class TestGetAreaInfo:
 
         assert result["total_count"] == 2
         assert len(result["places"]) == result["total_count"]
+
+    def test_category_results_sorted_by_distance(
+        self, sample_area_data: list[dict]
+    ) -> None:
+        """Category buckets should also be sorted closest first."""
+        load_area_data_from_dicts(sample_area_data)
+
+        result = get_area_info(category="golf")
+
+        distances = [p["distance_km"] for p in result["places"]]
+        assert distances == sorted(distances)
+
+    def test_replacing_store_rebuilds_index(
+        self, sample_area_data: list[dict]
+    ) -> None:
+        """Results should follow the store after it is replaced."""
+        load_area_data_from_dicts(sample_area_data)
+        set_area_data_store(
+            [
+                AreaInfo(
+                    id="beach-only",
+                    name="Only Beach",
+                    category=AreaCategory.BEACH,
+                    description="The only place left",
+                    distance_km=1.0,
+                )
+            ]
+        )
+
+        assert get_area_info(category="golf")["total_count"] == 0
+        assert [p["id"] for p in get_area_info()["places"]] == ["beach-only"]
@@ -0,0 +1,135 @@
+"""Unit tests for the booking agent's session agent cache."""
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent import booking_agent
+
+
+@pytest.fixture(autouse=True)
+def clear_session_agents() -> Iterator[None]:
+    """Start and end each test with an empty session agent cache."""
+    booking_agent.reset_agent()
+    yield
+    booking_agent.reset_agent()
+
+
+class TestSessionAgentCache:
+    """Tests for get_session_agent reuse and eviction."""
+
+    def test_released_agent_is_reused(self) -> None:
+        """Follow-up turns of a session should not rebuild the agent."""
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        first = booking_agent.get_session_agent("session-1", factory)
+        booking_agent.release_session_agent("session-1", first)
+        second = booking_agent.get_session_agent("session-1", factory)
+        other = booking_agent.get_session_agent("session-2", factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+
+    def test_overlapping_requests_get_separate_agents(self) -> None:
+        """An agent serving a turn is not handed to a second request."""
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        first = booking_agent.get_session_agent("session-1", factory)
+        second = booking_agent.get_session_agent("session-1", factory)
+
+        assert first is not second
+
+    def test_unreleased_agent_is_not_reused(self) -> None:
+        """An agent whose turn failed or was cancelled is never handed back."""
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        first = booking_agent.get_session_agent("session-1", factory)
+        second = booking_agent.get_session_agent("session-1", factory)
+        booking_agent.release_session_agent("session-1", second)
+
+        assert booking_agent.get_session_agent("session-1", factory) is second
+        assert factory.call_count == 2
+        assert first is not second
+
+    def test_idle_session_is_rebuilt(self) -> None:
+        """A session idle past the timeout should get a fresh agent."""
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        idle = booking_agent.SESSION_AGENT_IDLE_SECONDS
+
+        with patch.object(
+            booking_agent.time, "monotonic", side_effect=[0.0, 0.0, idle + 1.0]
+        ):
+            first = booking_agent.get_session_agent("session-1", factory)
+            booking_agent.release_session_agent("session-1", first)
+            second = booking_agent.get_session_agent("session-1", factory)
+
+        assert first is not second
+
+    def test_least_recently_used_session_is_evicted(self) -> None:
+        """A full cache should drop the session released longest ago."""
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        def turn(session_id: str) -> MagicMock:
+            agent = booking_agent.get_session_agent(session_id, factory)
+            booking_agent.release_session_agent(session_id, agent)
+            return agent
+
+        with patch.object(booking_agent, "SESSION_AGENT_MAX_ENTRIES", 2):
+            first = turn("session-1")
+            turn("session-2")
+            turn("session-1")
+            turn("session-3")
+
+            assert "session-2" not in booking_agent._session_agents
+            assert booking_agent.get_session_agent("session-1", factory) is first
+
+    def test_reset_agent_clears_sessions(self) -> None:
+        """reset_agent should also drop cached session agents."""
+        booking_agent.release_session_agent("session-1", MagicMock())
+
+        booking_agent.reset_agent()
+
+        assert booking_agent._session_agents == {}
+
+
+class TestInvokeReleasesSessionAgent:
+    """Tests for the entrypoint handing session agents back to the cache."""
+
+    @staticmethod
+    async def _invoke(stream_async: Any) -> MagicMock:
+        from agent import main
+
+        agent = MagicMock()
+        agent.stream_async = stream_async
+        with (
+            patch.object(main, "SESSION_BUCKET", "sessions"),
+            patch.object(main, "S3SessionManager"),
+            patch.object(main, "create_booking_agent", return_value=agent),
+        ):
+            async for _ in main.invoke({"prompt": "hi", "session_id": "session-1"}):
+                pass
+        return agent
+
+    async def test_completed_turn_releases_agent(self) -> None:
+        """An agent that finished its turn is cached for the next one."""
+
+        async def stream_async(prompt: str) -> AsyncIterator[dict[str, Any]]:
+            yield {"data": "hello"}
+
+        agent = await self._invoke(stream_async)
+
+        assert booking_agent._session_agents["session-1"][1] is agent
+
+    async def test_failed_turn_drops_agent(self) -> None:
+        """An agent whose stream failed mid-turn is not reused."""
+
+        async def stream_async(prompt: str) -> AsyncIterator[dict[str, Any]]:
+            yield {"data": "partial"}
+            raise RuntimeError("model error")
+
+        await self._invoke(stream_async)
+
+        assert "session-1" not in booking_agent._session_agents
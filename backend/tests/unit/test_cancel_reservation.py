@@ -12,10 +12,30 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from shared.models.enums import PaymentStatus, ReservationStatus
 
 
+def _reservation() -> dict[str, Any]:
+    """Confirmed 7-night reservation starting in 30 days."""
+    return {
+        "reservation_id": "RES-2025-ABC12345",
+        "customer_id": "customer-123",
+        "check_in": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
+        "check_out": (datetime.now() + timedelta(days=37)).strftime("%Y-%m-%d"),
+        "nights": 7,
+        "num_adults": 2,
+        "total_amount": 89000,
+        "status": ReservationStatus.CONFIRMED.value,
+        "payment_status": PaymentStatus.COMPLETED.value,
+    }
+
+
+def _customer() -> dict[str, Any]:
+    return {"customer_id": "customer-123", "email": "test@example.com"}
+
+
 class TestCancelReservation:
     """Tests for the cancel_reservation tool."""
 
@@ -303,6 +323,64 @@ class TestCancellationAvailabilityRelease:
             reason="Change of plans",
         )
 
-        # Verify transact_write was called (which includes date release)
-        assert mock_db.transact_write.called
+        # Verify the reservation was updated and its dates released
+        releases = [
+            c.args for c in mock_db.update_item.call_args_list if c.args[0] == "availability"
+        ]
+        assert len(releases) == 7
+        assert all(r[3][":available"] == "available" for r in releases)
         assert result.get("status") == "success" or result.get("success") is True
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_release_failure_still_cancels(
+        self,
+        mock_get_db: MagicMock,
+        mock_tool_context: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failed date release is logged; the committed cancellation still succeeds."""
+        from shared.tools.reservations import cancel_reservation
+
+        def update_item(table: str, *args: Any) -> dict[str, Any]:
+            if table == "availability":
+                raise ClientError(
+                    {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "UpdateItem"
+                )
+            return {"status": ReservationStatus.CANCELLED.value}
+
+        mock_db = MagicMock()
+        mock_db.get_item.return_value = _reservation()
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        mock_db.update_item.side_effect = update_item
+        mock_get_db.return_value = mock_db
+
+        result = await cancel_reservation(
+            reservation_id="RES-2025-ABC12345",
+            tool_context=mock_tool_context,
+        )
+
+        assert result["status"] == "success"
+        assert "could not release dates" in caplog.text
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_changed_dates_give_conflict(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """A stay modified after the read fails the cancel and releases no dates."""
+        from shared.tools.reservations import cancel_reservation
+
+        mock_db = MagicMock()
+        mock_db.get_item.return_value = _reservation()
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        # check_in = :ci AND check_out = :co no longer holds
+        mock_db.update_item.return_value = None
+        mock_get_db.return_value = mock_db
+
+        result = await cancel_reservation(
+            reservation_id="RES-2025-ABC12345",
+            tool_context=mock_tool_context,
+        )
+
+        assert result["success"] is False
+        assert "changed" in result["details"]["reason"]
+        assert [c.args[0] for c in mock_db.update_item.call_args_list] == ["reservations"]
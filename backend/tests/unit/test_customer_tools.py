@@ -0,0 +1,66 @@
+"""Unit tests for the customer verification tools."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _customer() -> dict[str, Any]:
+    return {"customer_id": "customer-123", "email": "guest@example.com", "name": "Guest"}
+
+
+class TestInitiateVerification:
+    """Tests for initiate_verification's returning-customer check."""
+
+    @pytest.mark.parametrize("existing", [True, False])
+    @patch("shared.tools.customer._get_db")
+    def test_reports_returning_customer_as_bool(
+        self, mock_get_db: MagicMock, existing: bool
+    ) -> None:
+        """is_returning_customer is always a bool for the agent to act on."""
+        from shared.tools.customer import initiate_verification
+
+        mock_db = MagicMock()
+        mock_db.query.return_value = [_customer()] if existing else []
+        mock_get_db.return_value = mock_db
+
+        result = initiate_verification(email="guest@example.com")
+
+        assert result["status"] == "success"
+        assert result["is_returning_customer"] is existing
+
+
+class TestVerifyCodeCustomerLookup:
+    """Tests for verify_code resolving the customer initiate_verification found."""
+
+    @patch("shared.tools.customer._get_db")
+    def test_known_customer_updated_by_primary_key(self, mock_get_db: MagicMock) -> None:
+        """A returning customer is verified without a second email-index query."""
+        from shared.tools.customer import initiate_verification, verify_code
+
+        mock_db = MagicMock()
+        mock_db.query.return_value = [_customer()]
+        mock_db.update_item.return_value = _customer()
+        mock_get_db.return_value = mock_db
+
+        initiated = initiate_verification(email="guest@example.com")
+        _, record = mock_db.put_item.call_args.args
+        assert record["customer_id"] == "customer-123"
+        mock_db.get_item.return_value = record
+        mock_db.query.reset_mock()
+
+        result = verify_code(email="guest@example.com", code=initiated["_dev_code"])
+
+        assert result["status"] == "success"
+        assert result["customer_id"] == "customer-123"
+        mock_db.query.assert_not_called()
+        customer_updates = [
+            c for c in mock_db.update_item.call_args_list if c.args[0] == "customers"
+        ]
+        assert len(customer_updates) == 1
+        assert customer_updates[0].args[1] == {"customer_id": "customer-123"}
+        assert (
+            customer_updates[0].kwargs["condition_expression"]
+            == "attribute_exists(customer_id)"
+        )
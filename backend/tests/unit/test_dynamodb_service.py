@@ -0,0 +1,104 @@
+"""Unit tests for DynamoDBService batch and transaction helpers."""
+
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from shared.services import dynamodb
+from shared.services.dynamodb import DynamoDBService
+
+
+def _dates(count: int) -> list[str]:
+    start = date(2025, 1, 1)
+    return [(start + timedelta(days=i)).isoformat() for i in range(count)]
+
+
+@pytest.mark.usefixtures("create_tables")
+class TestBatchGetChunking:
+    """Tests for batch_get splitting keys past the BatchGetItem limit."""
+
+    def test_small_batch_uses_single_request(self) -> None:
+        """Up to 100 keys are fetched with one request."""
+        db = DynamoDBService()
+        dates = _dates(100)
+        db.batch_write("availability", [{"date": d, "status": "available"} for d in dates])
+
+        with patch.object(
+            db._dynamodb, "batch_get_item", wraps=db._dynamodb.batch_get_item
+        ) as batch_get_item:
+            items = db.batch_get("availability", [{"date": d} for d in dates])
+
+        assert len(items) == 100
+        assert batch_get_item.call_count == 1
+
+    def test_large_batch_is_chunked(self) -> None:
+        """More than 100 keys are split into chunks and all items returned."""
+        db = DynamoDBService()
+        dates = _dates(250)
+        db.batch_write("availability", [{"date": d, "status": "available"} for d in dates])
+
+        with patch.object(
+            db._dynamodb, "batch_get_item", wraps=db._dynamodb.batch_get_item
+        ) as batch_get_item:
+            items = db.batch_get("availability", [{"date": d} for d in dates])
+
+        assert sorted(item["date"] for item in items) == dates
+        chunk_sizes = sorted(
+            len(next(iter(c.kwargs["RequestItems"].values()))["Keys"])
+            for c in batch_get_item.call_args_list
+        )
+        assert chunk_sizes == [50, 100, 100]
+
+
+def _cancelled(*codes: str) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": code} for code in codes],
+        },
+        "TransactWriteItems",
+    )
+
+
+class TestTransactWriteRetry:
+    """Tests for transact_write retrying contention-only cancellations."""
+
+    @staticmethod
+    def _service(side_effect: list[Any]) -> DynamoDBService:
+        db = DynamoDBService.__new__(DynamoDBService)
+        db._client = MagicMock()
+        db._client.transact_write_items.side_effect = side_effect
+        return db
+
+    @patch.object(dynamodb.time, "sleep")
+    def test_conflict_is_retried(self, sleep: MagicMock) -> None:
+        """A TransactionConflict cancellation is retried until it succeeds."""
+        db = self._service([_cancelled("None", "TransactionConflict"), None])
+
+        assert db.transact_write([{"Put": {}}, {"Update": {}}]) is True
+        assert db._client.transact_write_items.call_count == 2
+        sleep.assert_called_once()
+
+    @patch.object(dynamodb.time, "sleep")
+    def test_failed_condition_is_not_retried(self, sleep: MagicMock) -> None:
+        """A failed condition is reported immediately with its reasons."""
+        db = self._service([_cancelled("ConditionalCheckFailed", "TransactionConflict")])
+        reasons: list[str] = []
+
+        assert db.transact_write([{"Put": {}}, {"Update": {}}], reasons) is False
+        assert reasons == ["ConditionalCheckFailed", "TransactionConflict"]
+        sleep.assert_not_called()
+
+    @patch.object(dynamodb.time, "sleep")
+    def test_retries_are_bounded(self, sleep: MagicMock) -> None:
+        """Persistent throttling gives up after the attempt limit."""
+        attempts = dynamodb._TRANSACT_MAX_ATTEMPTS
+        db = self._service([_cancelled("ThrottlingError")] * attempts)
+        reasons: list[str] = []
+
+        assert db.transact_write([{"Put": {}}], reasons) is False
+        assert reasons == ["ThrottlingError"]
+        assert sleep.call_count == attempts - 1
@@ -4,6 +4,7 @@ Tests the get_reservation functionality that retrieves
 existing booking details for customers.
 """
 
+import asyncio
 from datetime import date, datetime, timezone
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -11,13 +12,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from shared.models.enums import PaymentStatus, ReservationStatus
+from shared.models.errors import ErrorCode
 
 
 class TestGetReservation:
     """Tests for the get_reservation tool."""
 
     @patch("shared.tools.reservations._get_db")
-    def test_get_reservation_success(self, mock_get_db: MagicMock) -> None:
+    async def test_get_reservation_success(self, mock_get_db: MagicMock) -> None:
         """Should return reservation details successfully."""
         from shared.tools.reservations import get_reservation
 
@@ -40,7 +42,7 @@ class TestGetReservation:
         mock_get_db.return_value = mock_db
 
         # Call the tool
-        result = get_reservation("RES-2025-ABC12345")
+        result = await get_reservation("RES-2025-ABC12345")
 
         # Verify
         assert result["status"] == "success"
@@ -53,7 +55,7 @@ class TestGetReservation:
         assert result["total_amount_eur"] == 890.0
 
     @patch("shared.tools.reservations._get_db")
-    def test_get_reservation_not_found(self, mock_get_db: MagicMock) -> None:
+    async def test_get_reservation_not_found(self, mock_get_db: MagicMock) -> None:
         """Should return error when reservation not found."""
         from shared.tools.reservations import get_reservation
 
@@ -63,7 +65,7 @@ class TestGetReservation:
         mock_get_db.return_value = mock_db
 
         # Call the tool
-        result = get_reservation("RES-2025-INVALID")
+        result = await get_reservation("RES-2025-INVALID")
 
         # Verify - ToolError format uses "success" and "error_code"
         assert result["success"] is False
@@ -71,7 +73,7 @@ class TestGetReservation:
         assert "not found" in result["message"].lower()
 
     @patch("shared.tools.reservations._get_db")
-    def test_get_reservation_includes_payment_status(
+    async def test_get_reservation_includes_payment_status(
         self, mock_get_db: MagicMock
     ) -> None:
         """Should include payment status in response."""
@@ -94,7 +96,7 @@ class TestGetReservation:
         mock_get_db.return_value = mock_db
 
         # Call the tool
-        result = get_reservation("RES-2025-ABC12345")
+        result = await get_reservation("RES-2025-ABC12345")
 
         # Verify
         assert result["status"] == "success"
@@ -102,7 +104,7 @@ class TestGetReservation:
         assert result["reservation_status"] == ReservationStatus.PENDING.value
 
     @patch("shared.tools.reservations._get_db")
-    def test_get_reservation_includes_message(self, mock_get_db: MagicMock) -> None:
+    async def test_get_reservation_includes_message(self, mock_get_db: MagicMock) -> None:
         """Should include helpful message in response."""
         from shared.tools.reservations import get_reservation
 
@@ -123,7 +125,7 @@ class TestGetReservation:
         mock_get_db.return_value = mock_db
 
         # Call the tool
-        result = get_reservation("RES-2025-ABC12345")
+        result = await get_reservation("RES-2025-ABC12345")
 
         # Verify
         assert "message" in result
@@ -135,7 +137,7 @@ class TestGetReservationScenarios:
     """Scenario-based tests for get_reservation."""
 
     @patch("shared.tools.reservations._get_db")
-    def test_customer_checks_upcoming_booking(self, mock_get_db: MagicMock) -> None:
+    async def test_customer_checks_upcoming_booking(self, mock_get_db: MagicMock) -> None:
         """Customer asking 'What's my booking?' should get reservation details."""
         from shared.tools.reservations import get_reservation
 
@@ -155,7 +157,7 @@ class TestGetReservationScenarios:
         }
         mock_get_db.return_value = mock_db
 
-        result = get_reservation("RES-2025-ABC12345")
+        result = await get_reservation("RES-2025-ABC12345")
 
         assert result["status"] == "success"
         assert result["check_in"] == "2025-08-01"
@@ -163,7 +165,7 @@ class TestGetReservationScenarios:
         assert result["num_children"] == 2
 
     @patch("shared.tools.reservations._get_db")
-    def test_customer_checks_pending_payment(self, mock_get_db: MagicMock) -> None:
+    async def test_customer_checks_pending_payment(self, mock_get_db: MagicMock) -> None:
         """Customer with pending payment should see payment reminder."""
         from shared.tools.reservations import get_reservation
 
@@ -182,7 +184,67 @@ class TestGetReservationScenarios:
         }
         mock_get_db.return_value = mock_db
 
-        result = get_reservation("RES-2025-ABC12345")
+        result = await get_reservation("RES-2025-ABC12345")
 
         assert result["status"] == "success"
         assert result["payment_status"] == PaymentStatus.PENDING.value
+
+
+class TestReservationBatching:
+    """Tests for coalescing concurrent get_reservation reads."""
+
+    @staticmethod
+    def _item(reservation_id: str) -> dict[str, Any]:
+        return {
+            "reservation_id": reservation_id,
+            "check_in": "2025-07-15",
+            "check_out": "2025-07-22",
+            "nights": 7,
+            "num_adults": 2,
+            "total_amount": 89000,
+            "status": ReservationStatus.CONFIRMED.value,
+            "payment_status": PaymentStatus.COMPLETED.value,
+            "created_at": "2025-06-01T10:00:00Z",
+        }
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_concurrent_reads_share_one_batch_get(self, mock_get_db: MagicMock) -> None:
+        """Concurrent reads should be served by a single BatchGetItem."""
+        from shared.tools.reservations import get_reservation
+
+        mock_db = MagicMock()
+        mock_db.batch_get.return_value = [self._item("RES-2025-AAAA1111")]
+        mock_get_db.return_value = mock_db
+
+        results = await asyncio.gather(
+            get_reservation("RES-2025-AAAA1111"),
+            get_reservation("RES-2025-AAAA1111"),
+            get_reservation("RES-2025-BBBB2222"),
+        )
+
+        assert [r.get("status") for r in results] == ["success", "success", None]
+        assert results[2]["error_code"] == ErrorCode.RESERVATION_NOT_FOUND.value
+        mock_db.batch_get.assert_called_once()
+        keys = mock_db.batch_get.call_args.args[1]
+        assert sorted(k["reservation_id"] for k in keys) == [
+            "RES-2025-AAAA1111",
+            "RES-2025-BBBB2222",
+        ]
+        mock_db.get_item.assert_not_called()
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_batch_failure_reaches_every_caller(self, mock_get_db: MagicMock) -> None:
+        """A failed batch read should raise in each waiting call."""
+        from shared.tools.reservations import get_reservation
+
+        mock_db = MagicMock()
+        mock_db.batch_get.side_effect = RuntimeError("throttled")
+        mock_get_db.return_value = mock_db
+
+        results = await asyncio.gather(
+            get_reservation("RES-2025-AAAA1111"),
+            get_reservation("RES-2025-BBBB2222"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
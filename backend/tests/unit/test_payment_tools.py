@@ -0,0 +1,321 @@
+"""Unit tests for the payment tools' DynamoDB writes."""
+
+import json
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.dynamodb.types import TypeDeserializer
+
+from shared.models.enums import PaymentStatus, ReservationStatus
+from shared.models.errors import ErrorCode
+
+
+def _reservation() -> dict[str, Any]:
+    return {
+        "reservation_id": "RES-2025-ABCD1234",
+        "total_amount": 41000,
+        "status": ReservationStatus.PENDING.value,
+        "payment_status": PaymentStatus.PENDING.value,
+    }
+
+
+def _mock_db() -> MagicMock:
+    db = MagicMock()
+    db._table_name.side_effect = lambda name: f"booking-test-{name}"
+    db.get_item.return_value = _reservation()
+    return db
+
+
+class TestProcessPaymentTransaction:
+    """Tests for process_payment's single payment transaction."""
+
+    @patch("shared.tools.payments._get_db")
+    def test_payment_and_confirmation_written_together(self, mock_get_db: MagicMock) -> None:
+        """The payment Put and reservation Update share one transaction."""
+        from shared.tools.payments import process_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+
+        result = process_payment(reservation_id="RES-2025-ABCD1234")
+
+        assert result["status"] == "success"
+        assert mock_db.get_item.call_args.kwargs == {"consistent_read": True}
+        mock_db.put_item.assert_not_called()
+        mock_db.update_item.assert_not_called()
+        put, update = mock_db.transact_write.call_args.args[0]
+        assert put["Put"]["TableName"] == "booking-test-payments"
+        assert put["Put"]["Item"]["amount"] == {"N": "41000"}
+        assert put["Put"]["ConditionExpression"] == "attribute_not_exists(payment_id)"
+        assert update["Update"]["Key"] == {"reservation_id": {"S": "RES-2025-ABCD1234"}}
+        assert "payment_status <> :paid" in update["Update"]["ConditionExpression"]
+
+    @patch("shared.tools.payments._get_db")
+    def test_failed_condition_reports_payment_failed(self, mock_get_db: MagicMock) -> None:
+        """A reservation changed under us is reported instead of confirmed."""
+        from shared.tools.payments import process_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = False
+        mock_get_db.return_value = mock_db
+
+        result = process_payment(reservation_id="RES-2025-ABCD1234")
+
+        assert result["error_code"] == ErrorCode.PAYMENT_FAILED.value
+
+    @patch("shared.tools.payments._get_db")
+    def test_concurrent_cancellation_reported_from_old_item(
+        self, mock_get_db: MagicMock
+    ) -> None:
+        """A reservation cancelled after the read is reported as cancelled."""
+        from shared.tools.payments import process_payment
+
+        def transact_write(
+            items: list[dict[str, Any]],
+            cancellation_reasons: list[str],
+            cancelled_items: list[dict[str, Any] | None],
+        ) -> bool:
+            # Reasons and old items line up with the payment Put and reservation Update
+            assert [next(iter(item)) for item in items] == ["Put", "Update"]
+            cancellation_reasons.extend(["None", "ConditionalCheckFailed"])
+            cancelled_items.extend(
+                [None, {**_reservation(), "status": ReservationStatus.CANCELLED.value}]
+            )
+            return False
+
+        mock_db = _mock_db()
+        mock_db.transact_write.side_effect = transact_write
+        mock_get_db.return_value = mock_db
+
+        result = process_payment(reservation_id="RES-2025-ABCD1234")
+
+        assert result["error_code"] == ErrorCode.UNAUTHORIZED.value
+        assert result["details"]["reason"] == "reservation_cancelled"
+
+
+class TestRetryPayment:
+    """Tests for retry_payment delegating to process_payment."""
+
+    @patch("shared.tools.payments._get_db")
+    def test_retry_reads_reservation_once(self, mock_get_db: MagicMock) -> None:
+        """Retrying should not pre-read the reservation before processing."""
+        from shared.tools.payments import retry_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+
+        result = retry_payment(reservation_id="RES-2025-ABCD1234", payment_method="paypal")
+
+        assert result["status"] == "success"
+        assert result["payment_method"] == "paypal"
+        mock_db.get_item.assert_called_once()
+
+
+class TestPaymentStatusCache:
+    """Tests for the short-lived get_payment_status cache."""
+
+    @patch("shared.tools.payments._get_db")
+    def test_repeated_polls_hit_cache(self, mock_get_db: MagicMock) -> None:
+        """Polling within the TTL should read DynamoDB once."""
+        from shared.tools.payments import get_payment_status
+
+        mock_db = _mock_db()
+        mock_db.query.return_value = []
+        mock_get_db.return_value = mock_db
+
+        first = get_payment_status(reservation_id="RES-2025-ABCD1234")
+        second = get_payment_status(reservation_id="RES-2025-ABCD1234")
+
+        assert first == second
+        assert first["payment_status"] == PaymentStatus.PENDING.value
+        mock_db.get_item.assert_called_once()
+
+    @patch("shared.tools.payments._get_db")
+    def test_payment_invalidates_cached_status(self, mock_get_db: MagicMock) -> None:
+        """A successful payment should not be hidden by a cached pending status."""
+        from shared.tools.payments import get_payment_status, process_payment
+
+        mock_db = _mock_db()
+        mock_db.query.return_value = []
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+
+        get_payment_status(reservation_id="RES-2025-ABCD1234")
+        process_payment(reservation_id="RES-2025-ABCD1234")
+        mock_db.get_item.return_value = {
+            **_reservation(),
+            "status": ReservationStatus.CONFIRMED.value,
+            "payment_status": PaymentStatus.PAID.value,
+        }
+        result = get_payment_status(reservation_id="RES-2025-ABCD1234")
+
+        assert result["payment_status"] == PaymentStatus.PAID.value
+
+
+class TestPaymentIdempotency:
+    """Tests for replaying process_payment results on retry."""
+
+    @patch("shared.tools.payments._get_db")
+    def test_result_stored_with_confirmation(self, mock_get_db: MagicMock) -> None:
+        """The reservation Update carries the idempotency record."""
+        from shared.tools.payments import process_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+
+        result = process_payment(reservation_id="RES-2025-ABCD1234")
+
+        _, update = mock_db.transact_write.call_args.args[0]
+        record = update["Update"]["ExpressionAttributeValues"][":idempotency"]["M"]
+        assert record["key"] == {"S": "pay:RES-2025-ABCD1234"}
+        assert json.loads(record["response"]["S"]) == result
+
+    @patch("shared.tools.payments._get_db")
+    def test_retry_replays_stored_result(self, mock_get_db: MagicMock) -> None:
+        """Repeating a completed request returns its result without a new charge."""
+        from shared.tools.payments import process_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+        first = process_payment(reservation_id="RES-2025-ABCD1234")
+        _, update = mock_db.transact_write.call_args.args[0]
+        stored = TypeDeserializer().deserialize(
+            update["Update"]["ExpressionAttributeValues"][":idempotency"]
+        )
+        mock_db.get_item.return_value = {
+            **_reservation(),
+            "status": ReservationStatus.CONFIRMED.value,
+            "payment_status": PaymentStatus.PAID.value,
+            "payment_idempotency": stored,
+        }
+
+        second = process_payment(reservation_id="RES-2025-ABCD1234")
+
+        assert second == first
+        mock_db.transact_write.assert_called_once()
+
+    @patch("shared.tools.payments._get_db")
+    def test_different_request_is_not_replayed(self, mock_get_db: MagicMock) -> None:
+        """A paid reservation rejects a payment with another method."""
+        from shared.tools.payments import process_payment
+
+        mock_db = _mock_db()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+        process_payment(reservation_id="RES-2025-ABCD1234")
+        _, update = mock_db.transact_write.call_args.args[0]
+        mock_db.get_item.return_value = {
+            **_reservation(),
+            "payment_status": PaymentStatus.PAID.value,
+            "payment_idempotency": TypeDeserializer().deserialize(
+                update["Update"]["ExpressionAttributeValues"][":idempotency"]
+            ),
+        }
+
+        result = process_payment(reservation_id="RES-2025-ABCD1234", payment_method="paypal")
+
+        assert result["error_code"] == ErrorCode.PAYMENT_FAILED.value
+        assert result["details"]["reason"] == "already_paid"
+
+    async def test_cancelled_reservation_is_not_replayed(
+        self, create_tables: None, mock_tool_context: MagicMock
+    ) -> None:
+        """Pay, cancel, then retry the same request: the cancellation is reported."""
+        from shared.services.dynamodb import DynamoDBService
+        from shared.tools.payments import process_payment, retry_payment
+        from shared.tools.reservations import cancel_reservation
+
+        db = DynamoDBService()
+        check_in = date.today() + timedelta(days=60)
+        db.put_item(
+            "customers",
+            {
+                "customer_id": "customer-123",
+                "email": "test@example.com",
+                "cognito_sub": "test-cognito-sub-123",
+            },
+        )
+        db.put_item(
+            "reservations",
+            {
+                **_reservation(),
+                "customer_id": "customer-123",
+                "check_in": check_in.isoformat(),
+                "check_out": (check_in + timedelta(days=3)).isoformat(),
+            },
+        )
+
+        with patch("shared.tools.payments._get_db", return_value=db), patch(
+            "shared.tools.reservations._get_db", return_value=db
+        ):
+            assert process_payment(reservation_id="RES-2025-ABCD1234")["status"] == "success"
+            cancelled = await cancel_reservation(
+                reservation_id="RES-2025-ABCD1234", tool_context=mock_tool_context
+            )
+            replayed = process_payment(reservation_id="RES-2025-ABCD1234")
+            retried = retry_payment(reservation_id="RES-2025-ABCD1234")
+
+        assert cancelled["status"] == "success"
+        for result in (replayed, retried):
+            assert result["error_code"] == ErrorCode.UNAUTHORIZED.value
+            assert result["details"]["reason"] == "reservation_cancelled"
+
+
+class TestGetPaymentStatus:
+    """Tests for get_payment_status's payment record lookup."""
+
+    @patch("shared.tools.payments._get_db")
+    def test_unpaid_reservation_skips_payment_query(self, mock_get_db: MagicMock) -> None:
+        """A pending reservation has no payment record to look up."""
+        from shared.tools.payments import get_payment_status
+
+        mock_db = _mock_db()
+        mock_get_db.return_value = mock_db
+
+        result = get_payment_status(reservation_id="RES-2025-ABCD1234")
+
+        assert result["action_required"] == "payment"
+        mock_db.query.assert_not_called()
+
+    @patch("shared.tools.payments._get_db")
+    def test_paid_reservation_reports_completed_payment(self, mock_get_db: MagicMock) -> None:
+        """The completed payment is reported even when a failed attempt exists."""
+        from shared.tools.payments import get_payment_status
+
+        mock_db = _mock_db()
+        mock_db.get_item.return_value = {
+            **_reservation(),
+            "payment_status": PaymentStatus.PAID.value,
+        }
+        mock_db.query.return_value = [
+            {"transaction_id": "TXN-FAILED"},
+            {"transaction_id": "TXN-PAID", "completed_at": "2025-07-01T12:00:00+00:00"},
+        ]
+        mock_get_db.return_value = mock_db
+
+        result = get_payment_status(reservation_id="RES-2025-ABCD1234")
+
+        assert result["transaction_id"] == "TXN-PAID"
+        assert result["paid_at"] == "2025-07-01T12:00:00+00:00"
+
+    @patch("shared.tools.payments._get_db")
+    def test_payment_query_errors_surface(self, mock_get_db: MagicMock) -> None:
+        """A failing payments query is no longer swallowed."""
+        from shared.tools.payments import get_payment_status
+
+        mock_db = _mock_db()
+        mock_db.get_item.return_value = {
+            **_reservation(),
+            "payment_status": PaymentStatus.PAID.value,
+        }
+        mock_db.query.side_effect = RuntimeError("index missing")
+        mock_get_db.return_value = mock_db
+
+        with pytest.raises(RuntimeError):
+            get_payment_status(reservation_id="RES-2025-ABCD1234")
@@ -378,3 +378,24 @@ class TestSeasonTransitions:
         assert result.nightly_rate == 8000
         assert result.season_name == "Low Season"
         assert result.total_amount == 8 * 8000 + 5000  # 8 nights + cleaning
+
+
+class TestCreateSeason:
+    """Tests for PricingService.create_season."""
+
+    @pytest.mark.parametrize(("is_active", "stored"), [(True, "true"), (False, "false")])
+    def test_stores_is_active_as_index_string(
+        self,
+        pricing_service: PricingService,
+        mock_db: MagicMock,
+        sample_seasons: list[Pricing],
+        is_active: bool,
+        stored: str,
+    ) -> None:
+        """is_active keys the active-index GSI, which is typed as a string."""
+        season = sample_seasons[0].model_copy(update={"is_active": is_active})
+
+        pricing_service.create_season(season)
+
+        _, item = mock_db.put_item.call_args.args
+        assert item["is_active"] == stored
@@ -0,0 +1,172 @@
+"""Unit tests for pricing tool helpers.
+
+Tests the in-process season cache and season lookup used by the
+pricing @tool functions.
+"""
+
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.tools import pricing as pricing_tools
+
+
+def _season_item(
+    season_id: str, start: str, end: str, rate: int, minimum_nights: int = 3
+) -> dict[str, Any]:
+    """Build a pricing item as returned by the active-index query."""
+    return {
+        "season_id": season_id,
+        "season_name": season_id.title(),
+        "start_date": start,
+        "end_date": end,
+        "nightly_rate": rate,
+        "minimum_nights": minimum_nights,
+        "cleaning_fee": 5000,
+        "is_active": "true",
+    }
+
+
+@pytest.fixture
+def season_items() -> list[dict[str, Any]]:
+    """Active seasons, deliberately unsorted."""
+    return [
+        _season_item("high", "2025-07-01", "2025-08-31", 15000, 7),
+        _season_item("low", "2025-01-01", "2025-03-31", 8000),
+        _season_item("mid", "2025-04-01", "2025-06-30", 10000, 5),
+    ]
+
+
+@pytest.fixture
+def mock_db(season_items: list[dict[str, Any]]) -> Iterator[MagicMock]:
+    """Patch the pricing tools' DynamoDB accessor with a mock."""
+    db = MagicMock()
+    db.query.return_value = season_items
+    pricing_tools.reset_seasons_cache()
+    with patch.object(pricing_tools, "_get_db", return_value=db):
+        yield db
+    pricing_tools.reset_seasons_cache()
+
+
+class TestSeasonCache:
+    """Tests for the cached _get_all_seasons lookup."""
+
+    @pytest.mark.usefixtures("mock_db")
+    def test_seasons_sorted_by_start_date(self) -> None:
+        """Seasons should be returned in start-date order."""
+        seasons = pricing_tools._get_all_seasons()
+
+        assert [s.season_id for s in seasons] == ["low", "mid", "high"]
+
+    def test_repeated_calls_hit_cache(self, mock_db: MagicMock) -> None:
+        """Only the first call within the TTL should query DynamoDB."""
+        pricing_tools._get_all_seasons()
+        pricing_tools._get_applicable_pricing(date(2025, 7, 10), date(2025, 7, 20))
+        pricing_tools._get_all_seasons()
+
+        assert mock_db.query.call_count == 1
+
+    def test_cache_expires_after_ttl(self, mock_db: MagicMock) -> None:
+        """A stale cache entry should trigger a fresh query."""
+        with patch.object(pricing_tools.time, "monotonic", side_effect=[0.0, 1000.0]):
+            pricing_tools._get_all_seasons()
+            pricing_tools._get_all_seasons()
+
+        assert mock_db.query.call_count == 2
+
+    def test_query_failure_is_cached_briefly(self, mock_db: MagicMock) -> None:
+        """A failed query falls back to no seasons and retries after the error TTL."""
+        mock_db.query.side_effect = RuntimeError("throttled")
+        with patch.object(pricing_tools.time, "monotonic", side_effect=[0.0, 1.0, 10.0]):
+            assert pricing_tools._get_all_seasons() == ()
+            assert pricing_tools._get_all_seasons() == ()
+            pricing_tools._get_all_seasons()
+
+        assert mock_db.query.call_count == 2
+
+
+class TestApplicablePricing:
+    """Tests for _get_applicable_pricing season lookup."""
+
+    @pytest.mark.parametrize(
+        ("check_in", "expected"),
+        [
+            (date(2025, 1, 1), "low"),
+            (date(2025, 3, 31), "low"),
+            (date(2025, 5, 15), "mid"),
+            (date(2025, 8, 31), "high"),
+        ],
+    )
+    @pytest.mark.usefixtures("mock_db")
+    def test_returns_season_containing_check_in(self, check_in: date, expected: str) -> None:
+        """Boundary dates are inclusive on both ends."""
+        pricing = pricing_tools._get_applicable_pricing(check_in, check_in)
+
+        assert pricing is not None
+        assert pricing.season_id == expected
+
+    @pytest.mark.usefixtures("mock_db")
+    def test_returns_none_outside_all_seasons(self) -> None:
+        """Dates after the last season have no applicable pricing."""
+        assert pricing_tools._get_applicable_pricing(date(2025, 10, 1), date(2025, 10, 5)) is None
+
+    @pytest.mark.parametrize(
+        ("check_in", "expected"),
+        [
+            (date(2025, 7, 5), "summer"),
+            (date(2025, 7, 20), "summer"),
+            (date(2025, 8, 10), "late"),
+            (date(2025, 8, 25), "late"),
+        ],
+    )
+    def test_overlapping_seasons_prefer_earliest_start(
+        self, mock_db: MagicMock, check_in: date, expected: str
+    ) -> None:
+        """Shared dates go to the earliest-starting season containing them."""
+        mock_db.query.return_value = [
+            _season_item("summer", "2025-07-01", "2025-07-31", 15000),
+            _season_item("festival", "2025-07-10", "2025-07-20", 20000),
+            _season_item("late", "2025-07-15", "2025-08-31", 12000),
+        ]
+
+        pricing = pricing_tools._get_applicable_pricing(check_in, check_in)
+
+        assert pricing is not None
+        assert pricing.season_id == expected
+
+
+@pytest.mark.usefixtures("mock_db")
+class TestQuoteCache:
+    """Tests for the memoized _compute_quote shared by the pricing tools."""
+
+    def test_quote_totals(self) -> None:
+        """Quote should price the stay with the check-in season's rate."""
+        quote = pricing_tools._compute_quote("2025-07-01", "2025-07-08")
+
+        assert quote.nights == 7
+        assert quote.pricing.season_id == "high"
+        assert quote.subtotal == 7 * 15000
+        assert quote.total == 7 * 15000 + 5000
+
+    def test_chained_tools_reuse_quote(self) -> None:
+        """Chained tool calls for the same dates should share one quote."""
+        first = pricing_tools._compute_quote("2025-07-01", "2025-07-08")
+        second = pricing_tools._compute_quote("2025-07-01", "2025-07-08")
+
+        assert first is second
+
+    def test_season_refresh_invalidates_quotes(self) -> None:
+        """Quotes should not outlive the season list they were built from."""
+        first = pricing_tools._compute_quote("2025-07-01", "2025-07-08")
+        pricing_tools.reset_seasons_cache()
+        second = pricing_tools._compute_quote("2025-07-01", "2025-07-08")
+
+        assert first is not second
+
+    def test_invalid_date_raises(self) -> None:
+        """Malformed dates surface as ValueError for the tools to report."""
+        with pytest.raises(ValueError):
+            pricing_tools._compute_quote("2025-13-01", "2025-07-08")
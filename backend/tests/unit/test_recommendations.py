@@ -7,6 +7,7 @@ discover activities and places based on their interests.
 import pytest
 
 from shared.models import AreaCategory, AreaInfo
+from shared.services.area_data import get_area_data_store
 from shared.tools.area_info import (
     get_recommendations,
     load_area_data_from_dicts,
@@ -246,6 +247,37 @@ class TestGetRecommendations:
         assert result["total_count"] == 2
         # Should find golf courses despite uppercase interest
 
+    def test_matches_mixed_case_place_tags(self) -> None:
+        """Should match place tags stored in mixed case."""
+        set_area_data_store(
+            [
+                AreaInfo(
+                    id="tennis-1",
+                    name="Club de Tenis",
+                    category=AreaCategory.ACTIVITY,
+                    description="Clay courts",
+                    distance_km=2.0,
+                    tags=["Tennis", "Sport"],
+                )
+            ]
+        )
+
+        result = get_recommendations(interests=["tennis"])
+
+        assert [r["id"] for r in result["recommendations"]] == ["tennis-1"]
+
+    def test_recommendations_match_place_dumps(
+        self, sample_area_data: list[dict]
+    ) -> None:
+        """Cached place dicts should match a fresh model_dump()."""
+        load_area_data_from_dicts(sample_area_data)
+        places = {p.id: p for p in get_area_data_store()}
+
+        result = get_recommendations(interests=["golf"])
+
+        for rec in result["recommendations"]:
+            assert rec == places[rec["id"]].model_dump()
+
     def test_matches_category_names_as_interests(
         self, sample_area_data: list[dict]
     ) -> None:
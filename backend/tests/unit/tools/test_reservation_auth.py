@@ -92,6 +92,34 @@ class TestRequiresAccessTokenDecorator:
         assert cognito_sub is None
         assert email is None
 
+    def test_extract_cognito_claims_decodes_each_token_once(self) -> None:
+        """Verify repeat extractions for the same token reuse the decoded claims."""
+        header = {"alg": "none", "typ": "JWT"}
+        payload = {"sub": "user-uuid-cached", "email": "cached@test.com"}
+        header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).decode().rstrip("=")
+        payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+        token = f"{header_b64}.{payload_b64}."
+
+        with patch("shared.utils.jwt._decode_payload_segment", return_value=payload) as mock_decode:
+            assert extract_cognito_claims(token) == ("user-uuid-cached", "cached@test.com")
+            assert extract_cognito_sub(token) == "user-uuid-cached"
+
+        assert mock_decode.call_count == 1
+
+    def test_extract_cognito_claims_does_not_reuse_expired_tokens(self) -> None:
+        """Verify cached claims are dropped once the token's exp has passed."""
+        header = {"alg": "none", "typ": "JWT"}
+        payload = {"sub": "user-uuid-expired", "exp": 1000}
+        header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).decode().rstrip("=")
+        payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+        token = f"{header_b64}.{payload_b64}."
+
+        with patch("shared.utils.jwt._decode_payload_segment", return_value=payload) as mock_decode:
+            extract_cognito_claims(token)
+            extract_cognito_claims(token)
+
+        assert mock_decode.call_count == 2
+
 
 class TestCreateReservationAuthBehavior:
     """Tests for create_reservation tool's token handling."""
@@ -352,7 +380,11 @@ class TestGetMyReservationsAuthBehavior:
         # Verify JWT sub was used to look up customer
         mock_db.get_customer_by_cognito_sub.assert_called_once_with("test-cognito-sub-123")
         # Verify reservations were queried by customer_id (derived from JWT sub)
-        mock_db.get_reservations_by_customer_id.assert_called_once_with("customer-123")
+        mock_db.get_reservations_by_customer_id.assert_called_once_with(
+            "customer-123", limit=21, exclusive_start_key=None
+        )
+        assert result.get("has_more") is False
+        assert "next_page_token" not in result
 
     @patch("shared.tools.reservations._get_db")
     async def test_get_my_reservations_handles_no_customer_record(
@@ -372,6 +404,136 @@ class TestGetMyReservationsAuthBehavior:
         assert result.get("count") == 0
         assert result.get("reservations") == []
 
+    @patch("shared.tools.reservations._get_db")
+    async def test_get_my_reservations_pages_with_token(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """Verify an overfull page reports has_more and the token resumes after it."""
+        from shared.tools.reservations import get_my_reservations
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = {"customer_id": "customer-123"}
+        mock_db.get_reservations_by_customer_id.return_value = [
+            {
+                "reservation_id": f"RES-2025-{i:03d}",
+                "check_in": f"2025-07-{i + 1:02d}",
+                "check_out": f"2025-07-{i + 2:02d}",
+            }
+            for i in range(21)
+        ]
+        mock_get_db.return_value = mock_db
+
+        first = await get_my_reservations(tool_context=mock_tool_context)
+        await get_my_reservations(
+            tool_context=mock_tool_context, page_token=first["next_page_token"]
+        )
+
+        assert first.get("count") == 20
+        assert first.get("has_more") is True
+        assert mock_db.get_reservations_by_customer_id.call_args.kwargs == {
+            "limit": 21,
+            "exclusive_start_key": {
+                "reservation_id": "RES-2025-019",
+                "check_in": "2025-07-20",
+                "customer_id": "customer-123",
+            },
+        }
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_get_my_reservations_exact_page_has_no_more(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """Verify exactly one page of reservations does not promise another."""
+        from shared.tools.reservations import get_my_reservations
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = {"customer_id": "customer-123"}
+        mock_db.get_reservations_by_customer_id.return_value = [
+            {
+                "reservation_id": f"RES-2025-{i:03d}",
+                "check_in": f"2025-07-{i + 1:02d}",
+                "check_out": f"2025-07-{i + 2:02d}",
+            }
+            for i in range(20)
+        ]
+        mock_get_db.return_value = mock_db
+
+        result = await get_my_reservations(tool_context=mock_tool_context)
+
+        assert result.get("count") == 20
+        assert result.get("has_more") is False
+        assert "next_page_token" not in result
+
+    @pytest.mark.parametrize(
+        "page_token", ["not-base64!", base64.urlsafe_b64encode(b"[]").decode()]
+    )
+    @patch("shared.tools.reservations._get_db")
+    async def test_get_my_reservations_rejects_bad_token(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock, page_token: str
+    ) -> None:
+        """Verify a malformed page token is rejected before any query."""
+        from shared.tools.reservations import get_my_reservations
+
+        result = await get_my_reservations(tool_context=mock_tool_context, page_token=page_token)
+
+        assert result.get("status") == "error"
+        mock_get_db.assert_not_called()
+
+    async def test_get_my_reservations_pages_through_shared_check_in(
+        self, dynamodb_client: Any, mock_tool_context: MagicMock
+    ) -> None:
+        """Verify every reservation is reachable when several share the boundary check-in."""
+        from shared.services.dynamodb import DynamoDBService
+        from shared.tools.reservations import get_my_reservations
+
+        dynamodb_client.create_table(
+            TableName="test-booking-reservations",
+            KeySchema=[{"AttributeName": "reservation_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "reservation_id", "AttributeType": "S"},
+                {"AttributeName": "customer_id", "AttributeType": "S"},
+                {"AttributeName": "check_in", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "customer-checkin-index",
+                    "KeySchema": [
+                        {"AttributeName": "customer_id", "KeyType": "HASH"},
+                        {"AttributeName": "check_in", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        db = DynamoDBService()
+        db.get_customer_by_cognito_sub = MagicMock(  # type: ignore[method-assign]
+            return_value={"customer_id": "customer-123"}
+        )
+        # 21 stays, the 20th and 21st newest both checking in on 2027-01-15
+        check_ins = [f"2027-02-{day:02d}" for day in range(19, 0, -1)] + ["2027-01-15"] * 2
+        for i, check_in in enumerate(check_ins):
+            db.put_item(
+                "reservations",
+                {
+                    "reservation_id": f"RES-2027-{i:03d}",
+                    "customer_id": "customer-123",
+                    "check_in": check_in,
+                    "check_out": "2027-03-01",
+                },
+            )
+
+        with patch("shared.tools.reservations._get_db", return_value=db):
+            first = await get_my_reservations(tool_context=mock_tool_context)
+            second = await get_my_reservations(
+                tool_context=mock_tool_context, page_token=first["next_page_token"]
+            )
+
+        seen = [r["reservation_id"] for r in first["reservations"] + second["reservations"]]
+        assert (first["count"], first["has_more"]) == (20, True)
+        assert (second["count"], second["has_more"]) == (1, False)
+        assert sorted(seen) == [f"RES-2027-{i:03d}" for i in range(21)]
+
 
 class TestDecoratorConfiguration:
     """Tests verifying @requires_access_token decorator configuration."""
@@ -420,3 +582,60 @@ class TestDecoratorConfiguration:
 
         # Should not require access_token
         assert "access_token" not in param_names
+
+
+class TestCustomerLookupCache:
+    """Tests for the cognito_sub -> customer cache used by reservation tools."""
+
+    def test_repeat_lookups_hit_cache(self) -> None:
+        """Verify only the first lookup for a sub queries DynamoDB."""
+        from shared.services.customer_cache import get_customer_cached
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = {"customer_id": "customer-123"}
+
+        assert get_customer_cached(mock_db, "sub-1") == {"customer_id": "customer-123"}
+        assert get_customer_cached(mock_db, "sub-1") == {"customer_id": "customer-123"}
+
+        mock_db.get_customer_by_cognito_sub.assert_called_once_with("sub-1")
+
+    def test_missing_customer_is_not_cached(self) -> None:
+        """Verify a profile created after a miss is picked up on the next call."""
+        from shared.services.customer_cache import get_customer_cached
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.side_effect = [None, {"customer_id": "customer-123"}]
+
+        assert get_customer_cached(mock_db, "sub-1") is None
+        assert get_customer_cached(mock_db, "sub-1") == {"customer_id": "customer-123"}
+
+    def test_invalidate_forces_fresh_lookup(self) -> None:
+        """Verify invalidate_customer_cache drops the cached record."""
+        from shared.services.customer_cache import get_customer_cached, invalidate_customer_cache
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = {"customer_id": "customer-123"}
+
+        get_customer_cached(mock_db, "sub-1")
+        invalidate_customer_cache("sub-1")
+        get_customer_cached(mock_db, "sub-1")
+
+        assert mock_db.get_customer_by_cognito_sub.call_count == 2
+
+    def test_customer_update_invalidates_cached_profile(self) -> None:
+        """Verify update_customer_details drops the updated customer's entry."""
+        from shared.services.customer_cache import get_customer_cached
+        from shared.tools.customer import update_customer_details
+
+        customer = {"customer_id": "customer-123", "cognito_sub": "sub-1"}
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = customer
+        mock_db.get_item.return_value = customer
+
+        get_customer_cached(mock_db, "sub-1")
+        with patch("shared.tools.customer._get_db", return_value=mock_db):
+            result = update_customer_details(customer_id="customer-123", name="Jane Doe")
+        get_customer_cached(mock_db, "sub-1")
+
+        assert result["status"] == "success"
+        assert mock_db.get_customer_by_cognito_sub.call_count == 2
@@ -0,0 +1,255 @@
+"""Unit tests for the DynamoDB transactions issued by reservation tools.
+
+Covers how create/modify/cancel build their TransactWriteItems and how
+cancelled transactions are reported back to the agent.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from shared.models.enums import PaymentStatus, ReservationStatus
+from shared.models.errors import ErrorCode
+from shared.models.reservation import Reservation
+
+
+def _customer() -> dict[str, Any]:
+    return {
+        "customer_id": "customer-123",
+        "email": "test@example.com",
+        "cognito_sub": "test-cognito-sub-123",
+    }
+
+
+class TestCreateReservationTransaction:
+    """Tests for create_reservation's single booking transaction."""
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_create_skips_availability_pre_read(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """The transaction's condition checks replace the batch_get pre-check."""
+        from shared.tools.reservations import create_reservation
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        mock_db.transact_write.return_value = True
+        mock_get_db.return_value = mock_db
+
+        result = await create_reservation(
+            check_in="2025-08-01",
+            check_out="2025-08-04",
+            num_adults=2,
+            tool_context=mock_tool_context,
+        )
+
+        assert result["status"] == "success"
+        mock_db.batch_get.assert_not_called()
+        items = mock_db.transact_write.call_args.args[0]
+        assert len(items) == 1 + 3  # reservation + one per night
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_create_reports_dates_from_cancellation_reasons(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """Failed condition checks are mapped back to the conflicting dates."""
+        from shared.tools.reservations import create_reservation
+
+        def transact_write(items: list[dict[str, Any]], cancellation_reasons: list[str]) -> bool:
+            # One reason per item: the reservation Put, then one Put per night
+            assert [item["Put"]["Item"].get("date") for item in items] == [
+                None,
+                {"S": "2025-08-01"},
+                {"S": "2025-08-02"},
+                {"S": "2025-08-03"},
+            ]
+            cancellation_reasons.extend(["None", "None", "ConditionalCheckFailed", "None"])
+            return False
+
+        mock_db = MagicMock()
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        mock_db.transact_write.side_effect = transact_write
+        mock_get_db.return_value = mock_db
+
+        result = await create_reservation(
+            check_in="2025-08-01",
+            check_out="2025-08-04",
+            num_adults=2,
+            tool_context=mock_tool_context,
+        )
+
+        assert result["error_code"] == ErrorCode.DATES_UNAVAILABLE.value
+        assert result["details"] == {"unavailable_dates": "2025-08-02"}
+
+
+class TestChunkedTransactWrite:
+    """Tests for _transact_write_chunked splitting past the item limit."""
+
+    async def test_small_batches_use_single_transaction(self) -> None:
+        """Batches within the limit are written in one call."""
+        from shared.tools.reservations import _transact_write_chunked
+
+        mock_db = MagicMock()
+        mock_db.transact_write.return_value = True
+
+        items = [{"Put": {}}] * 100
+        assert await _transact_write_chunked(mock_db, items, [{"Update": {}}] * 100) is True
+        mock_db.transact_write.assert_called_once_with(items)
+
+    async def test_large_batches_are_chunked(self) -> None:
+        """Batches past the limit are split and every chunk is written."""
+        from shared.tools.reservations import _transact_write_chunked
+
+        mock_db = MagicMock()
+        mock_db.transact_write.return_value = True
+
+        items = [{"Put": {}}] * 250
+        assert await _transact_write_chunked(mock_db, items, [{"Update": {}}] * 250) is True
+        chunk_sizes = sorted(len(c.args[0]) for c in mock_db.transact_write.call_args_list)
+        assert chunk_sizes == [50, 100, 100]
+
+    async def test_failed_chunk_rolls_back_committed_chunks(self) -> None:
+        """When one chunk fails, the chunks that committed are undone."""
+        from shared.tools.reservations import _transact_write_chunked
+
+        items = [{"Put": {"n": i}} for i in range(250)]
+        undo_items = [{"Update": {"n": i}} for i in range(250)]
+
+        def transact_write(chunk: list[dict[str, Any]]) -> bool:
+            # The middle chunk hits a booking conflict
+            return chunk[0] != {"Put": {"n": 100}}
+
+        mock_db = MagicMock()
+        mock_db.transact_write.side_effect = transact_write
+
+        assert await _transact_write_chunked(mock_db, items, undo_items) is False
+        undone = [
+            c.args[0] for c in mock_db.transact_write.call_args_list if "Update" in c.args[0][0]
+        ]
+        assert sorted(undone, key=len) == [undo_items[200:], undo_items[:100]]
+
+
+class TestReservationItem:
+    """Tests for _reservation_to_item AttributeValue conversion."""
+
+    def test_converts_fields_by_type(self) -> None:
+        """Enums and dates become strings, ints become numbers, None is dropped."""
+        from shared.tools.reservations import _reservation_to_item
+
+        now = datetime(2025, 7, 1, 12, 0, tzinfo=UTC)
+        reservation = Reservation(
+            reservation_id="RES-2025-ABCD1234",
+            customer_id="customer-123",
+            check_in=date(2025, 8, 1),
+            check_out=date(2025, 8, 4),
+            num_adults=2,
+            status=ReservationStatus.PENDING,
+            payment_status=PaymentStatus.PENDING,
+            total_amount=41000,
+            cleaning_fee=5000,
+            nightly_rate=12000,
+            nights=3,
+            created_at=now,
+            updated_at=now,
+        )
+
+        item = _reservation_to_item(reservation)
+
+        assert item["check_in"] == {"S": "2025-08-01"}
+        assert item["status"] == {"S": ReservationStatus.PENDING.value}
+        assert item["total_amount"] == {"N": "41000"}
+        assert item["num_children"] == {"N": "0"}
+        assert item["created_at"] == {"S": now.isoformat()}
+        assert "special_requests" not in item
+        assert "cancelled_at" not in item
+
+
+class TestRangeDifference:
+    """Tests for _range_difference_iso used by modify_reservation."""
+
+    def test_shifted_stay(self) -> None:
+        """Shifting a stay releases the leading nights and books the trailing ones."""
+        from shared.tools.reservations import _range_difference_iso
+
+        current = (date(2025, 7, 15), date(2025, 7, 18))
+        new = (date(2025, 7, 16), date(2025, 7, 20))
+
+        assert _range_difference_iso(*current, *new) == ["2025-07-15"]
+        assert _range_difference_iso(*new, *current) == ["2025-07-18", "2025-07-19"]
+
+    def test_disjoint_stays(self) -> None:
+        """Non-overlapping stays release and book every night."""
+        from shared.tools.reservations import _range_difference_iso
+
+        assert _range_difference_iso(
+            date(2025, 7, 1), date(2025, 7, 3), date(2025, 8, 1), date(2025, 8, 2)
+        ) == ["2025-07-01", "2025-07-02"]
+
+
+class TestCancelReservationWrites:
+    """Tests for cancel_reservation's update-then-release writes."""
+
+    @staticmethod
+    def _reservation(nights: int) -> dict[str, Any]:
+        check_in = date.today() + timedelta(days=60)
+        return {
+            "reservation_id": "RES-2025-ABCD1234",
+            "customer_id": "customer-123",
+            "check_in": check_in.isoformat(),
+            "check_out": (check_in + timedelta(days=nights)).isoformat(),
+            "total_amount": 100000,
+            "status": ReservationStatus.CONFIRMED.value,
+        }
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_dates_released_after_conditional_update(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """The reservation is cancelled conditionally, then each night is released."""
+        from shared.tools.reservations import cancel_reservation
+
+        reservation = self._reservation(150)
+        mock_db = MagicMock()
+        mock_db.get_item.return_value = reservation
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        mock_get_db.return_value = mock_db
+
+        result = await cancel_reservation(
+            reservation_id="RES-2025-ABCD1234",
+            tool_context=mock_tool_context,
+        )
+
+        assert result["status"] == "success"
+        cancel, *releases = mock_db.update_item.call_args_list
+        assert cancel.args[0] == "reservations"
+        assert cancel.args[-1] == "#s <> :cancelled AND check_in = :ci AND check_out = :co"
+        assert cancel.args[3][":ci"] == reservation["check_in"]
+        assert cancel.args[3][":co"] == reservation["check_out"]
+        assert len(releases) == 150
+        for release in releases:
+            assert release.args[0] == "availability"
+            assert release.args[-1] == "reservation_id = :rid"
+            assert release.args[3][":rid"] == "RES-2025-ABCD1234"
+        mock_db.batch_write.assert_not_called()
+        mock_db.transact_write.assert_not_called()
+
+    @patch("shared.tools.reservations._get_db")
+    async def test_concurrent_cancellation_does_not_release(
+        self, mock_get_db: MagicMock, mock_tool_context: MagicMock
+    ) -> None:
+        """A failed update condition leaves the dates untouched."""
+        from shared.tools.reservations import cancel_reservation
+
+        mock_db = MagicMock()
+        mock_db.get_item.return_value = self._reservation(3)
+        mock_db.get_customer_by_cognito_sub.return_value = _customer()
+        mock_db.update_item.return_value = None
+        mock_get_db.return_value = mock_db
+
+        result = await cancel_reservation(
+            reservation_id="RES-2025-ABCD1234",
+            tool_context=mock_tool_context,
+        )
+
+        assert result["error_code"] == ErrorCode.UNAUTHORIZED.value
+        mock_db.update_item.assert_called_once()
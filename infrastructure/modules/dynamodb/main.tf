@@ -146,7 +146,19 @@ module "pricing" {
   billing_mode = "PAY_PER_REQUEST"
 
   attributes = [
-    { name = "season_id", type = "S" }
+    { name = "season_id", type = "S" },
+    { name = "is_active", type = "S" },
+    { name = "start_date", type = "S" }
+  ]
+
+  # GSI for active seasons ordered by start_date (is_active stored as "true")
+  global_secondary_indexes = [
+    {
+      name            = "active-index"
+      hash_key        = "is_active"
+      range_key       = "start_date"
+      projection_type = "ALL"
+    }
   ]
 
   tags = module.label.tags